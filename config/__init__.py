@@ -2,10 +2,10 @@
 DOR Framework Configuration Module
 """
 
-from .assets import ASSETS, AssetConfig, AssetClass, get_asset, list_assets
+from .assets import ASSETS, AssetConfig, AssetClass, get_asset, list_assets, list_futures_assets
 from .timeframes import TIMEFRAMES, TimeframeConfig, TimeframeCode, get_timeframe, list_timeframes
 
 __all__ = [
-    'ASSETS', 'AssetConfig', 'AssetClass', 'get_asset', 'list_assets',
+    'ASSETS', 'AssetConfig', 'AssetClass', 'get_asset', 'list_assets', 'list_futures_assets',
     'TIMEFRAMES', 'TimeframeConfig', 'TimeframeCode', 'get_timeframe', 'list_timeframes'
 ]
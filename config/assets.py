@@ -148,3 +148,8 @@ def get_asset(asset_key: str) -> AssetConfig:
 def list_assets() -> List[str]:
     """List all available asset keys."""
     return list(ASSETS.keys())
+
+
+def list_futures_assets() -> List[str]:
+    """List asset keys traded as futures contracts (Yahoo '=F' symbols, incl. GC)."""
+    return [k for k, a in ASSETS.items() if a.yahoo_symbol.endswith('=F')]
@@ -7,6 +7,7 @@ from scipy import stats
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 from src.data.data_loader import download_asset_data
+from src.signals import get_breach_index, breach_events
 
 def analyze_daily_extreme_to_weekly_close(asset_key, start_date='2015-01-01', end_date='2025-12-31'):
     print(f"\n{'='*95}")
@@ -18,40 +19,16 @@ def analyze_daily_extreme_to_weekly_close(asset_key, start_date='2015-01-01', en
     df = download_asset_data(asset_key, start_date=start_date, end_date=end_date)
     if df.empty: return
 
-    # 2. Daily O2C and Week Identifiers
-    df['o2c_daily'] = (df['close'] - df['open']) / df['open']
-    df['weekday'] = df.index.day_name()
-    df['year_week'] = df.index.to_period('W')
-    
-    # Calculate Weekly O2C
-    weekly_data = []
-    for name, group in df.groupby('year_week'):
-        if len(group) < 2: continue
-        w_open = group['open'].iloc[0]
-        w_close = group['close'].iloc[-1]
-        w_o2c = (w_close - w_open) / w_open
-        
-        # Mark if any day in this week had a 2-sigma move
-        std_daily = df['o2c_daily'].std()
-        mean_daily = df['o2c_daily'].mean()
-        upper_2s = mean_daily + (2.0 * std_daily)
-        lower_2s = mean_daily - (2.0 * std_daily)
-        
-        # Check for specific day triggers
-        for _, day_row in group.iterrows():
-            trigger = None
-            if day_row['o2c_daily'] > upper_2s: trigger = 'DRIVE_2S'
-            elif day_row['o2c_daily'] < lower_2s: trigger = 'PANIC_2S'
-            
-            if trigger:
-                weekly_data.append({
-                    'week': name,
-                    'trigger_day': day_row['weekday'],
-                    'trigger_type': trigger,
-                    'weekly_o2c': w_o2c
-                })
-
-    results_df = pd.DataFrame(weekly_data)
+    # 2. 2-sigma trigger days (weeks with at least 2 sessions) from the breach index
+    index = get_breach_index(df, asset_key)
+    index = index[index['week_days'] >= 2]
+    triggers = [
+        breach_events(index, k=2.0, side='upper').assign(trigger_type='DRIVE_2S'),
+        breach_events(index, k=2.0, side='lower').assign(trigger_type='PANIC_2S'),
+    ]
+    results_df = pd.concat(triggers).sort_index().rename(
+        columns={'weekday_name': 'trigger_day', 'week_o2c': 'weekly_o2c'}
+    )[['trigger_day', 'trigger_type', 'weekly_o2c']]
     if results_df.empty:
         print("No se encontraron eventos 2-sigma.")
         return
@@ -7,6 +7,7 @@ from scipy import stats
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 from src.data.data_loader import download_asset_data
+from src.signals import get_breach_index, weekly_breaches
 
 def analyze_volatility_contagion(asset_key, start_date='2015-01-01', end_date='2025-12-31'):
     print(f"\n{'='*95}")
@@ -18,35 +19,15 @@ def analyze_volatility_contagion(asset_key, start_date='2015-01-01', end_date='2
     df = download_asset_data(asset_key, start_date=start_date, end_date=end_date)
     if df.empty: return
 
-    # 2. Daily Metrics
-    df['o2c_daily'] = (df['close'] - df['open']) / df['open']
-    std_daily = df['o2c_daily'].std()
-    df['year_week'] = df.index.to_period('W')
-    
-    # 3. Weekly Metrics
-    weekly_stats = []
-    for name, group in df.groupby('year_week'):
-        if len(group) < 2: continue
-        w_open = group['open'].iloc[0]
-        w_close = group['close'].iloc[-1]
-        w_o2c = (w_close - w_open) / w_open
-        
-        # Check if any day in the week breached 1-sigma daily (absolute)
-        daily_breach = group['o2c_daily'].abs().max() > std_daily
-        
-        # Check if daily breach was BULL or BEAR
-        bull_breach = group['o2c_daily'].max() > std_daily
-        bear_breach = group['o2c_daily'].min() < -std_daily
-        
-        weekly_stats.append({
-            'year_week': name,
-            'w_o2c': w_o2c,
-            'has_daily_breach': daily_breach,
-            'bull_daily_breach': bull_breach,
-            'bear_daily_breach': bear_breach
-        })
-
-    weekly_df = pd.DataFrame(weekly_stats)
+    # 2. Daily Metrics (breach index) and 3. Weekly roll-up of +/-1 sigma days around zero
+    index = get_breach_index(df, asset_key)
+    std_daily = index.attrs['std']
+    weeks = weekly_breaches(index, k=1.0, center=False, min_days=2)
+    weekly_df = pd.DataFrame({
+        'w_o2c': weeks['week_o2c'],
+        'bull_daily_breach': weeks['upper_breach'],
+        'bear_daily_breach': weeks['lower_breach'],
+    })
     std_weekly = weekly_df['w_o2c'].std()
     
     # Thresholds
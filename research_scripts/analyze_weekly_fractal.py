@@ -1,5 +1,6 @@
 import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_weekly_events
 import numpy as np
 
 def analyze_weekly_d1d2_fractal(asset_key):
@@ -11,76 +12,18 @@ def analyze_weekly_d1d2_fractal(asset_key):
     data = loader.download(asset_key, start_date='2000-01-01')
     if data.empty: return
 
-    # Calendar Helpers
-    data['year'] = data.index.year
-    data['week_of_year'] = data.index.isocalendar().week
-    data['day_of_week'] = data.index.dayofweek # 0=Mon, 4=Fri
-    
-    # Identify unique weeks (Year, WeekNum)
-    # Note on year boundary: ISO week 52/53 can span years, but pandas groupby handles it if we group by date or smart grouping.
-    # Simple approach: Group by Isocalendar Year and Week
-    data['iso_year'] = data.index.isocalendar().year
-    weekly_groups = data.groupby(['iso_year', 'week_of_year'])
-    
-    results = []
-    
-    print(f"Processing weekly data...")
-    
-    for (year, week), week_data in weekly_groups:
-        # We need at least 2 trading days to define D1-D2 range
-        if len(week_data) < 2: continue
-            
-        # Get D1 and D2 (Trading Days 1 and 2 of the week)
-        # Note: D1 might be Tuesday if Monday was holiday. We take first 2 rows.
-        d1_data = week_data.iloc[0]
-        d2_data = week_data.iloc[1]
-        
-        # Calculate D1-D2 Range
-        d1_d2_high = max(d1_data['high'], d2_data['high'])
-        d1_d2_low = min(d1_data['low'], d2_data['low'])
-        rng = d1_d2_high - d1_d2_low
-        
-        if rng == 0: continue
-            
-        midpoint = d1_d2_low + (rng * 0.5)
-        d2_close = d2_data['close']
-        
-        # Signals AT CLOSE OF D2
-        is_bull_signal = d2_close > midpoint
-        
-        # Outcomes based on REST OF WEEK (D3-D5)
-        # If week only had 2 days, no outcome possible
-        if len(week_data) <= 2: continue
-            
-        rest_of_week = week_data.iloc[2:] # D3 onwards
-        
-        # Outcome 1: Weekly Close relative to Week Open (Mon Open)
-        # Or relative to D2 Close?
-        # User asked: "Green Week" vs "Red Week" usually implies Friday Close > Monday Open
-        week_open = week_data.iloc[0]['open']
-        week_close = week_data.iloc[-1]['close']
-        is_green_week = week_close > week_open
-        weekly_return = (week_close / week_open) - 1
-        
-        # Outcome 2: New Extremes in D3-D5
-        # Did we break the D1-D2 High/Low?
-        rest_high = rest_of_week['high'].max()
-        rest_low = rest_of_week['low'].min()
-        
-        made_new_high = rest_high > d1_d2_high
-        made_new_low = rest_low < d1_d2_low
-        
-        results.append({
-            'year': year,
-            'week': week,
-            'is_bull_signal': is_bull_signal,
-            'is_green_week': is_green_week,
-            'weekly_return': weekly_return,
-            'made_new_high': made_new_high,
-            'made_new_low': made_new_low
-        })
-        
-    df = pd.DataFrame(results)
+    # One pass over all ISO weeks; outcomes need at least one day after D2
+    events = build_weekly_events(data, asset_key)
+    events = events[events['n_days'] > 2]
+    df = pd.DataFrame({
+        'year': events['iso_year'],
+        'week': events['iso_week'],
+        'is_bull_signal': events['d2_signal'] == 'BULL',
+        'is_green_week': events['green_week'],
+        'weekly_return': events['week_ret'],
+        'made_new_high': events['d2_new_high'],
+        'made_new_low': events['d2_new_low'],
+    }).reset_index(drop=True)
     
     if df.empty:
         print("No valid weeks found.")
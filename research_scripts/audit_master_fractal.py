@@ -1,5 +1,5 @@
-import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_w2_events
 import numpy as np
 
 def audit_monthly_w2_signal_exact(asset_key):
@@ -14,80 +14,8 @@ def audit_monthly_w2_signal_exact(asset_key):
     data = loader.download(asset_key, start_date='2000-01-01')
     if data.empty: return
 
-    data['year'] = data.index.year
-    data['month'] = data.index.month
-    data['week_of_year'] = data.index.isocalendar().week
-    
-    # Agrupar por Mes Real (Year-Month)
-    monthly_groups = data.groupby(['year', 'month'])
-    
-    results = []
-    
-    for (year, month), month_data in monthly_groups:
-        # Obtener semanas unicas en orden cronologico
-        # Usamos drop_duplicates para preservar orden de aparicion en el index
-        weeks = month_data['week_of_year'].drop_duplicates().tolist()
-        
-        # Necesitamos al menos 2 semanas completas para tener W1 y W2
-        if len(weeks) < 2: continue
-        
-        w1_idx = weeks[0]
-        w2_idx = weeks[1]
-        
-        w1_data = month_data[month_data['week_of_year'] == w1_idx]
-        w2_data = month_data[month_data['week_of_year'] == w2_idx]
-        
-        if w1_data.empty or w2_data.empty: continue
-        
-        # Calcular el momento exacto donde termina W2 para separar "Antes" y "Despues"
-        w2_end_time = w2_data.index.max()
-        
-        # Datos PRE-SIGNAL (Todo lo que paso hasta el cierre de W2)
-        pre_signal_data = month_data[month_data.index <= w2_end_time]
-        
-        # Calcular Rango W1-W2 (Maximo y Minimo acumulado hasta el cierre de W2)
-        range_high = pre_signal_data['high'].max()
-        range_low = pre_signal_data['low'].min()
-        rng = range_high - range_low
-        
-        if rng == 0: continue
-            
-        midpoint = range_low + (rng * 0.5)
-        w2_close = w2_data.iloc[-1]['close'] # Precio de cierre de la segunda semana
-        
-        # Determinar Senal (Fractal)
-        signal_type = 'BULL' if w2_close > midpoint else 'BEAR'
-        
-        # Datos POST-SIGNAL (Lo que paso el resto del mes)
-        post_signal_data = month_data[month_data.index > w2_end_time]
-        
-        # Outcomes Defaults
-        made_new_high = False
-        made_new_low = False
-        
-        if not post_signal_data.empty:
-            rest_high = post_signal_data['high'].max()
-            rest_low = post_signal_data['low'].min()
-            
-            # Extension: Si hizo un maximo mas alto que el rango W1-W2
-            made_new_high = rest_high > range_high
-            # Extension: Si hizo un minimo mas bajo que el rango W1-W2
-            made_new_low = rest_low < range_low
-            
-        # Outcome Cierre Mensual
-        m_open = month_data.iloc[0]['open']
-        m_close = month_data.iloc[-1]['close']
-        is_green_month = m_close > m_open
-        
-        results.append({
-            'month': month,
-            'signal': signal_type,
-            'green_month': is_green_month,
-            'new_high': made_new_high,
-            'new_low': made_new_low
-        })
-        
-    df = pd.DataFrame(results)
+    # One grouped pass: W1-W2 range, W2 close signal and rest-of-month outcomes
+    df = build_w2_events(data, asset_key)
     
     # Imprimir Tabla Resumen por Mes
     months = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
@@ -1,5 +1,5 @@
-import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_w2_events
 import numpy as np
 import sys
 
@@ -40,58 +40,8 @@ def audit_monthly_w2_signal_exact(asset_key, asset_name):
         print(f"No data for {symbol}")
         return
 
-    data['year'] = data.index.year
-    data['month'] = data.index.month
-    data['week_of_year'] = data.index.isocalendar().week
-    
-    monthly_groups = data.groupby(['year', 'month'])
-    results = []
-    
-    for (year, month), month_data in monthly_groups:
-        weeks = month_data['week_of_year'].drop_duplicates().tolist()
-        if len(weeks) < 2: continue
-        
-        w1_idx, w2_idx = weeks[0], weeks[1]
-        w1_data = month_data[month_data['week_of_year'] == w1_idx]
-        w2_data = month_data[month_data['week_of_year'] == w2_idx]
-        
-        if w1_data.empty or w2_data.empty: continue
-        
-        w2_end_time = w2_data.index.max()
-        pre_signal_data = month_data[month_data.index <= w2_end_time]
-        
-        range_high = pre_signal_data['high'].max()
-        range_low = pre_signal_data['low'].min()
-        rng = range_high - range_low
-        if rng == 0: continue
-            
-        midpoint = range_low + (rng * 0.5)
-        w2_close = w2_data.iloc[-1]['close']
-        signal_type = 'BULL' if w2_close > midpoint else 'BEAR'
-        
-        post_signal_data = month_data[month_data.index > w2_end_time]
-        made_new_high = False
-        made_new_low = False
-        
-        if not post_signal_data.empty:
-            rest_high = post_signal_data['high'].max()
-            rest_low = post_signal_data['low'].min()
-            made_new_high = rest_high > range_high
-            made_new_low = rest_low < range_low
-            
-        m_open = month_data.iloc[0]['open']
-        m_close = month_data.iloc[-1]['close']
-        is_green_month = m_close > m_open
-        
-        results.append({
-            'month': month,
-            'signal': signal_type,
-            'green_month': is_green_month,
-            'new_high': made_new_high,
-            'new_low': made_new_low
-        })
-        
-    df = pd.DataFrame(results)
+    # One grouped pass: W1-W2 range, W2 close signal and rest-of-month outcomes
+    df = build_w2_events(data, asset_key)
     months = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
     
     print(f"{'MES':<5} | {'SENAL':<5} | {'SAMPLES':<7} | {'PROB GREEN':<12} | {'PROB RED':<10} | {'PROB NEW HI':<12} | {'PROB NEW LO':<12}")
@@ -1,5 +1,6 @@
-import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_w2_events
+from src.inference import grouped_bootstrap
 import numpy as np
 
 def audit_monthly_w2_signal_exact(asset_key, asset_name):
@@ -25,72 +26,15 @@ def audit_monthly_w2_signal_exact(asset_key, asset_name):
         print(f"No data for {asset_key}")
         return
 
-    data['year'] = data.index.year
-    data['month'] = data.index.month
-    data['week_of_year'] = data.index.isocalendar().week
-    
-    monthly_groups = data.groupby(['year', 'month'])
-    results = []
-    
-    for (year, month), month_data in monthly_groups:
-        weeks = month_data['week_of_year'].drop_duplicates().tolist()
-        if len(weeks) < 2: continue
-        
-        # W1 is usually weeks[0], W2 is weeks[1]
-        # Edge case: Year transition (Week 52 -> Week 1) is handled by groupby year/month
-        # But wait, December has weeks 48, 49.. 52. January has 1, 2...
-        # If a week spans across months, it is assigned to the month of the index? 
-        # Yes, groupby uses index.month. 
-        # But 'week_of_year' might be 52 for Jan 1st if it belongs to previous ISO year.
-        # This is fine, we just need the first two chronological weeks in this month's data.
-        
-        w1_idx = weeks[0]
-        w2_idx = weeks[1]
-        
-        w1_data = month_data[month_data['week_of_year'] == w1_idx]
-        w2_data = month_data[month_data['week_of_year'] == w2_idx]
-        
-        if w1_data.empty or w2_data.empty: continue
-        
-        w2_end_time = w2_data.index.max()
-        pre_signal_data = month_data[month_data.index <= w2_end_time]
-        
-        range_high = pre_signal_data['high'].max()
-        range_low = pre_signal_data['low'].min()
-        rng = range_high - range_low
-        if rng == 0: continue
-            
-        midpoint = range_low + (rng * 0.5)
-        w2_close = w2_data.iloc[-1]['close']
-        signal_type = 'BULL' if w2_close > midpoint else 'BEAR'
-        
-        post_signal_data = month_data[month_data.index > w2_end_time]
-        made_new_high = False
-        made_new_low = False
-        
-        if not post_signal_data.empty:
-            rest_high = post_signal_data['high'].max()
-            rest_low = post_signal_data['low'].min()
-            made_new_high = rest_high > range_high
-            made_new_low = rest_low < range_low
-            
-        m_open = month_data.iloc[0]['open']
-        m_close = month_data.iloc[-1]['close']
-        is_green_month = m_close > m_open
-        
-        results.append({
-            'month': month,
-            'signal': signal_type,
-            'green_month': is_green_month,
-            'new_high': made_new_high,
-            'new_low': made_new_low
-        })
-        
-    df = pd.DataFrame(results)
+    # One grouped pass: W1-W2 range, W2 close signal and rest-of-month outcomes
+    df = build_w2_events(data, asset_key)
     months = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
     
-    print(f"{'MES':<5} | {'SENAL':<5} | {'SAMPLES':<7} | {'PROB GREEN':<12} | {'PROB RED':<10} | {'PROB NEW HI':<12} | {'PROB NEW LO':<12}")
-    print("-" * 90)
+    # Percentile bootstrap CI of every (month, signal) cell (small samples: 10-25 months)
+    ci = grouped_bootstrap(df, ['month', 'signal'], 'green_month', n_boot=5000, seed=0)
+    
+    print(f"{'MES':<5} | {'SENAL':<5} | {'SAMPLES':<7} | {'PROB GREEN':<12} | {'PROB RED':<10} | {'PROB NEW HI':<12} | {'PROB NEW LO':<12} | {'IC95 DIR':<13}")
+    print("-" * 106)
     
     for i, m_name in enumerate(months):
         m = i + 1
@@ -102,9 +46,10 @@ def audit_monthly_w2_signal_exact(asset_key, asset_name):
             p_green = (bull['green_month'].sum() / n_bull) * 100
             p_high = (bull['new_high'].sum() / n_bull) * 100
             p_low_fail = (bull['new_low'].sum() / n_bull) * 100 
-            print(f"{m_name:<5} | {'BULL':<5} | {n_bull:<7} | {p_green:9.1f}%   | {(100-p_green):9.1f}% | {p_high:9.1f}%   | {p_low_fail:9.1f}%")
+            lo, hi = ci.loc[(m, 'BULL'), ['boot_low', 'boot_high']] * 100
+            print(f"{m_name:<5} | {'BULL':<5} | {n_bull:<7} | {p_green:9.1f}%   | {(100-p_green):9.1f}% | {p_high:9.1f}%   | {p_low_fail:9.1f}%   | {lo:5.1f}-{hi:5.1f}%")
         else:
-            print(f"{m_name:<5} | {'BULL':<5} | {'0':<7} | {'N/A':<12} | {'N/A':<10} | {'N/A':<12} | {'N/A':<12}")
+            print(f"{m_name:<5} | {'BULL':<5} | {'0':<7} | {'N/A':<12} | {'N/A':<10} | {'N/A':<12} | {'N/A':<12} | {'N/A':<13}")
 
         bear = m_df[m_df['signal'] == 'BEAR']
         n_bear = len(bear)
@@ -112,11 +57,13 @@ def audit_monthly_w2_signal_exact(asset_key, asset_name):
             p_red = ((n_bear - bear['green_month'].sum()) / n_bear) * 100
             p_low = (bear['new_low'].sum() / n_bear) * 100
             p_high_fail = (bear['new_high'].sum() / n_bear) * 100
-            print(f"{'     ':<5} | {'BEAR':<5} | {n_bear:<7} | {(100-p_red):9.1f}%   | {p_red:9.1f}% | {p_high_fail:9.1f}%   | {p_low:9.1f}%")
-            print("-" * 90)
+            # Red probability = 1 - green: the interval flips
+            g_lo, g_hi = ci.loc[(m, 'BEAR'), ['boot_low', 'boot_high']] * 100
+            print(f"{'     ':<5} | {'BEAR':<5} | {n_bear:<7} | {(100-p_red):9.1f}%   | {p_red:9.1f}% | {p_high_fail:9.1f}%   | {p_low:9.1f}%   | {100-g_hi:5.1f}-{100-g_lo:5.1f}%")
+            print("-" * 106)
         else:
-             print(f"{'     ':<5} | {'BEAR':<5} | {'0':<7} | {'N/A':<12} | {'N/A':<10} | {'N/A':<12} | {'N/A':<12}")
-             print("-" * 90)
+             print(f"{'     ':<5} | {'BEAR':<5} | {'0':<7} | {'N/A':<12} | {'N/A':<10} | {'N/A':<12} | {'N/A':<12} | {'N/A':<13}")
+             print("-" * 106)
 
 if __name__ == "__main__":
     audit_monthly_w2_signal_exact('ES', 'S&P 500')
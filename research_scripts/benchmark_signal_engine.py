@@ -0,0 +1,93 @@
+"""
+Signal Engine Benchmark
+Per-update cost of the incremental SignalEngine vs a full rebuild.
+
+For every daily bar of the history the layers are computed four ways:
+  - push:     one new bar, then layers()                       (incremental path)
+  - revise:   the same bar again with a new close               (intraday revision)
+  - rebuild:  load() + layers() of the trailing 60-day frame    (cold calc_layers request)
+  - kernel:   layers_from_arrays() on the 60-day arrays with a precomputed calendar
+and the incremental layers are checked against both stateless paths (parity).
+"""
+import sys
+sys.path.insert(0, '.')
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.data.calendar_index import calendar_arrays
+from src.data.data_loader import download_asset_data
+from src.engine.signal_engine import SignalEngine, layers_from_arrays
+from src.signals.base import ohlc_arrays
+
+WINDOW = 60
+# Thursday: D3 + alpha + bias + D+1 layers all live
+NOW_UTC = datetime(2026, 1, 8, 15, tzinfo=timezone.utc)
+
+
+def _summary(name, seconds):
+    us = np.asarray(seconds) * 1e6
+    print(f"  {name:<8} mean {us.mean():8.1f} us   p50 {np.percentile(us, 50):8.1f} us   "
+          f"p99 {np.percentile(us, 99):8.1f} us   max {us.max():8.1f} us")
+
+
+def benchmark_asset(asset_key, years_back=5):
+    df = download_asset_data(asset_key, years_back=years_back)
+    arrays = ohlc_arrays(df)
+    calendar = calendar_arrays(df.index)
+    dates = df.index
+    print(f"\n{asset_key}: {len(df)} daily bars ({dates[0].date()} -> {dates[-1].date()})")
+
+    engine = SignalEngine()
+    push, revise, rebuild, kernel = [], [], [], []
+    mismatches = 0
+
+    for i in range(len(df)):
+        o, h, l, c = arrays['open'][i], arrays['high'][i], arrays['low'][i], arrays['close'][i]
+
+        t0 = time.perf_counter()
+        engine.push(asset_key, dates[i], o, h, l, c * 1.001)
+        engine.layers(asset_key, NOW_UTC)
+        t1 = time.perf_counter()
+        engine.push(asset_key, dates[i], o, h, l, c)
+        layers = engine.layers(asset_key, NOW_UTC)
+        t2 = time.perf_counter()
+        push.append(t1 - t0)
+        revise.append(t2 - t1)
+
+        if i + 1 < WINDOW:
+            continue
+        t0 = time.perf_counter()
+        reference = SignalEngine()
+        reference.load(asset_key, df.iloc[i + 1 - WINDOW:i + 1])
+        expected = reference.layers(asset_key, NOW_UTC)
+        rebuild.append(time.perf_counter() - t0)
+        mismatches += layers != expected
+
+        window = slice(i + 1 - WINDOW, i + 1)
+        cal = {k: v[window] for k, v in calendar.items()}
+        t0 = time.perf_counter()
+        expected = layers_from_arrays(asset_key, dates[window], arrays['open'][window], arrays['high'][window],
+                                      arrays['low'][window], arrays['close'][window], cal, NOW_UTC)
+        kernel.append(time.perf_counter() - t0)
+        mismatches += layers != expected
+
+    _summary('push', push)
+    _summary('revise', revise)
+    _summary('rebuild', rebuild)
+    _summary('kernel', kernel)
+    print(f"  push speedup vs rebuild {np.mean(rebuild) / np.mean(push):.0f}x   "
+          f"mismatches vs rebuild / kernel: {mismatches}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='SignalEngine update benchmark')
+    parser.add_argument('--assets', '-a', nargs='+', default=['NQ', 'ES', 'YM', 'GC'], help='Asset keys')
+    parser.add_argument('--years', '-y', type=int, default=5, help='Years of daily history (default: 5)')
+    args = parser.parse_args()
+
+    total = sum(benchmark_asset(asset_key, args.years) for asset_key in args.assets)
+    sys.exit(1 if total else 0)
@@ -4,6 +4,7 @@ import numpy as np
 import os
 from scipy import stats
 from src.data.data_loader import DataLoader
+from src.signals import build_weekly_events
 
 # VISUAL STYLE GUIDE (Strict Adherence)
 BG_COLOR = '#000000'
@@ -33,51 +34,16 @@ def export_weekly_fractal_table_styled(asset_key):
     data = loader.download(asset_key, start_date='2000-01-01')
     if data.empty: return
 
-    data['iso_year'] = data.index.isocalendar().year
-    data['week_of_year'] = data.index.isocalendar().week
-    
-    weekly_groups = data.groupby(['iso_year', 'week_of_year'])
-    results = []
-    
-    for (year, week), week_data in weekly_groups:
-        if len(week_data) < 2: continue
-        d1_data = week_data.iloc[0]
-        d2_data = week_data.iloc[1]
-        
-        signal_month = d2_data.name.month 
-        
-        d1_d2_high = max(d1_data['high'], d2_data['high'])
-        d1_d2_low = min(d1_data['low'], d2_data['low'])
-        rng = d1_d2_high - d1_d2_low
-        if rng == 0: continue
-            
-        midpoint = d1_d2_low + (rng * 0.5)
-        d2_close = d2_data['close']
-        
-        is_bull_signal = d2_close > midpoint
-        
-        if len(week_data) <= 2: continue
-            
-        rest_of_week = week_data.iloc[2:]
-        rest_high = rest_of_week['high'].max()
-        rest_low = rest_of_week['low'].min()
-        
-        made_new_high = rest_high > d1_d2_high
-        made_new_low = rest_low < d1_d2_low
-        
-        week_open = week_data.iloc[0]['open']
-        week_close = week_data.iloc[-1]['close']
-        is_green_week = week_close > week_open
-        
-        results.append({
-            'month': signal_month,
-            'is_bull_signal': is_bull_signal,
-            'made_new_high': made_new_high,
-            'made_new_low': made_new_low,
-            'is_green_week': is_green_week
-        })
-        
-    df = pd.DataFrame(results)
+    # One pass over all ISO weeks; the signal month is D2's month
+    events = build_weekly_events(data, asset_key)
+    events = events[events['n_days'] > 2]
+    df = pd.DataFrame({
+        'month': events['d2_month'],
+        'is_bull_signal': events['d2_signal'] == 'BULL',
+        'made_new_high': events['d2_new_high'],
+        'made_new_low': events['d2_new_low'],
+        'is_green_week': events['green_week'],
+    }).reset_index(drop=True)
     month_names = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
     
     # Table Data
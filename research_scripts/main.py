@@ -25,7 +25,7 @@ from config.assets import get_asset, list_assets, ASSETS
 from config.timeframes import get_timeframe, list_timeframes, TIMEFRAMES
 from src.data.data_loader import DataLoader, download_asset_data
 from src.returns.returns_calculator import ReturnsCalculator
-from src.distributions.distribution_analyzer import DistributionAnalyzer
+from src.distributions.distribution_analyzer import DistributionAnalyzer, warm_distribution_cache
 from src.volatility.volatility_calculator import VolatilityCalculator
 from src.reports.report_generator import ReportGenerator
 from src.visualization.visualizer import DORVisualizer
@@ -83,6 +83,9 @@ def run_full_analysis(
     
     periods_map = {'1D': 252, '1W': 52, '1M': 12, '1Q': 4, '6M': 2, '1Y': 1}
     
+    # Normality tests of every timeframe in a process pool (memoized for the loop below)
+    warm_distribution_cache(returns_by_tf.values(), fits=False)
+    
     for tf, returns in returns_by_tf.items():
         periods = periods_map.get(tf, 252)
         analyzer = DistributionAnalyzer(returns, periods_per_year=periods)
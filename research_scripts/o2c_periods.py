@@ -9,11 +9,12 @@ import sys
 sys.path.insert(0, '.')
 from src.data.data_loader import download_asset_data
 from src.returns.returns_calculator import ReturnsCalculator
+from src.distributions.tables import bin_edges, bin_counts, sigma_band_counts
+from src.distributions.prefix_moments import get_prefix_moments
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-from scipy import stats as scipy_stats
 from pathlib import Path
 from datetime import datetime
 
@@ -78,29 +79,24 @@ def analyze_period(asset_key, start, end, timeframe='daily'):
 def build_distribution_table(o2c, timeframe='daily'):
     """Build frequency distribution table."""
     cfg = BIN_CONFIG[timeframe]
-    bin_size = cfg['size']
-    bin_min = cfg['min']
-    bin_max = cfg['max']
-    edges = np.arange(bin_min, bin_max + bin_size, bin_size)
-    # Clean floating point: round to avoid 0.0050000000000001 issues
-    edges = np.round(edges, 10)
+    edges = bin_edges(cfg['size'], cfg['min'], cfg['max'])
+    # One searchsorted/bincount pass: every bin plus the trailing "y mayor" bin
+    counts = bin_counts(o2c, edges)
     rows = []
 
     for i in range(len(edges)):
         if i == 0:
-            mask = o2c <= edges[i]
             intervalo = f"{edges[i]*100:.2f}%"
             clase = f"{edges[i]*100:.2f}%"
             rango = f"Menor de {edges[i]*100:.1f}%"
         else:
             lo = edges[i - 1]
             hi = edges[i]
-            mask = (o2c > lo) & (o2c <= hi)
             intervalo = f"{hi*100:.2f}%"
             clase = f"{hi*100:.2f}%"
             rango = f"{lo*100:.1f} hasta {hi*100:.1f}%"
 
-        freq = mask.sum()
+        freq = counts[i]
         prob = freq / len(o2c) * 100
         rows.append({
             'Intervalo': intervalo,
@@ -111,8 +107,7 @@ def build_distribution_table(o2c, timeframe='daily'):
         })
 
     # "y mayor" row
-    mask_mayor = o2c > bin_max
-    freq_mayor = mask_mayor.sum()
+    freq_mayor = counts[-1]
     prob_mayor = freq_mayor / len(o2c) * 100
     rows.append({
         'Intervalo': 'y mayor...',
@@ -148,17 +143,11 @@ def build_stats(o2c):
 
 def build_sigma_table(o2c):
     """Build sigma table with count, %, and Gaussian comparison."""
-    mean = o2c.mean()
-    std = o2c.std()
+    bands = sigma_band_counts(o2c, SIGMAS, mean=o2c.mean(), std=o2c.std())
     rows = []
 
-    for sig in SIGMAS:
-        superior = mean + sig * std
-        inferior = mean - sig * std
-        count = ((o2c >= inferior) & (o2c <= superior)).sum()
-        pct = count / len(o2c) * 100
-        gauss_pct = (scipy_stats.norm.cdf(sig) - scipy_stats.norm.cdf(-sig)) * 100
-
+    for sig, superior, inferior, count, pct, gauss_pct in zip(
+            SIGMAS, bands['upper'], bands['lower'], bands['count'], bands['pct'], bands['gauss_pct']):
         rows.append({
             'Desviacion estandar': sig,
             'Superior': f"{superior*100:.3f}%",
@@ -327,6 +316,34 @@ def generate_chart(o2c, label, asset_key, output_dir, timeframe='daily'):
     return filename
 
 
+def print_stability_grid(asset_key, timeframe='daily'):
+    """Print mean / std / sigma thresholds for every start year x end year window."""
+    start = min(p[0] for p in PERIODS)
+    end = max(p[1] for p in PERIODS)
+    # One download over the widest span; every window is an O(1) prefix-moment query
+    o2c = analyze_period(asset_key, start, end, timeframe)
+    store = get_prefix_moments(o2c, asset_key, timeframe)
+    years = sorted(set(o2c.index.year))
+    tf_label = TIMEFRAME_LABELS[timeframe]
+
+    for stat, title in [('mean', 'MEDIA'), ('std', 'DESVIACION ESTANDAR')]:
+        grid = store.stability_grid(years, years, stat) * 100
+        print()
+        print(f"  {asset_key} - {tf_label}  |  {title} (%) POR ANO INICIO x ANO FIN")
+        print(f"{'Inicio':>7}  " + "  ".join(f"{y:>6}" for y in years))
+        for y0, row in grid.iterrows():
+            cells = "  ".join(" " * 6 if np.isnan(v) else f"{v:6.3f}" for v in row.values)
+            print(f"{y0:>7}  {cells}")
+
+    print()
+    print(f"  Umbrales sigma por ano inicio (hasta {years[-1]})")
+    print(f"{'Inicio':>7}  {'-2s':>8}  {'-1s':>8}  {'+1s':>8}  {'+2s':>8}")
+    for y0 in years:
+        thr = store.sigma_thresholds(f'{y0}-01-01', None, [1, 2])
+        print(f"{y0:>7}  {thr.loc[2, 'lower']*100:7.3f}%  {thr.loc[1, 'lower']*100:7.3f}%  "
+              f"{thr.loc[1, 'upper']*100:7.3f}%  {thr.loc[2, 'upper']*100:7.3f}%")
+
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description='DOR - Standard Multi-Period O2C Analysis')
@@ -335,11 +352,17 @@ if __name__ == "__main__":
                         choices=['daily', 'weekly', 'monthly'],
                         help='Timeframe: daily or weekly (default: daily)')
     parser.add_argument('--output', '-o', type=str, default='./output/charts', help='Output directory')
+    parser.add_argument('--sweep', action='store_true',
+                        help='Print the start year x end year stability grid instead of the period reports')
     args = parser.parse_args()
 
     asset_key = args.asset
     timeframe = args.timeframe
 
+    if args.sweep:
+        print_stability_grid(asset_key, timeframe)
+        sys.exit(0)
+
     for start, end, label in PERIODS:
         print(f"\n{'='*60}")
         print(f"Processing {asset_key} ({timeframe}) - {label}...")
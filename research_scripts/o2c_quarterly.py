@@ -12,11 +12,11 @@ import sys
 sys.path.insert(0, '.')
 from src.data.data_loader import download_asset_data
 from src.returns.returns_calculator import ReturnsCalculator
+from src.distributions.tables import bin_edges, bin_counts, sigma_band_counts
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-from scipy import stats as scipy_stats
 from pathlib import Path
 from datetime import datetime
 
@@ -74,28 +74,24 @@ def filter_by_quarter(o2c, quarter_key):
 def build_distribution_table(o2c):
     """Build frequency distribution table for monthly returns."""
     cfg = BIN_CONFIG
-    bin_size = cfg['size']
-    bin_min = cfg['min']
-    bin_max = cfg['max']
-    edges = np.arange(bin_min, bin_max + bin_size, bin_size)
-    edges = np.round(edges, 10)
+    edges = bin_edges(cfg['size'], cfg['min'], cfg['max'])
+    # One searchsorted/bincount pass: every bin plus the trailing "y mayor" bin
+    counts = bin_counts(o2c, edges)
     rows = []
 
     for i in range(len(edges)):
         if i == 0:
-            mask = o2c <= edges[i]
             intervalo = f"{edges[i]*100:.2f}%"
             clase = f"{edges[i]*100:.2f}%"
             rango = f"Menor de {edges[i]*100:.1f}%"
         else:
             lo = edges[i - 1]
             hi = edges[i]
-            mask = (o2c > lo) & (o2c <= hi)
             intervalo = f"{hi*100:.2f}%"
             clase = f"{hi*100:.2f}%"
             rango = f"{lo*100:.1f} hasta {hi*100:.1f}%"
 
-        freq = mask.sum()
+        freq = counts[i]
         prob = freq / len(o2c) * 100
         rows.append({
             'Intervalo': intervalo,
@@ -106,8 +102,7 @@ def build_distribution_table(o2c):
         })
 
     # "y mayor" row
-    mask_mayor = o2c > bin_max
-    freq_mayor = mask_mayor.sum()
+    freq_mayor = counts[-1]
     prob_mayor = freq_mayor / len(o2c) * 100
     rows.append({
         'Intervalo': 'y mayor...',
@@ -143,17 +138,11 @@ def build_stats(o2c):
 
 def build_sigma_table(o2c):
     """Build sigma table with count, %, and Gaussian comparison."""
-    mean = o2c.mean()
-    std = o2c.std()
+    bands = sigma_band_counts(o2c, SIGMAS, mean=o2c.mean(), std=o2c.std())
     rows = []
 
-    for sig in SIGMAS:
-        superior = mean + sig * std
-        inferior = mean - sig * std
-        count = ((o2c >= inferior) & (o2c <= superior)).sum()
-        pct = count / len(o2c) * 100
-        gauss_pct = (scipy_stats.norm.cdf(sig) - scipy_stats.norm.cdf(-sig)) * 100
-
+    for sig, superior, inferior, count, pct, gauss_pct in zip(
+            SIGMAS, bands['upper'], bands['lower'], bands['count'], bands['pct'], bands['gauss_pct']):
         rows.append({
             'Desviacion estandar': sig,
             'Superior': f"{superior*100:.3f}%",
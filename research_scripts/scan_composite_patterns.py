@@ -0,0 +1,65 @@
+import pandas as pd
+from src.data.data_loader import DataLoader
+from src.signals import build_weekly_events
+from src.inference import pattern_search_multi, condition_grid
+
+# Weekly fractal building blocks; every pair / triple of these is tested.
+# Only facts known by the D3 close belong here: d2_new_high/d2_new_low (and the
+# d3_new_* / d45_* columns) use the Thu-Fri bars and are outcomes, not conditions.
+CONDITIONS = {
+    'D2 BULL': "d2_signal == 'BULL'",
+    'D2 BEAR': "d2_signal == 'BEAR'",
+    'D2 >75%': 'd2_pos > 0.75',
+    'D2 <25%': 'd2_pos < 0.25',
+    'D3 BULL': "d3_signal == 'BULL'",
+    'D3 BEAR': "d3_signal == 'BEAR'",
+    'D3 BREAKS D1-D2 HIGH': 'd3_broke_high',
+    'D3 BREAKS D1-D2 LOW': 'd3_broke_low',
+    **condition_grid('d2_month', range(1, 13), name='MONTH'),
+}
+
+
+def scan_composite_patterns(max_order=2, min_n=30, top=25):
+    print(f"\n{'='*120}")
+    print(f"COMPOSITE PATTERN SCAN: {len(CONDITIONS)} WEEKLY CONDITIONS, UP TO {max_order} COMBINED")
+    print(f"{'='*120}")
+
+    loader = DataLoader()
+    assets = ['NQ', 'ES', 'DJI', 'GC']
+    universe = loader.download_many(assets, start_date='2000-01-01')
+
+    # D3 conditions need the rest of the week to be resolved
+    tables = {}
+    for asset in assets:
+        data = universe.get(asset)
+        if data is None or data.empty: continue
+        events = build_weekly_events(data, asset)
+        tables[asset] = events[events['n_days'] > 3].reset_index(drop=True)
+
+    results = pattern_search_multi(
+        tables, CONDITIONS, 'green_week', max_order=max_order, min_n=min_n, null=0.5
+    )
+    if results.empty:
+        print("No patterns with enough samples.")
+        return results
+
+    print(f"Patterns tested: {len(results)} (q-values over all assets and patterns)")
+    print(f"\n{'Asset':<6} | {'Pattern':<45} | {'N':<5} | {'Prob Green':<10} | {'T-Stat':<7} | {'Q (FDR)':<8}")
+    print(f"{'-'*6}-|-{'-'*45}-|-{'-'*5}-|-{'-'*10}-|-{'-'*7}-|-{'-'*8}")
+
+    # Strongest edges in either direction (far from 50%)
+    results['edge'] = (results['hit_rate'] - 0.5).abs()
+    best = results[results['q_fdr'] < 0.05].sort_values('edge', ascending=False).head(top)
+    for _, row in best.iterrows():
+        print(f"{row['asset']:<6} | {row['pattern']:<45} | {row['n']:<5} | {row['hit_rate']*100:7.1f}%   | {row['t_stat']:7.2f} | {row['q_fdr']:.4f}")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Scan composite weekly fractal patterns")
+    parser.add_argument('--order', type=int, default=2, choices=[1, 2, 3],
+                        help="Max number of conditions combined")
+    parser.add_argument('--min-n', type=int, default=30, help="Minimum weeks per pattern")
+    args = parser.parse_args()
+    scan_composite_patterns(max_order=args.order, min_n=args.min_n)
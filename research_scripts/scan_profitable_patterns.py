@@ -1,8 +1,10 @@
 import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_w2_events
+from src.inference import permutation_test
 import numpy as np
 
-def find_profitable_patterns():
+def find_profitable_patterns(n_permutations=0):
     print(f"\n{'='*120}")
     print(f"SEARCHING FOR HIGH PROBABILITY PROFIT PATTERNS (>80% WIN RATE & >3% RETURN)")
     print(f"{'='*120}")
@@ -10,64 +12,25 @@ def find_profitable_patterns():
     loader = DataLoader()
     assets = ['NQ', 'ES', 'DJI', 'GC']
     patterns = []
+    universe = loader.download_many(assets, start_date='2000-01-01')
+    scanned = []
     
     for asset in assets:
         print(f"Scanning {asset}...")
-        data = loader.download(asset, start_date='2000-01-01')
-        if data.empty: continue
+        data = universe.get(asset)
+        if data is None or data.empty: continue
 
-        data['year'] = data.index.year
-        data['month'] = data.index.month
-        data['week_of_year'] = data.index.isocalendar().week
-        
-        weekly_groups = data.groupby(['year', 'month'])
-        results = []
-        
-        for (year, month), month_data in weekly_groups:
-            # Drop duplicates to handle year-end week overlap correctly
-            weeks = month_data['week_of_year'].drop_duplicates().tolist()
-            if len(weeks) < 2: continue
-                
-            w1_data = month_data[month_data['week_of_year'] == weeks[0]]
-            w2_data = month_data[month_data['week_of_year'] == weeks[1]]
-            
-            if w1_data.empty or w2_data.empty: continue
-
-            w1_w2_high = max(w1_data['high'].max(), w2_data['high'].max())
-            w1_w2_low = min(w1_data['low'].min(), w2_data['low'].min())
-            rng = w1_w2_high - w1_w2_low
-            if rng == 0: continue
-                
-            midpoint = w1_w2_low + (rng * 0.5)
-            w2_close = w2_data.iloc[-1]['close']
-            
-            # Outcome
-            m_open = month_data.iloc[0]['open']
-            m_close = month_data.iloc[-1]['close']
-            ret = (m_close / m_open) - 1
-            
-            # New Exts
-            w2_end_time = w2_data.index.max()
-            post_w2_data = month_data[month_data.index > w2_end_time]
-            
-            made_new_high = False
-            made_new_low = False
-            
-            if not post_w2_data.empty:
-                rest_high = post_w2_data['high'].max()
-                rest_low = post_w2_data['low'].min()
-                made_new_high = rest_high > w1_w2_high
-                made_new_low = rest_low < w1_w2_low
-
-            results.append({
-                'month': month,
-                'is_bull_signal': w2_close > midpoint,
-                'return': ret,
-                'made_new_high': made_new_high,
-                'made_new_low': made_new_low
-            })
-            
-        df = pd.DataFrame(results)
+        # W2 signal and month outcome for every month in one pass
+        events = build_w2_events(data, asset)
+        df = pd.DataFrame({
+            'asset': asset,
+            'month': events['month'],
+            'is_bull_signal': events['signal'] == 'BULL',
+            'return': events['month_o2c'],
+            'made_new_high': events['new_high'],
+            'made_new_low': events['new_low'],
+        })
+        scanned.append(df)
         
         # Analyze Monthly Performance
         for m in range(1, 13):
@@ -131,5 +94,40 @@ def find_profitable_patterns():
         ext_prob = row['New High Prob'] if row['Action'] == 'LONG' else row['New Low Prob']
         print(f"{row['Asset']:<6} | {m_name:<5} | {row['Signal']:<12} | {row['Action']:<6} | {row['Win Rate']:5.1f}%     | {row['Avg Return']:6.2f}%      | {ext_prob:5.1f}%")
 
+    if n_permutations > 0 and not patterns_df.empty:
+        report_pattern_significance(pd.concat(scanned, ignore_index=True), patterns_df, n_permutations)
+
+
+def report_pattern_significance(events, patterns_df, n_permutations):
+    """
+    Permutation test of every scanned (asset, month, direction) cell.
+
+    Month returns are shuffled within each asset; the family is every cell
+    the scan looked at, not only the survivors.
+    """
+    events = events.assign(
+        signal=np.where(events['is_bull_signal'], 'BULL (>50%)', 'BEAR (<50%)'),
+        win_long=(events['return'] > 0).astype(float),
+        win_short=(events['return'] < 0).astype(float),
+    )
+    cells = permutation_test(
+        events, ['asset', 'month', 'signal'],
+        outcome={'BULL (>50%)': 'win_long', 'BEAR (<50%)': 'win_short'},
+        side='signal', strata='asset', n_perm=n_permutations, seed=42
+    )
+    month_names = {1:'JAN', 2:'FEB', 3:'MAR', 4:'APR', 5:'MAY', 6:'JUN', 7:'JUL', 8:'AUG', 9:'SEP', 10:'OCT', 11:'NOV', 12:'DEC'}
+    
+    print(f"\nPERMUTATION TEST ({n_permutations} shuffles per asset, {len(cells)} cells scanned)")
+    print(f"{'Asset':<6} | {'Month':<5} | {'Signal':<12} | {'Win Rate':<10} | {'P (raw)':<8} | {'P (FWER)':<8} | {'Q (FDR)':<8}")
+    print(f"{'-'*6}-|-{'-'*5}-|-{'-'*12}-|-{'-'*10}-|-{'-'*8}-|-{'-'*8}-|-{'-'*8}")
+    for _, row in patterns_df.iterrows():
+        cell = cells.loc[(row['Asset'], row['Month'], row['Signal'])]
+        print(f"{row['Asset']:<6} | {month_names[row['Month']]:<5} | {row['Signal']:<12} | {cell['stat']*100:5.1f}%     | {cell['p_raw']:.4f}   | {cell['p_fwer']:.4f}   | {cell['q_fdr']:.4f}")
+
 if __name__ == "__main__":
-    find_profitable_patterns()
+    import argparse
+    parser = argparse.ArgumentParser(description="Scan W2 monthly patterns")
+    parser.add_argument('--permutations', type=int, default=0,
+                        help="Permutation-test the surviving patterns with N shuffles (e.g. 10000)")
+    args = parser.parse_args()
+    find_profitable_patterns(n_permutations=args.permutations)
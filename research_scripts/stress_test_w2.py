@@ -1,5 +1,7 @@
 import pandas as pd
 from src.data.data_loader import DataLoader
+from src.signals import build_w2_events
+from src.inference import walk_forward
 import numpy as np
 
 def stress_test_w2_signal(asset_key):
@@ -11,47 +13,17 @@ def stress_test_w2_signal(asset_key):
     data = loader.download(asset_key, start_date='2000-01-01')
     if data.empty: return
 
-    data['year'] = data.index.year
-    data['month'] = data.index.month
-    data['week_of_year'] = data.index.isocalendar().week
-    
-    weekly_groups = data.groupby(['year', 'month'])
-    
-    results = []
-    
-    for (year, month), month_data in weekly_groups:
-        weeks = sorted(month_data['week_of_year'].unique())
-        if len(weeks) < 2: continue
-            
-        w1_data = month_data[month_data['week_of_year'] == weeks[0]]
-        w2_data = month_data[month_data['week_of_year'] == weeks[1]]
-        
-        if w1_data.empty or w2_data.empty: continue
-
-        w1_w2_high = max(w1_data['high'].max(), w2_data['high'].max())
-        w1_w2_low = min(w1_data['low'].min(), w2_data['low'].min())
-        w1_w2_range = w1_w2_high - w1_w2_low
-        if w1_w2_range == 0: continue
-            
-        midpoint = w1_w2_low + (w1_w2_range * 0.5)
-        w2_close = w2_data.iloc[-1]['close']
-        
-        # Determine Signal State
-        is_below_50 = w2_close < midpoint
-        
-        # Monthly Outcome
-        month_return = (month_data.iloc[-1]['close'] / month_data.iloc[0]['open']) - 1
-        is_month_red = month_return < 0
-        
-        results.append({
-            'year': year,
-            'month': month,
-            'is_below_50': is_below_50,
-            'month_return': month_return,
-            'is_month_red': is_month_red
-        })
-        
-    df = pd.DataFrame(results)
+    # W1-W2 range and monthly outcome per month (W1/W2 = first two ISO week numbers)
+    events = build_w2_events(data, asset_key, week_order='sorted')
+    rng = events['range_high'] - events['range_low']
+    df = pd.DataFrame({
+        'year': events['year'],
+        'month': events['month'],
+        'w2_end': events['w2_end'],
+        'is_below_50': events['w2_close'] < events['range_low'] + rng * 0.5,
+        'month_return': events['month_o2c'],
+    })
+    df['is_month_red'] = df['month_return'] < 0
     
     # ------------------------------------------------------------------
     # TEST 1: CONSISTENCY OVER TIME (Are results degrading?)
@@ -110,7 +82,31 @@ def stress_test_w2_signal(asset_key):
     
     print(f"   Bull Signal Win Rate: {bull_win_rate:.1f}%")
     print(f"   Avg Return: {bull_signal['month_return'].mean()*100:.2f}%")
-    
+
+    # ------------------------------------------------------------------
+    # TEST 4: WALK-FORWARD (What would the table have said at the time?)
+    # ------------------------------------------------------------------
+    print(f"\n4. WALK-FORWARD TEST (Bear win rate known BEFORE each signal vs realized)")
+
+    # Point-in-time estimates: only months whose W2 ended earlier are used
+    expanding = walk_forward(df, 'is_below_50', 'is_month_red', 'w2_end', min_periods=10)
+    rolling = walk_forward(df, 'is_below_50', 'is_month_red', 'w2_end', window=36, min_periods=10)
+    df['pit_expanding'] = expanding['is_month_red_prob']
+    df['pit_rolling'] = rolling['is_month_red_prob']
+
+    print(f"   Period | Sample | Expanding | Last 36 | Realized")
+    print(f"   -------|--------|-----------|---------|---------")
+
+    for p in periods:
+        period_data = df[(df['period'] == p) & (df['is_below_50'])]
+        known = period_data.dropna(subset=['pit_expanding'])
+        if known.empty: continue
+
+        realized = known['is_month_red'].mean() * 100
+        exp_prob = known['pit_expanding'].mean() * 100
+        roll_prob = known['pit_rolling'].mean() * 100
+        print(f"   {p}-{p+4} |   {len(known):2d}   |   {exp_prob:4.1f}%   |  {roll_prob:4.1f}%  |  {realized:4.1f}%")
+
     # ------------------------------------------------------------------
     # FINAL VERDICT
     # ------------------------------------------------------------------
@@ -2,63 +2,92 @@ import sys
 import os
 import json
 import time
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 from src.engine.alpha_brain import AlphaBrain
+from src.data.hourly_archiver import HourlyArchiver
+from src.data.providers import get_provider
+from src.data.live_session import LiveSession, load_sessions, save_sessions
 
-def fetch_live_data():
-    """Fetches near real-time data for NQ, ES, and YM from Yahoo Finance."""
-    assets = {
-        'NQ': 'NQ=F',
-        'ES': 'ES=F',
-        'YM': 'YM=F'
+# Live monitor universe: asset key -> Yahoo symbol
+LIVE_ASSETS = {
+    'NQ': 'NQ=F',
+    'ES': 'ES=F',
+    'YM': 'YM=F'
+}
+
+# Warm-restart snapshot of the intraday session states
+SESSION_SNAPSHOT = Path(__file__).parent / "output" / "live_data" / "live_sessions.json"
+
+# Trading days in the weekly view (yfinance period='5d' on daily bars)
+WEEKLY_VIEW_DAYS = 5
+
+
+def fetch_asset_snapshot(provider, symbol, session=None):
+    """
+    Fetches one asset: a 3-month daily history plus the intraday bars since the last cycle.
+
+    The weekly view is the tail of the daily history. The LiveSession only
+    requests bars newer than its last update; without one, today's 1m bars
+    are fetched in full. The daily history's last bar is the fallback when no
+    intraday bars are available.
+    """
+    daily = provider.history(symbol, period='3mo', interval='1d')
+    session = session or LiveSession(symbol)
+    session.refresh(provider)
+
+    if not session.empty:
+        price = session.last
+        open_price = session.open # Open of the session
+    elif not daily.empty:
+        # Fallback to the last daily bar
+        price = daily['Close'].iloc[-1]
+        open_price = daily['Open'].iloc[-1]
+    else:
+        raise ValueError(f"No data for {symbol}")
+
+    return {
+        'price': round(float(price), 2),
+        'live_o2c': (price - open_price) / open_price,
+        'monthly_history': daily if not daily.empty else None,
+        'weekly_history': daily.iloc[-WEEKLY_VIEW_DAYS:] if not daily.empty else None
     }
-    
+
+
+def fetch_live_data(provider=None, assets=None, timeout=20.0, max_workers=8, sessions=None):
+    """
+    Fetches near real-time data for NQ, ES, and YM from the market data provider (Yahoo by default).
+
+    All assets are fetched concurrently through a bounded thread pool, so a
+    cycle costs about one round trip instead of one per asset and layer. Each
+    asset has its own deadline (`timeout` seconds from the start of the cycle);
+    an asset that misses it or fails is reported and left out of this cycle.
+    Pass the same `sessions` dict (asset key -> LiveSession) every cycle so
+    intraday bars are fetched incrementally.
+    """
+    provider = provider or get_provider()
+    assets = assets or LIVE_ASSETS
+    sessions = sessions if sessions is not None else {}
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(assets))))
+    futures = {key: pool.submit(fetch_asset_snapshot, provider, symbol, sessions.get(key)) for key, symbol in assets.items()}
+    deadline = time.monotonic() + timeout
+
     results = {}
-    for key, symbol in assets.items():
+    for key, future in futures.items():
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # --- MONTHLY LAYER (Fetch 3 Months) ---
-            monthly_data = ticker.history(period='3mo', interval='1d')
-            if not monthly_data.empty:
-                monthly_history = monthly_data
-            else:
-                monthly_history = None
-            
-            # --- WEEKLY LAYER (Fetch 5 Days) ---
-            weekly_data = ticker.history(period='5d', interval='1d')
-            if not weekly_data.empty:
-                weekly_history = weekly_data
-            else:
-                weekly_history = None
-
-            # --- DAILY LIVE LAYER (1D Fetch) ---
-            data_1d = ticker.history(period='1d', interval='1m')
-            if not data_1d.empty:
-                 price = data_1d['Close'].iloc[-1]
-                 open_price = data_1d['Open'].iloc[0] # Open of the session
-                 o2c = (price - open_price) / open_price
-            else:
-                 # Fallback to the Daily history
-                 data_1d = ticker.history(period='1d')
-                 price = data_1d['Close'].iloc[-1]
-                 open_price = data_1d['Open'].iloc[0]
-                 o2c = (price - open_price) / open_price
-
-            results[key] = {
-                'price': round(float(price), 2),
-                'live_o2c': o2c,
-                'monthly_history': monthly_history,
-                'weekly_history': weekly_history
-            }
+            results[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FuturesTimeout:
+            print(f"Timeout fetching {key} (>{timeout:.0f}s), skipped this cycle")
         except Exception as e:
             print(f"Error fetching {key}: {e}")
-            
+
+    # Do not block the cycle on stragglers; they finish in the background
+    pool.shutdown(wait=False, cancel_futures=True)
     return results
 
 def run_monitor_loop():
@@ -68,9 +97,22 @@ def run_monitor_loop():
     
     print("[*] SPEC RESEARCH v4.0 (Layered Alpha Monitor) Started.")
     
+    # Keep the hourly archive growing while the monitor runs (CME session candles)
+    HourlyArchiver().start_background(interval_minutes=60)
+    provider = get_provider()
+    
+    # Resume today's session state if the monitor was restarted
+    sessions = load_sessions(SESSION_SNAPSHOT)
+    for key, symbol in LIVE_ASSETS.items():
+        if key not in sessions or sessions[key].symbol != symbol:
+            sessions[key] = LiveSession(symbol)
+        sessions[key].sigma = AlphaBrain.ALPHAS.get(key, {}).get('sigma', {}).get('daily')
+    
     while True:
         try:
-            live_data = fetch_live_data()
+            fetch_start = time.monotonic()
+            live_data = fetch_live_data(provider, sessions=sessions)
+            fetch_seconds = time.monotonic() - fetch_start
             states = []
             
             for asset, market_data in live_data.items():
@@ -87,8 +129,9 @@ def run_monitor_loop():
             
             with open(output_path, 'w') as f:
                 json.dump(final_report, f, indent=4, default=str)
+            save_sessions(sessions, SESSION_SNAPSHOT)
                 
-            print(f"[{final_report['timestamp']}] Alpha State Updated.")
+            print(f"[{final_report['timestamp']}] Alpha State Updated ({len(states)} assets, fetch {fetch_seconds:.1f}s).")
             
             # Update every 60 seconds
             time.sleep(60)
@@ -3,5 +3,7 @@ Data Module
 """
 
 from .data_loader import DataLoader, download_asset_data
+from .market_store import MarketStore
+from .calendar_index import build_calendar, calendar_arrays, get_calendar, with_calendar
 
-__all__ = ['DataLoader', 'download_asset_data']
+__all__ = ['DataLoader', 'download_asset_data', 'MarketStore', 'build_calendar', 'calendar_arrays', 'get_calendar', 'with_calendar']
@@ -0,0 +1,202 @@
+"""
+Calendar Index Module
+Precomputed per-asset trading calendar shared by every analysis engine.
+
+Scripts and engines repeatedly derive the same calendar facts from a price
+index: ISO year/week, the W1/W2/... ordinal of a week inside its month,
+trading-day ranks and period boundaries. This module computes all of them
+once per (asset, data version) as compact integer arrays and caches them.
+
+Conventions (matching the research scripts):
+- month_week: 1 for the first ISO week seen in the month (W1), 2 for the
+  second (W2), ... in order of appearance
+- tdow/tdom/tdoq/tdoy: 1-based trading day of ISO week / month / quarter / year
+"""
+
+import hashlib
+from typing import Dict, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+_CACHE: Dict[Tuple[str, str], pd.DataFrame] = {}
+# Oldest entries are evicted beyond this many cached calendars
+_CACHE_SIZE = 32
+
+CALENDAR_COLUMNS = [
+    'year', 'quarter', 'month', 'day', 'weekday', 'iso_year', 'iso_week',
+    'month_week', 'tdow', 'tdom', 'tdoq', 'tdoy',
+    'is_week_start', 'is_week_end', 'is_month_start', 'is_month_end',
+    'is_quarter_start', 'is_quarter_end', 'is_year_start', 'is_year_end',
+]
+
+
+def data_version(index: pd.DatetimeIndex) -> str:
+    """Stable fingerprint of a DatetimeIndex (changes whenever bars are added)."""
+    return hashlib.blake2b(index.asi8.tobytes(), digest_size=12).hexdigest()
+
+
+def _group_starts(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For a sorted key array return (is_first_of_group, group_start_position).
+    """
+    new = np.empty(len(keys), dtype=bool)
+    if len(keys):
+        new[0] = True
+        new[1:] = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(new)
+    return new, starts[np.cumsum(new) - 1]
+
+
+def _rank(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """1-based rank within consecutive groups, plus first/last flags."""
+    new, start_pos = _group_starts(keys)
+    rank = np.arange(len(keys)) - start_pos + 1
+    last = np.empty_like(new)
+    if len(keys):
+        last[:-1] = new[1:]
+        last[-1] = True
+    return rank, new, last
+
+
+def calendar_arrays(index: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+    """
+    Basic calendar fields of an index as int64 arrays, without pandas accessors.
+
+    Dates are the wall-clock dates of the index (its own timezone). ISO
+    year / week come from the Thursday of each date's week.
+
+    Args:
+        index: DatetimeIndex (naive or tz-aware)
+
+    Returns:
+        Dictionary with year, month, day, weekday (0=Mon), iso_year, iso_week
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    d = index.values.astype('datetime64[D]')
+    days = d.astype(np.int64)
+    m = d.astype('datetime64[M]')
+    y = d.astype('datetime64[Y]')
+    weekday = (days + 3) % 7 # 1970-01-01 was a Thursday
+
+    thursday = d - weekday + 3
+    iso_y = thursday.astype('datetime64[Y]')
+    return {
+        'year': y.astype(np.int64) + 1970,
+        'month': (m - y.astype('datetime64[M]')).astype(np.int64) + 1,
+        'day': (d - m.astype('datetime64[D]')).astype(np.int64) + 1,
+        'weekday': weekday,
+        'iso_year': iso_y.astype(np.int64) + 1970,
+        'iso_week': (thursday - iso_y.astype('datetime64[D]')).astype(np.int64) // 7 + 1,
+    }
+
+
+def build_calendar(index: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Build the calendar table for a sorted daily DatetimeIndex.
+
+    Args:
+        index: Sorted DatetimeIndex of trading days
+
+    Returns:
+        DataFrame indexed like `index` with CALENDAR_COLUMNS
+    """
+    index = pd.DatetimeIndex(index)
+    iso = index.isocalendar()
+
+    year = index.year.to_numpy().astype(np.int16)
+    quarter = index.quarter.to_numpy().astype(np.int8)
+    month = index.month.to_numpy().astype(np.int8)
+    iso_year = iso['year'].to_numpy().astype(np.int16)
+    iso_week = iso['week'].to_numpy().astype(np.int8)
+
+    week_key = iso_year.astype(np.int32) * 100 + iso_week
+    month_key = year.astype(np.int32) * 100 + month
+    quarter_key = year.astype(np.int32) * 10 + quarter
+
+    tdow, week_start, week_end = _rank(week_key)
+    tdom, month_start, month_end = _rank(month_key)
+    tdoq, quarter_start, quarter_end = _rank(quarter_key)
+    tdoy, year_start, year_end = _rank(year)
+
+    # W1/W2/... : count distinct ISO weeks seen so far inside the month
+    week_new, _ = _group_starts(week_key)
+    seen = np.cumsum(month_start | week_new)
+    _, month_start_pos = _group_starts(month_key)
+    month_week = seen - seen[month_start_pos] + 1
+
+    return pd.DataFrame({
+        'year': year,
+        'quarter': quarter,
+        'month': month,
+        'day': index.day.to_numpy().astype(np.int8),
+        'weekday': index.dayofweek.to_numpy().astype(np.int8),
+        'iso_year': iso_year,
+        'iso_week': iso_week,
+        'month_week': month_week.astype(np.int8),
+        'tdow': tdow.astype(np.int8),
+        'tdom': tdom.astype(np.int8),
+        'tdoq': tdoq.astype(np.int8),
+        'tdoy': tdoy.astype(np.int16),
+        'is_week_start': week_start,
+        'is_week_end': week_end,
+        'is_month_start': month_start,
+        'is_month_end': month_end,
+        'is_quarter_start': quarter_start,
+        'is_quarter_end': quarter_end,
+        'is_year_start': year_start,
+        'is_year_end': year_end,
+    }, index=index)
+
+
+def get_calendar(data: pd.DataFrame, asset_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Cached calendar table for a price DataFrame.
+
+    The cache key is (asset, data version), so a refreshed download with new
+    bars builds a new table while repeated calls on the same data are free.
+
+    Args:
+        data: Daily price DataFrame (sorted DatetimeIndex)
+        asset_key: Asset identifier (default: data.attrs['asset_key'])
+
+    Returns:
+        Calendar DataFrame aligned with data.index
+    """
+    asset_key = asset_key or data.attrs.get('asset_key', '')
+    key = (asset_key, data_version(data.index))
+    cal = _CACHE.get(key)
+    if cal is None:
+        cal = build_calendar(data.index)
+        while len(_CACHE) >= _CACHE_SIZE:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = cal
+    return cal
+
+
+def with_calendar(data: pd.DataFrame, columns: Optional[list] = None, asset_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Return a copy of `data` joined with (a subset of) the calendar columns.
+
+    Args:
+        data: Daily price DataFrame
+        columns: Calendar columns to join (default: all)
+        asset_key: Asset identifier for the cache
+
+    Returns:
+        DataFrame with the calendar columns appended
+    """
+    cal = get_calendar(data, asset_key)
+    cols = columns or CALENDAR_COLUMNS
+    out = data.copy()
+    for col in cols:
+        out[col] = cal[col].to_numpy()
+    return out
+
+
+def clear_calendar_cache() -> None:
+    """Drop every cached calendar table."""
+    _CACHE.clear()
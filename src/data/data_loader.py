@@ -3,24 +3,107 @@ Data Loader Module
 Handles downloading and caching of financial data from Yahoo Finance.
 Supports both standard daily bars and CME futures session reconstruction
 (18:00-17:00 ET), which matches TradingView's daily candles for NQ/ES/YM.
+
+Daily bars are served from the local MarketStore by default: only the
+missing head/tail of the requested window is fetched from the network.
+Bars come from a pluggable MarketDataProvider (Yahoo by default).
 """
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from datetime import datetime, timedelta
-from typing import Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union, List, Dict
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-import pytz
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.assets import get_asset, AssetConfig
+from src.data.market_store import MarketStore, parquet_available
+from src.data.providers import MarketDataProvider, get_provider
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CME Globex session opens at 18:00 ET on the previous calendar day
+CME_SESSION_START_HOUR = 18
+CME_TIMEZONE = 'America/New_York'
+
+# yfinance only serves 1h bars for roughly the last 730 days
+HOURLY_LOOKBACK_DAYS = 729
+
+
+def session_dates(
+    index: pd.DatetimeIndex,
+    session_start_hour: int = CME_SESSION_START_HOUR,
+    tz: str = CME_TIMEZONE
+) -> pd.DatetimeIndex:
+    """
+    Trade date of every intraday timestamp.
+    
+    A bar at or after session_start_hour (local time) belongs to the NEXT
+    calendar day's session, e.g. 18:00 ET Monday trades for Tuesday. With
+    session_start_hour=0 sessions are plain calendar days.
+    
+    Args:
+        index: Intraday timestamps (tz-aware, or UTC-naive)
+        session_start_hour: Local hour at which a new session opens (0-23)
+        tz: Exchange timezone the session boundary is expressed in
+        
+    Returns:
+        Naive DatetimeIndex of trade dates (midnight)
+    """
+    if not 0 <= session_start_hour <= 23:
+        raise ValueError(f"session_start_hour must be in 0..23, got {session_start_hour}")
+    idx = pd.DatetimeIndex(index)
+    if idx.tz is None:
+        idx = idx.tz_localize('UTC')
+    # Work on local wall-clock time so DST transitions do not move the boundary
+    local = idx.tz_convert(tz).tz_localize(None)
+    return (local + pd.Timedelta(hours=(24 - session_start_hour) % 24)).normalize()
+
+
+def build_session_candles(
+    df_h: pd.DataFrame,
+    session_start_hour: int = CME_SESSION_START_HOUR,
+    tz: str = CME_TIMEZONE,
+    min_bars: int = 4
+) -> pd.DataFrame:
+    """
+    Aggregate intraday bars into daily session candles.
+    
+    Each bar is assigned to a trade date by shifting its local wall-clock time
+    forward by (24 - session_start_hour) % 24 hours and flooring to the day, so a
+    bar at 18:00 ET belongs to the NEXT calendar day's session and a bar at
+    17:00 ET to the current one. OHLCV and the bar count are computed in a
+    single grouped aggregation.
+    
+    Args:
+        df_h: Intraday OHLCV bars (any case of column names, tz-aware or UTC-naive index)
+        session_start_hour: Local hour at which a new session opens
+        tz: Exchange timezone the session boundary is expressed in
+        min_bars: Sessions with fewer bars are dropped (incomplete candles)
+        
+    Returns:
+        DataFrame of session candles indexed by trade date
+    """
+    trade_date = session_dates(df_h.index, session_start_hour, tz)
+    
+    bars = df_h.copy()
+    bars.columns = [col.lower().replace(' ', '_') for col in bars.columns]
+    bars.index = trade_date
+    
+    agg_funcs = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'}
+    named = {col: (col, fn) for col, fn in agg_funcs.items() if col in bars.columns}
+    named['_bars'] = (bars.columns[0], 'size')
+    
+    daily = bars.groupby(level=0, sort=True).agg(**named)
+    daily = daily[daily['_bars'] >= min_bars].drop(columns='_bars')
+    daily.index.name = 'Date'
+    return daily
+
 
 class DataLoader:
     """
@@ -30,18 +113,39 @@ class DataLoader:
     - Uses adjusted close prices to account for splits and dividends
     - Handles missing data appropriately
     - Provides caching mechanism for efficiency
+    - Incremental local store: only bars not yet stored are downloaded
     """
     
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        store_dir: Optional[str] = None,
+        use_store: bool = True,
+        store_ttl_minutes: int = 60,
+        provider: Optional[MarketDataProvider] = None
+    ):
         """
         Initialize DataLoader.
         
         Args:
             cache_dir: Optional directory for caching downloaded data
+            store_dir: Root of the local market store (default: data/market_store)
+            use_store: Serve daily bars from the local store, fetching only gaps
+            store_ttl_minutes: Minutes a fetched tail is considered fresh
+            provider: Source of market data (default: get_provider(), i.e. Yahoo)
         """
+        self.provider = provider or get_provider()
         self.cache_dir = Path(cache_dir) if cache_dir else None
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.store = None
+        if use_store:
+            if parquet_available():
+                self.store = MarketStore(store_dir)
+            else:
+                logger.warning("No Parquet engine installed (pyarrow); local market store disabled")
+        self.store_ttl = timedelta(minutes=store_ttl_minutes)
     
     def download(
         self,
@@ -75,18 +179,14 @@ class DataLoader:
         elif isinstance(start_date, str):
             start_date = pd.to_datetime(start_date)
         
-        logger.info(f"Downloading {asset.name} ({asset.yahoo_symbol}) from {start_date.date()} to {end_date.date()}")
-        
-        # Download from Yahoo Finance
-        ticker = yf.Ticker(asset.yahoo_symbol)
-        df = ticker.history(start=start_date, end=end_date, auto_adjust=True)
+        if self.store is not None:
+            df = self._download_with_store(asset_key, start_date, end_date)
+        else:
+            df = self._fetch_daily(asset, start_date, end_date)
         
         if df.empty:
             raise ValueError(f"No data retrieved for {asset_key}. Check symbol: {asset.yahoo_symbol}")
         
-        # Clean and standardize columns
-        df = self._clean_data(df)
-        
         # Add metadata
         df.attrs['asset_key'] = asset_key
         df.attrs['asset_name'] = asset.name
@@ -96,6 +196,224 @@ class DataLoader:
         logger.info(f"Downloaded {len(df)} records for {asset.name}")
         
         return df
+
+    def download_many(
+        self,
+        asset_keys: List[str],
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        years_back: int = 10,
+        max_workers: int = 8,
+        as_panel: bool = False
+    ) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+        """
+        Download historical data for several assets at once.
+        
+        Assets that still have to come from the network in full are batched
+        into a single provider download call. Everything else (store reads, gap
+        fetches, and assets the batch did not return) runs through a bounded
+        thread pool of per-asset download() calls. A failing asset is logged
+        and left out of the result instead of aborting the others.
+        
+        Args:
+            asset_keys: Keys of the assets in ASSETS config (e.g., ['NQ', 'ES'])
+            start_date: Start date for data (default: years_back from today)
+            end_date: End date for data (default: today)
+            years_back: Number of years of history if start_date not specified
+            max_workers: Maximum concurrent per-asset downloads
+            as_panel: Return one DataFrame with (asset, field) columns aligned
+                on the union of dates instead of a dict
+            
+        Returns:
+            Dictionary of asset key to OHLCV DataFrame, or an aligned panel
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        elif isinstance(end_date, str):
+            end_date = pd.to_datetime(end_date)
+            
+        if start_date is None:
+            start_date = end_date - timedelta(days=years_back * 365)
+        elif isinstance(start_date, str):
+            start_date = pd.to_datetime(start_date)
+        
+        assets = {key: get_asset(key) for key in asset_keys}
+        
+        # 1. One batched request for assets with nothing stored locally
+        if self.store is None:
+            cold = list(asset_keys)
+        else:
+            cold = [key for key in asset_keys if not self.store.read_meta(key)]
+        
+        results = {}
+        if len(cold) > 1:
+            batch = self._fetch_daily_batch({key: assets[key] for key in cold}, start_date, end_date)
+            for key, df in batch.items():
+                if self.store is not None:
+                    self.store.write(key, df)
+                    self.store.write_meta(key, {
+                        'coverage_start': start_date,
+                        'coverage_end': min(end_date, datetime.now()),
+                        'updated_at': datetime.now(),
+                    })
+                else:
+                    results[key] = df
+        
+        # 2. Bounded pool for store reads, gap fills and batch misses
+        pending = [key for key in asset_keys if key not in results]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as pool:
+            futures = {pool.submit(self.download, key, start_date, end_date): key for key in pending}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.warning(f"Download failed for {key}: {e}")
+        
+        # Preserve the requested order and tag batched frames like download()
+        ordered = {}
+        for key in asset_keys:
+            if key not in results:
+                continue
+            df = results[key]
+            if 'asset_key' not in df.attrs:
+                df.attrs['asset_key'] = key
+                df.attrs['asset_name'] = assets[key].name
+                df.attrs['yahoo_symbol'] = assets[key].yahoo_symbol
+                df.attrs['download_date'] = datetime.now().isoformat()
+            ordered[key] = df
+        
+        if as_panel:
+            return pd.concat(ordered, axis=1, names=['asset', 'field']).sort_index()
+        return ordered
+
+    def _fetch_daily_batch(
+        self,
+        assets: Dict[str, AssetConfig],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch and clean daily bars for several assets in one provider call.
+        
+        Returns:
+            Dictionary of asset key to cleaned DataFrame. Assets missing from
+            the response (or the whole batch, on error) are omitted.
+        """
+        symbols = {asset.yahoo_symbol: key for key, asset in assets.items()}
+        logger.info(f"Batch downloading {list(symbols)} from {start_date.date()} to {end_date.date()}")
+        
+        try:
+            bulk = self.provider.download(list(symbols), start=start_date, end=end_date)
+        except Exception as e:
+            logger.warning(f"Batch download failed, falling back to per-asset downloads: {e}")
+            return {}
+        
+        results = {}
+        for symbol, df in bulk.items():
+            key = symbols[symbol]
+            results[key] = self._clean_data(df.copy())
+        return results
+
+    def _fetch_daily(self, asset: AssetConfig, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Fetch and clean daily bars for [start_date, end_date) from Yahoo Finance.
+        
+        Returns:
+            Cleaned DataFrame (empty if Yahoo returned nothing)
+        """
+        logger.info(f"Downloading {asset.name} ({asset.yahoo_symbol}) from {start_date.date()} to {end_date.date()}")
+        
+        df = self.provider.history(asset.yahoo_symbol, start=start_date, end=end_date)
+        if df.empty:
+            return df
+        
+        # Clean and standardize columns
+        return self._clean_data(df)
+
+    def _download_with_store(self, asset_key: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Serve [start_date, end_date) from the local store, fetching only the gaps.
+        
+        The store metadata records the window already fetched. A request that
+        starts earlier fetches the missing head; a request that ends later
+        re-fetches from the last stored bar (which may have been a partial
+        session) up to end_date. Tails fetched less than store_ttl ago are
+        considered fresh. Coverage only grows when a fetch returned bars.
+        
+        Prices are auto-adjusted, so a dividend or split rescales the whole
+        history. Head and tail fetches overlap one stored bar; if that bar
+        changed, the whole stored window (coverage_start to the later of
+        coverage_end and end_date) is re-fetched on the new basis.
+        
+        Returns:
+            Cleaned DataFrame sliced to the requested window
+        """
+        asset = get_asset(asset_key)
+        meta = self.store.read_meta(asset_key)
+        now = datetime.now()
+        covered_until = min(end_date, now)
+        
+        if not meta:
+            df = self._fetch_daily(asset, start_date, end_date)
+            if df.empty:
+                return df
+            self.store.write(asset_key, df)
+            meta = {'coverage_start': start_date, 'coverage_end': covered_until}
+        else:
+            cov_start = pd.Timestamp(meta['coverage_start'])
+            cov_end = pd.Timestamp(meta['coverage_end'])
+            rebased = False
+            
+            if start_date < cov_start:
+                first_bar = self.store.first_timestamp(asset_key)
+                head_end = max(cov_start, first_bar + timedelta(days=1)) if first_bar is not None else cov_start
+                head = self._fetch_daily(asset, start_date, head_end.to_pydatetime())
+                if not head.empty:
+                    rebased |= self._adjustment_changed(asset_key, head)
+                    self.store.write(asset_key, head)
+                    meta['coverage_start'] = start_date
+            
+            if end_date > cov_end + self.store_ttl:
+                last_bar = self.store.last_timestamp(asset_key)
+                tail_start = min(cov_end, last_bar) if last_bar is not None else cov_end
+                tail = self._fetch_daily(asset, tail_start.to_pydatetime(), end_date)
+                if not tail.empty:
+                    rebased |= self._adjustment_changed(asset_key, tail)
+                    self.store.write(asset_key, tail)
+                    meta['coverage_end'] = max(cov_end, pd.Timestamp(covered_until))
+            else:
+                logger.info(f"[Store] {asset_key} served from local store")
+            
+            if rebased:
+                logger.info(f"[Store] {asset_key} adjustment basis changed, re-fetching the stored history")
+                # The whole stored window, which may reach past this request's end_date
+                full_end = max(pd.Timestamp(end_date), pd.Timestamp(meta['coverage_end']))
+                full = self._fetch_daily(asset, pd.Timestamp(meta['coverage_start']).to_pydatetime(),
+                                         full_end.to_pydatetime())
+                self.store.write(asset_key, full)
+        
+        meta['updated_at'] = now
+        self.store.write_meta(asset_key, meta)
+        
+        return self.store.load(asset_key, start_date, end_date)
+    
+    def _adjustment_changed(self, asset_key: str, fetched: pd.DataFrame) -> bool:
+        """
+        Return True if freshly fetched bars disagree with the stored ones they overlap.
+        
+        Opens are compared: they are fixed once a session starts (unlike the
+        close of a partial session) and move only when the adjustment factor does.
+        """
+        stored = self.store.load(asset_key, fetched.index[0], fetched.index[-1] + timedelta(days=1))
+        if stored.empty:
+            return False
+        common = stored.index.intersection(fetched.index)
+        if common.empty:
+            return False
+        return not np.allclose(stored.loc[common, 'open'].to_numpy(dtype=float),
+                               fetched.loc[common, 'open'].to_numpy(dtype=float),
+                               rtol=1e-5, equal_nan=True)
     
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -142,7 +460,8 @@ class DataLoader:
         asset_key: str,
         start_date: Optional[Union[str, datetime]] = None,
         end_date: Optional[Union[str, datetime]] = None,
-        years_back: int = 5
+        years_back: int = 5,
+        session_start_hour: int = CME_SESSION_START_HOUR
     ) -> pd.DataFrame:
         """
         Download daily data using CME futures session boundaries (18:00-17:00 ET),
@@ -154,13 +473,13 @@ class DataLoader:
             start_date: Start date string (YYYY-MM-DD)
             end_date: End date string (YYYY-MM-DD)
             years_back: Years of history if start_date not specified
+            session_start_hour: ET hour at which a new session opens (default: 18)
 
         Returns:
             DataFrame with OHLCV data resampled to CME session boundaries.
             Index is the trade date (the date when the session ends at 17:00 ET).
         """
         asset = get_asset(asset_key)
-        et_tz = pytz.timezone('America/New_York')
 
         # Resolve dates
         if end_date is None:
@@ -182,18 +501,17 @@ class DataLoader:
         # Fetch one extra day after end in case last session spills over
         fetch_end = end_dt + timedelta(days=1)
 
-        logger.info(
-            f"[CME Session] Downloading hourly {asset.name} ({asset.yahoo_symbol}) "
-            f"from {start_dt.date()} to {end_dt.date()}"
-        )
-
-        ticker = yf.Ticker(asset.yahoo_symbol)
-        df_h = ticker.history(
-            start=fetch_start,
-            end=fetch_end,
-            interval='1h',
-            auto_adjust=True
-        )
+        if self.store is not None:
+            # Multi-year history comes from the local archive; only the
+            # newest hours are requested from the network.
+            self.update_hourly_archive(asset_key)
+            df_h = self.store.load(asset_key, fetch_start, fetch_end, interval='1h')
+        else:
+            logger.info(
+                f"[CME Session] Downloading hourly {asset.name} ({asset.yahoo_symbol}) "
+                f"from {start_dt.date()} to {end_dt.date()}"
+            )
+            df_h = self._fetch_hourly(asset, fetch_start, fetch_end)
 
         if df_h.empty:
             raise ValueError(
@@ -201,36 +519,7 @@ class DataLoader:
                 "Note: yfinance limits hourly data to ~730 days."
             )
 
-        # Ensure timezone-aware index in ET
-        if df_h.index.tz is None:
-            df_h.index = df_h.index.tz_localize('UTC')
-        df_h.index = df_h.index.tz_convert(et_tz)
-
-        # Assign each hourly bar to a CME trade date.
-        # CME session: 18:00 ET (prev day) -> 17:00 ET (trade date)
-        # Rule: if hour >= 18 -> belongs to NEXT calendar day's session
-        #        if hour < 18  -> belongs to CURRENT calendar day's session
-        def assign_trade_date(ts):
-            if ts.hour >= 18:
-                return (ts + timedelta(days=1)).date()
-            return ts.date()
-
-        df_h['trade_date'] = df_h.index.map(assign_trade_date)
-
-        # Resample to daily CME candles
-        df_h.columns = [col.lower().replace(' ', '_') for col in df_h.columns]
-        price_cols = {c: c for c in ['open', 'high', 'low', 'close', 'volume'] if c in df_h.columns}
-
-        agg_map = {}
-        if 'open'   in df_h.columns: agg_map['open']   = 'first'
-        if 'high'   in df_h.columns: agg_map['high']   = 'max'
-        if 'low'    in df_h.columns: agg_map['low']    = 'min'
-        if 'close'  in df_h.columns: agg_map['close']  = 'last'
-        if 'volume' in df_h.columns: agg_map['volume'] = 'sum'
-
-        daily = df_h.groupby('trade_date').agg(agg_map)
-        daily.index = pd.to_datetime(daily.index)
-        daily.index.name = 'Date'
+        daily = build_session_candles(df_h, session_start_hour=session_start_hour)
 
         # Filter to requested date range
         daily = daily[
@@ -238,20 +527,13 @@ class DataLoader:
             (daily.index <= pd.to_datetime(end_dt.date()))
         ]
 
-        # Drop sessions with fewer than 4 hours of data (incomplete candles)
-        if 'close' in daily.columns:
-            bar_counts = df_h.groupby('trade_date').size()
-            bar_counts.index = pd.to_datetime(bar_counts.index)
-            valid_dates = bar_counts[bar_counts >= 4].index
-            daily = daily[daily.index.isin(valid_dates)]
-
         daily = daily.sort_index()
 
         # Add metadata
         daily.attrs['asset_key']    = asset_key
         daily.attrs['asset_name']   = asset.name
         daily.attrs['yahoo_symbol'] = asset.yahoo_symbol
-        daily.attrs['session']      = 'CME_18-17_ET'
+        daily.attrs['session']      = f"CME_{session_start_hour}-{(session_start_hour - 1) % 24}_ET"
         daily.attrs['download_date'] = datetime.now().isoformat()
 
         logger.info(
@@ -259,6 +541,60 @@ class DataLoader:
         )
         return daily
 
+    def _fetch_hourly(self, asset: AssetConfig, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        Fetch 1-hour bars for [start_date, end_date) from Yahoo Finance.
+        
+        Returns:
+            DataFrame with lowercase OHLCV columns and a UTC index
+            (empty if Yahoo returned nothing)
+        """
+        df_h = self.provider.history(asset.yahoo_symbol, start=start_date, end=end_date, interval='1h')
+        if df_h.empty:
+            return df_h
+        
+        if df_h.index.tz is None:
+            df_h.index = df_h.index.tz_localize('UTC')
+        df_h.index = df_h.index.tz_convert('UTC')
+        df_h.index.name = 'Datetime'
+        df_h.columns = [col.lower().replace(' ', '_') for col in df_h.columns]
+        df_h = df_h[[c for c in ['open', 'high', 'low', 'close', 'volume'] if c in df_h.columns]]
+        return df_h.dropna(subset=['close']).sort_index()
+
+    def update_hourly_archive(self, asset_key: str) -> int:
+        """
+        Append the newest 1-hour bars of an asset to the local archive.
+        
+        The archive is seeded with everything yfinance still serves (~730 days)
+        and afterwards only grows from its last stored hour, de-duplicated on
+        timestamp. Running this regularly builds hourly history beyond the
+        yfinance limit.
+        
+        Args:
+            asset_key: Key of the asset in ASSETS config (e.g., 'NQ')
+            
+        Returns:
+            Number of bars written (0 if the archive is fresh or disabled)
+        """
+        if self.store is None:
+            return 0
+        
+        asset = get_asset(asset_key)
+        now = datetime.now(timezone.utc)
+        last_bar = self.store.last_timestamp(asset_key, interval='1h')
+        
+        if last_bar is None:
+            fetch_start = now - timedelta(days=HOURLY_LOOKBACK_DAYS)
+        elif now - last_bar.to_pydatetime() < self.store_ttl:
+            return 0
+        else:
+            # Re-fetch the last stored hour, it may have been a partial bar
+            fetch_start = max(last_bar.to_pydatetime(), now - timedelta(days=HOURLY_LOOKBACK_DAYS))
+        
+        logger.info(f"[Archive] Fetching hourly {asset.name} ({asset.yahoo_symbol}) since {fetch_start:%Y-%m-%d %H:%M} UTC")
+        df_h = self._fetch_hourly(asset, fetch_start, now + timedelta(hours=1))
+        return self.store.write(asset_key, df_h, interval='1h')
+
     def save_to_cache(self, df: pd.DataFrame, asset_key: str) -> Path:
         """Save data to cache directory."""
         if self.cache_dir is None:
@@ -307,7 +643,8 @@ def download_asset_data_cme(
     asset_key: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    years_back: int = 5
+    years_back: int = 5,
+    session_start_hour: int = CME_SESSION_START_HOUR
 ) -> pd.DataFrame:
     """
     Convenience function to download daily data using CME session boundaries
@@ -321,9 +658,10 @@ def download_asset_data_cme(
         start_date: Optional start date string (YYYY-MM-DD)
         end_date: Optional end date string (YYYY-MM-DD)
         years_back: Years of history if start_date not provided
+        session_start_hour: ET hour at which a new session opens (default: 18)
 
     Returns:
         DataFrame with OHLCV data resampled to CME session boundaries.
     """
     loader = DataLoader()
-    return loader.download_cme_session(asset_key, start_date, end_date, years_back)
+    return loader.download_cme_session(asset_key, start_date, end_date, years_back, session_start_hour)
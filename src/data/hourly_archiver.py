@@ -0,0 +1,102 @@
+"""
+Hourly Archiver Module
+Keeps the local 1-hour bar archive of every futures asset up to date.
+
+yfinance only serves ~730 days of hourly bars, so CME session candles can
+only be rebuilt for that window. Appending the newest hours on every run
+lets the archive grow past that limit; DataLoader.download_cme_session then
+reads multi-year ranges from disk.
+
+Usage:
+    python -m src.data.hourly_archiver            # archive once
+    python -m src.data.hourly_archiver --loop 60  # archive every 60 minutes
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional, List, Dict
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from config.assets import list_futures_assets
+from src.data.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+
+class HourlyArchiver:
+    """
+    Appends the newest hourly bars of a set of assets to the local store.
+
+    Failures are isolated per asset: one bad symbol does not stop the others.
+    """
+
+    def __init__(self, asset_keys: Optional[List[str]] = None, loader: Optional[DataLoader] = None):
+        """
+        Initialize HourlyArchiver.
+
+        Args:
+            asset_keys: Assets to archive (default: all futures in ASSETS)
+            loader: DataLoader whose store receives the bars
+        """
+        self.asset_keys = asset_keys or list_futures_assets()
+        self.loader = loader or DataLoader()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Archive the newest hourly bars of every asset.
+
+        Returns:
+            Dictionary of asset key to number of bars written (-1 on error)
+        """
+        written = {}
+        for key in self.asset_keys:
+            try:
+                written[key] = self.loader.update_hourly_archive(key)
+            except Exception as e:
+                logger.warning(f"[Archive] {key} failed: {e}")
+                written[key] = -1
+        return written
+
+    def start_background(self, interval_minutes: float = 60) -> threading.Thread:
+        """
+        Run the archiver in a daemon thread every `interval_minutes`.
+
+        Returns:
+            The started thread (call stop() to end it)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+
+        def _loop():
+            while not self._stop.is_set():
+                self.run_once()
+                self._stop.wait(interval_minutes * 60)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=_loop, name='hourly-archiver', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Stop the background thread after its current pass."""
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Archive hourly bars for all futures assets')
+    parser.add_argument('--loop', type=float, default=None, help='Repeat every N minutes')
+    args = parser.parse_args()
+
+    archiver = HourlyArchiver()
+    if args.loop is None:
+        print(archiver.run_once())
+    else:
+        while True:
+            print(archiver.run_once())
+            time.sleep(args.loop * 60)
@@ -0,0 +1,232 @@
+"""
+Live Session Module
+Incremental intraday state of the current trading session per asset.
+
+The live monitor used to download the whole day of 1-minute bars every
+cycle only to read the session open and the last close. A LiveSession keeps
+the session open, running high / low and last price, and on every refresh
+asks the provider only for the bars from its last timestamp on (the last bar
+is re-read because it may have been partial). Fetch size and CPU per cycle
+stay constant through the day instead of growing to ~1,400 bars.
+
+Sessions roll over on the CME boundary (18:00 ET, see data_loader.session_dates).
+The state is a small JSON dict, and save_sessions / load_sessions give the
+monitor a warm restart from a snapshot file.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data.data_loader import CME_SESSION_START_HOUR, CME_TIMEZONE, session_dates
+from src.data.providers import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+# A snapshot older than this is discarded and the session is fetched cold
+MAX_RESUME_GAP = pd.Timedelta(days=1)
+
+
+class LiveSession:
+    """
+    Open / high / low / last of one asset's current session, updated from new bars only.
+
+    Thread-safe: refresh() and update() of the same session never interleave.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        sigma: Optional[float] = None,
+        session_start_hour: int = CME_SESSION_START_HOUR,
+        tz: str = CME_TIMEZONE
+    ):
+        """
+        Initialize LiveSession.
+
+        Args:
+            symbol: Provider symbol (e.g. 'NQ=F')
+            sigma: Daily O2C sigma used for sigma_multiple (optional)
+            session_start_hour: Local hour at which a new session opens
+            tz: Exchange timezone of the session boundary
+        """
+        self.symbol = symbol
+        self.sigma = sigma
+        self.session_start_hour = session_start_hour
+        self.tz = tz
+        self.session_date: Optional[pd.Timestamp] = None
+        self.open = np.nan
+        self.high = np.nan
+        self.low = np.nan
+        self.last = np.nan
+        self.last_ts: Optional[pd.Timestamp] = None
+        self.n_bars = 0
+        self._lock = threading.Lock()
+
+    @property
+    def empty(self) -> bool:
+        """True until the first bar has been applied."""
+        return self.last_ts is None
+
+    @property
+    def o2c(self) -> float:
+        """Open-to-current return of the session."""
+        return (self.last - self.open) / self.open if not self.empty else np.nan
+
+    @property
+    def sigma_multiple(self) -> float:
+        """Session O2C in units of the daily sigma (NaN without sigma)."""
+        return self.o2c / self.sigma if self.sigma else np.nan
+
+    def update(self, bars: pd.DataFrame) -> int:
+        """
+        Apply intraday bars (Open/High/Low/Close columns, tz-aware index).
+
+        Bars older than the last applied timestamp are ignored; the bar at the
+        last timestamp replaces the last price. A bar of a later session starts
+        a new session.
+
+        Returns:
+            Number of new bars applied
+        """
+        with self._lock:
+            return self._update(bars)
+
+    def _update(self, bars: pd.DataFrame) -> int:
+        if bars is None or bars.empty:
+            return 0
+        bars = bars.dropna(subset=['Close']).sort_index()
+        if self.last_ts is not None:
+            bars = bars[bars.index >= self.last_ts]
+        if bars.empty:
+            return 0
+
+        dates = session_dates(bars.index, self.session_start_hour, self.tz)
+        newest = dates.max()
+        if self.session_date is None or newest > self.session_date:
+            # New session: restart from its first bar
+            bars = bars[dates == newest]
+            self.session_date = newest
+            self.open = float(bars['Open'].iloc[0])
+            self.high = -np.inf
+            self.low = np.inf
+            self.n_bars = 0
+        else:
+            bars = bars[dates == self.session_date]
+            if bars.empty:
+                return 0
+
+        new = int((bars.index > self.last_ts).sum()) if self.last_ts is not None else len(bars)
+        self.high = max(self.high, float(bars['High'].max()))
+        self.low = min(self.low, float(bars['Low'].min()))
+        self.last = float(bars['Close'].iloc[-1])
+        self.last_ts = bars.index[-1]
+        self.n_bars += new
+        return new
+
+    def refresh(self, provider: MarketDataProvider, now: Optional[pd.Timestamp] = None) -> int:
+        """
+        Fetch and apply the bars since the last update.
+
+        A cold session (or one whose last bar is older than MAX_RESUME_GAP)
+        fetches the latest session with period='1d'.
+
+        Args:
+            provider: Market data provider
+            now: Current time (default: wall clock)
+
+        Returns:
+            Number of new bars applied
+        """
+        with self._lock:
+            now = pd.Timestamp.now(tz=self.tz) if now is None else now
+            if self.last_ts is not None and now - self.last_ts <= MAX_RESUME_GAP:
+                bars = provider.history(self.symbol, start=self.last_ts, interval='1m')
+            else:
+                bars = provider.history(self.symbol, period='1d', interval='1m')
+            return self._update(bars)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable snapshot of the state (NaN stored as None)."""
+        def clean(x):
+            return None if x is None or np.isnan(x) else x
+
+        # A fetch thread that outlived its timeout may still be inside _update
+        with self._lock:
+            return {
+                'symbol': self.symbol,
+                'sigma': self.sigma,
+                'session_start_hour': self.session_start_hour,
+                'tz': self.tz,
+                'session_date': self.session_date.isoformat() if self.session_date is not None else None,
+                'open': clean(self.open),
+                'high': clean(self.high),
+                'low': clean(self.low),
+                'last': clean(self.last),
+                'last_ts': self.last_ts.isoformat() if self.last_ts is not None else None,
+                'n_bars': self.n_bars,
+                'o2c': clean(self.o2c),
+                'sigma_multiple': clean(self.sigma_multiple),
+            }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'LiveSession':
+        """Rebuild a LiveSession from to_dict() output."""
+        def restore(x):
+            return np.nan if x is None else float(x)
+
+        session = cls(state['symbol'], state.get('sigma'), state['session_start_hour'], state['tz'])
+        if state.get('last_ts') is not None:
+            session.session_date = pd.Timestamp(state['session_date'])
+            session.open = restore(state['open'])
+            session.high = restore(state['high'])
+            session.low = restore(state['low'])
+            session.last = restore(state['last'])
+            session.last_ts = pd.Timestamp(state['last_ts'])
+            session.n_bars = state['n_bars']
+        return session
+
+
+def save_sessions(sessions: Dict[str, LiveSession], path: Union[str, Path]) -> Path:
+    """
+    Write the state of several sessions to a JSON snapshot (atomic replace).
+
+    Args:
+        sessions: Dictionary of asset key to LiveSession
+        path: Snapshot file
+
+    Returns:
+        Path of the snapshot
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({key: session.to_dict() for key, session in sessions.items()}, f, indent=4)
+    tmp.replace(path)
+    return path
+
+
+def load_sessions(path: Union[str, Path]) -> Dict[str, LiveSession]:
+    """
+    Read sessions from a save_sessions() snapshot.
+
+    Returns:
+        Dictionary of asset key to LiveSession (empty if the file is missing
+        or unreadable)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        with open(path) as f:
+            state = json.load(f)
+        return {key: LiveSession.from_dict(s) for key, s in state.items()}
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable session snapshot {path}: {e}")
+        return {}
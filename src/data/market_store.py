@@ -0,0 +1,234 @@
+"""
+Market Store Module
+Persistent, partitioned OHLCV store backing DataLoader.
+
+Bars are kept as one Parquet file per (interval, asset, year):
+
+    <root>/<interval>/<asset_key>/<year>.parquet
+    <root>/<interval>/<asset_key>/_meta.json
+
+The metadata file records which [start, end) window has already been fetched
+from the network, so DataLoader only has to request the missing head/tail.
+
+Files are replaced atomically (temp file + os.replace), so readers never see
+a half-written partition. Writers of one asset are serialized by a thread
+lock plus an advisory file lock (<asset dir>/.lock) where fcntl exists, which
+also covers other processes sharing the store.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+import importlib.util
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: thread lock only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Default location: <project_root>/data/market_store
+DEFAULT_STORE_DIR = Path(__file__).parent.parent.parent / "data" / "market_store"
+
+# One writer lock per asset directory, shared by every MarketStore instance
+_WRITE_LOCKS: Dict[Path, threading.Lock] = {}
+_WRITE_LOCKS_GUARD = threading.Lock()
+
+
+def _reset_write_locks() -> None:
+    """Fresh locks in a forked child (a parent thread may have held one at fork time)."""
+    global _WRITE_LOCKS, _WRITE_LOCKS_GUARD
+    _WRITE_LOCKS = {}
+    _WRITE_LOCKS_GUARD = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_write_locks)
+
+
+def parquet_available() -> bool:
+    """Return True if a Parquet engine (pyarrow or fastparquet) is installed."""
+    return any(importlib.util.find_spec(m) is not None for m in ('pyarrow', 'fastparquet'))
+
+
+class MarketStore:
+    """
+    Local columnar store of OHLCV bars partitioned by interval, asset and year.
+
+    Writes are merge-on-write: new bars are combined with the existing yearly
+    partition, de-duplicated on timestamp (newest wins) and rewritten. Only the
+    partitions touched by the new bars are rewritten.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize MarketStore.
+
+        Args:
+            root: Root directory of the store (default: data/market_store)
+        """
+        self.root = Path(root) if root else DEFAULT_STORE_DIR
+
+    def _asset_dir(self, asset_key: str, interval: str) -> Path:
+        return self.root / interval / asset_key
+
+    def _partition_path(self, asset_key: str, interval: str, year: int) -> Path:
+        return self._asset_dir(asset_key, interval) / f"{year}.parquet"
+
+    @contextmanager
+    def _write_lock(self, asset_dir: Path):
+        """Serialize writers of one asset across threads and processes."""
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        key = asset_dir.resolve()
+        with _WRITE_LOCKS_GUARD:
+            lock = _WRITE_LOCKS.setdefault(key, threading.Lock())
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            with open(asset_dir / ".lock", 'a') as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def years(self, asset_key: str, interval: str = '1d') -> List[int]:
+        """List the yearly partitions stored for an asset."""
+        asset_dir = self._asset_dir(asset_key, interval)
+        if not asset_dir.exists():
+            return []
+        return sorted(int(p.stem) for p in asset_dir.glob('*.parquet') if p.stem.isdigit())
+
+    def read_meta(self, asset_key: str, interval: str = '1d') -> Dict[str, Any]:
+        """Read the fetch-coverage metadata of an asset (empty dict if none)."""
+        path = self._asset_dir(asset_key, interval) / "_meta.json"
+        if not path.exists():
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def write_meta(self, asset_key: str, meta: Dict[str, Any], interval: str = '1d') -> None:
+        """Persist the fetch-coverage metadata of an asset."""
+        asset_dir = self._asset_dir(asset_key, interval)
+        with self._write_lock(asset_dir):
+            _atomic_write(asset_dir / "_meta.json",
+                          lambda tmp: tmp.write_text(json.dumps(meta, indent=2, default=str)))
+
+    def load(
+        self,
+        asset_key: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        interval: str = '1d'
+    ) -> pd.DataFrame:
+        """
+        Load stored bars for [start, end).
+
+        Only the yearly partitions overlapping the window are read.
+
+        Args:
+            asset_key: Asset identifier (e.g., 'NQ')
+            start: Inclusive start timestamp (None = first stored bar)
+            end: Exclusive end timestamp (None = last stored bar)
+            interval: Bar interval ('1d', '1h', ...)
+
+        Returns:
+            DataFrame of stored bars (empty if nothing is stored)
+        """
+        years = self.years(asset_key, interval)
+        if start is not None:
+            years = [y for y in years if y >= pd.Timestamp(start).year]
+        if end is not None:
+            years = [y for y in years if y <= pd.Timestamp(end).year]
+        if not years:
+            return pd.DataFrame()
+
+        frames = [pd.read_parquet(self._partition_path(asset_key, interval, y)) for y in years]
+        df = pd.concat(frames).sort_index()
+
+        if start is not None:
+            df = df[df.index >= _align_tz(start, df.index)]
+        if end is not None:
+            df = df[df.index < _align_tz(end, df.index)]
+        return df
+
+    def first_timestamp(self, asset_key: str, interval: str = '1d') -> Optional[pd.Timestamp]:
+        """Timestamp of the earliest stored bar, or None."""
+        years = self.years(asset_key, interval)
+        if not years:
+            return None
+        df = pd.read_parquet(self._partition_path(asset_key, interval, years[0]))
+        return df.index.min() if not df.empty else None
+
+    def last_timestamp(self, asset_key: str, interval: str = '1d') -> Optional[pd.Timestamp]:
+        """Timestamp of the latest stored bar, or None."""
+        years = self.years(asset_key, interval)
+        if not years:
+            return None
+        df = pd.read_parquet(self._partition_path(asset_key, interval, years[-1]))
+        return df.index.max() if not df.empty else None
+
+    def write(self, asset_key: str, df: pd.DataFrame, interval: str = '1d') -> int:
+        """
+        Merge bars into the store, de-duplicating on timestamp.
+
+        Args:
+            asset_key: Asset identifier
+            df: Bars to merge (DatetimeIndex)
+            interval: Bar interval
+
+        Returns:
+            Number of bars written
+        """
+        if df.empty:
+            return 0
+
+        asset_dir = self._asset_dir(asset_key, interval)
+
+        # attrs are per-download metadata and do not belong in the partitions
+        df = df.copy()
+        df.attrs = {}
+
+        with self._write_lock(asset_dir):
+            for year, chunk in df.groupby(df.index.year):
+                path = self._partition_path(asset_key, interval, int(year))
+                if path.exists():
+                    chunk = pd.concat([pd.read_parquet(path), chunk])
+                chunk = chunk[~chunk.index.duplicated(keep='last')].sort_index()
+                _atomic_write(path, chunk.to_parquet)
+
+        logger.info(f"[Store] Wrote {len(df)} {interval} bars for {asset_key} to {asset_dir}")
+        return len(df)
+
+
+def _atomic_write(path: Path, write) -> None:
+    """Call write(tmp_path) on a temp file next to path, then swap it in with os.replace."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _align_tz(ts, index: pd.DatetimeIndex) -> pd.Timestamp:
+    """Convert a bound to the timezone convention of the stored index."""
+    ts = pd.Timestamp(ts)
+    if index.tz is not None and ts.tz is None:
+        return ts.tz_localize(index.tz)
+    if index.tz is None and ts.tz is not None:
+        return ts.tz_convert(None)
+    return ts
@@ -0,0 +1,290 @@
+"""
+Market Data Providers Module
+Pluggable source of OHLCV bars for DataLoader, the live monitor and the API.
+
+Providers return yfinance-shaped frames (capitalized Open/High/Low/Close/Volume
+columns, tz-aware DatetimeIndex) so callers do not care where bars come from.
+
+- YahooProvider:   live data through yfinance (default)
+- FixtureProvider: offline bars from recorded files, or deterministic
+                   synthetic bars when no recording exists
+
+Select the process-wide provider with the DOR_DATA_PROVIDER environment
+variable ('yahoo' or 'fixture'); DOR_FIXTURE_DIR points at the recordings.
+"""
+
+import os
+import re
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union, List, Dict
+
+import numpy as np
+import pandas as pd
+
+DateLike = Optional[Union[str, datetime, pd.Timestamp]]
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Bar spacing per supported interval
+INTERVAL_STEPS = {
+    '1m': pd.Timedelta(minutes=1),
+    '1h': pd.Timedelta(hours=1),
+    '1d': pd.Timedelta(days=1),
+}
+
+
+def period_to_timedelta(period: str) -> pd.Timedelta:
+    """
+    Convert a yfinance period string ('5d', '3mo', '1y', 'max') to a Timedelta.
+    """
+    if period == 'max':
+        return pd.Timedelta(days=365 * 30)
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+    days = {'d': 1, 'wk': 7, 'mo': 31, 'y': 366}[unit]
+    return pd.Timedelta(days=n * days)
+
+
+class MarketDataProvider(ABC):
+    """Interface every market data source implements."""
+
+    name = 'base'
+
+    @abstractmethod
+    def history(
+        self,
+        symbol: str,
+        start: DateLike = None,
+        end: DateLike = None,
+        period: Optional[str] = None,
+        interval: str = '1d'
+    ) -> pd.DataFrame:
+        """
+        Bars of one symbol for [start, end) or the trailing `period`.
+
+        Returns:
+            DataFrame with OHLCV columns (empty if nothing is available)
+        """
+
+    def download(
+        self,
+        symbols: List[str],
+        start: DateLike = None,
+        end: DateLike = None,
+        period: Optional[str] = None,
+        interval: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Bars of several symbols. The default implementation loops history().
+
+        Returns:
+            Dictionary of symbol to DataFrame; symbols without data are omitted
+        """
+        results = {}
+        for symbol in symbols:
+            df = self.history(symbol, start=start, end=end, period=period, interval=interval)
+            if not df.empty:
+                results[symbol] = df
+        return results
+
+
+class YahooProvider(MarketDataProvider):
+    """Yahoo Finance through yfinance (auto-adjusted prices)."""
+
+    name = 'yahoo'
+
+    def __init__(self, timeout: int = 15):
+        self.timeout = timeout
+
+    def history(self, symbol, start=None, end=None, period=None, interval='1d'):
+        import yfinance as yf
+        ticker = yf.Ticker(symbol)
+        if period is not None:
+            return ticker.history(period=period, interval=interval, auto_adjust=True)
+        return ticker.history(start=start, end=end, interval=interval, auto_adjust=True)
+
+    def download(self, symbols, start=None, end=None, period=None, interval='1d'):
+        import yfinance as yf
+        kwargs = {'period': period} if period is not None else {'start': start, 'end': end}
+        df_bulk = yf.download(
+            list(symbols), interval=interval, auto_adjust=True, group_by='ticker',
+            threads=True, progress=False, timeout=self.timeout, **kwargs
+        )
+        if df_bulk.empty or not isinstance(df_bulk.columns, pd.MultiIndex):
+            return {}
+
+        results = {}
+        available = set(df_bulk.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in available:
+                continue
+            # Rows of the union calendar where this ticker did not trade are all-NaN
+            df = df_bulk[symbol].dropna(how='all')
+            if not df.empty:
+                results[symbol] = df
+        return results
+
+
+class FixtureProvider(MarketDataProvider):
+    """
+    Offline provider for benchmarks and regression runs.
+
+    Recorded bars are read from <root>/<interval>/<symbol>.parquet (or .csv).
+    Without a recording, a deterministic synthetic random walk is generated:
+    the same (symbol, interval, as_of) always yields the same bars.
+    """
+
+    name = 'fixture'
+
+    # Synthetic history origin per interval, relative to as_of
+    SYNTHETIC_SPAN = {
+        '1m': pd.Timedelta(days=31),
+        '1h': pd.Timedelta(days=730),
+        '1d': pd.Timedelta(days=365 * 27),
+    }
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        as_of: DateLike = None,
+        tz: str = 'America/New_York',
+        synthetic: bool = True,
+        daily_vol: float = 0.012
+    ):
+        """
+        Initialize FixtureProvider.
+
+        Args:
+            root: Directory of recorded bars (None = synthetic only)
+            as_of: Clock of the fixture world; bars never go past it (default: now)
+            tz: Timezone of the returned index
+            synthetic: Generate bars for symbols without a recording
+            daily_vol: Daily volatility of the synthetic random walk
+        """
+        self.root = Path(root) if root else None
+        self.tz = tz
+        self.as_of = pd.Timestamp(as_of) if as_of is not None else None
+        self.synthetic = synthetic
+        self.daily_vol = daily_vol
+
+    def _now(self) -> pd.Timestamp:
+        now = self.as_of if self.as_of is not None else pd.Timestamp.now()
+        return now.tz_localize(self.tz) if now.tz is None else now.tz_convert(self.tz)
+
+    def _fixture_path(self, symbol: str, interval: str, suffix: str) -> Path:
+        return self.root / interval / f"{symbol}{suffix}"
+
+    def record(self, symbol: str, df: pd.DataFrame, interval: str = '1d') -> Path:
+        """Save bars (e.g. fetched through YahooProvider) as a fixture."""
+        if self.root is None:
+            raise ValueError("Fixture root directory not configured")
+        path = self._fixture_path(symbol, interval, '.parquet')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df[[c for c in OHLCV_COLUMNS if c in df.columns]].to_parquet(path)
+        return path
+
+    def _load_recorded(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        if self.root is None:
+            return None
+        parquet = self._fixture_path(symbol, interval, '.parquet')
+        if parquet.exists():
+            return pd.read_parquet(parquet)
+        csv = self._fixture_path(symbol, interval, '.csv')
+        if csv.exists():
+            return pd.read_csv(csv, index_col=0, parse_dates=True)
+        return None
+
+    def _synthetic_index(self, interval: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+        """Trading calendar: weekdays for daily bars, Sun 18:00-Fri 17:00 ET for intraday."""
+        if interval == '1d':
+            return pd.bdate_range(start.normalize(), end, tz=self.tz, inclusive='left')
+        idx = pd.date_range(start.floor(INTERVAL_STEPS[interval]), end, freq=INTERVAL_STEPS[interval],
+                            tz=self.tz, inclusive='left')
+        hour, dow = idx.hour, idx.dayofweek
+        closed = (dow == 5) | ((dow == 6) & (hour < 18)) | ((dow == 4) & (hour >= 17)) | (hour == 17)
+        return idx[~closed]
+
+    def _synthetic(self, symbol: str, interval: str) -> pd.DataFrame:
+        now = self._now()
+        step = INTERVAL_STEPS[interval]
+        idx = self._synthetic_index(interval, now - self.SYNTHETIC_SPAN[interval], now + step)
+        idx = idx[idx <= now]
+
+        rng = np.random.default_rng([zlib.crc32(symbol.encode()), zlib.crc32(interval.encode())])
+        n = len(idx)
+        bars_per_day = pd.Timedelta(days=1) / step if interval != '1d' else 1.0
+        sigma = self.daily_vol / np.sqrt(min(bars_per_day, 23 * 60))
+        base = 50.0 + (zlib.crc32(symbol.encode()) % 20000)
+
+        log_close = np.log(base) + np.cumsum(rng.normal(0.0002 / bars_per_day, sigma, n))
+        close = np.exp(log_close)
+        prev_close = np.concatenate([[base], close[:-1]])
+        open_ = prev_close * np.exp(rng.normal(0, sigma * 0.2, n))
+        wick = np.abs(rng.normal(0, sigma * 0.5, (2, n)))
+        high = np.maximum(open_, close) * np.exp(wick[0])
+        low = np.minimum(open_, close) * np.exp(-wick[1])
+        volume = rng.integers(1_000, 100_000, n).astype(float)
+
+        return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, index=idx)
+
+    def history(self, symbol, start=None, end=None, period=None, interval='1d'):
+        if interval not in INTERVAL_STEPS:
+            raise ValueError(f"Unsupported interval: {interval}. Available: {list(INTERVAL_STEPS)}")
+
+        df = self._load_recorded(symbol, interval)
+        if df is None:
+            if not self.synthetic:
+                return pd.DataFrame(columns=OHLCV_COLUMNS)
+            df = self._synthetic(symbol, interval)
+        if df.empty:
+            return df
+
+        if df.index.tz is None:
+            df.index = df.index.tz_localize(self.tz)
+
+        if period is not None:
+            end_ts = df.index[-1] + INTERVAL_STEPS[interval]
+            if period == '1d':
+                # yfinance semantics: the latest session only
+                start_ts = df.index[-1].normalize()
+            elif interval == '1d' and re.fullmatch(r'\d+d', period):
+                # yfinance semantics: 'Nd' on daily bars means N trading days
+                return df.iloc[-int(period[:-1]):]
+            else:
+                start_ts = end_ts - period_to_timedelta(period)
+        else:
+            start_ts = _as_tz(start, df.index.tz) if start is not None else df.index[0]
+            end_ts = _as_tz(end, df.index.tz) if end is not None else df.index[-1] + INTERVAL_STEPS[interval]
+
+        return df[(df.index >= start_ts) & (df.index < end_ts)]
+
+
+def _as_tz(ts: DateLike, tz) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize(tz) if ts.tz is None else ts.tz_convert(tz)
+
+
+def get_provider(name: Optional[str] = None) -> MarketDataProvider:
+    """
+    Build the configured market data provider.
+
+    Args:
+        name: 'yahoo' or 'fixture' (default: $DOR_DATA_PROVIDER, else 'yahoo')
+
+    Returns:
+        MarketDataProvider instance
+    """
+    name = (name or os.environ.get('DOR_DATA_PROVIDER', 'yahoo')).lower()
+    if name == 'yahoo':
+        return YahooProvider()
+    if name == 'fixture':
+        return FixtureProvider(
+            root=os.environ.get('DOR_FIXTURE_DIR'),
+            as_of=os.environ.get('DOR_FIXTURE_AS_OF'),
+        )
+    raise ValueError(f"Unknown data provider: {name}. Available: ['yahoo', 'fixture']")
@@ -2,6 +2,20 @@
 Distributions Module
 """
 
-from .distribution_analyzer import DistributionAnalyzer, DistributionStats, NormalityTest, analyze_distribution
+from .distribution_analyzer import (
+    DistributionAnalyzer, DistributionStats, NormalityTest, analyze_distribution,
+    warm_distribution_cache, clear_distribution_cache, returns_fingerprint,
+)
+from .tables import (
+    bin_edges, bin_index, bin_counts, distribution_table, distribution_tables,
+    sigma_band_counts, sigma_band_tables,
+)
+from .prefix_moments import PrefixMoments, get_prefix_moments, clear_prefix_cache
 
-__all__ = ['DistributionAnalyzer', 'DistributionStats', 'NormalityTest', 'analyze_distribution']
+__all__ = [
+    'DistributionAnalyzer', 'DistributionStats', 'NormalityTest', 'analyze_distribution',
+    'warm_distribution_cache', 'clear_distribution_cache', 'returns_fingerprint',
+    'bin_edges', 'bin_index', 'bin_counts', 'distribution_table', 'distribution_tables',
+    'sigma_band_counts', 'sigma_band_tables',
+    'PrefixMoments', 'get_prefix_moments', 'clear_prefix_cache',
+]
@@ -3,13 +3,32 @@ Distribution Analyzer Module
 Analyzes the statistical distribution of financial returns.
 """
 
+import copy
+import hashlib
+import logging
 import pandas as pd
 import numpy as np
-from scipy import stats
-from typing import Dict, Tuple, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from scipy import stats, optimize, special
+from typing import Dict, Tuple, Optional, Any, Iterable
 from dataclasses import dataclass
 import warnings
 
+logger = logging.getLogger(__name__)
+
+# Memoized results keyed by a fingerprint of the returns (plus test settings)
+_FIT_CACHE: Dict[Tuple, Dict[str, Dict[str, Any]]] = {}
+_NORMALITY_CACHE: Dict[Tuple, Dict[str, 'NormalityTest']] = {}
+# Oldest entries are evicted beyond this many results per cache
+_CACHE_SIZE = 32
+
+
+def _cache_put(cache: Dict, key: Tuple, value: Any) -> None:
+    """Insert into a bounded cache, evicting the oldest entries."""
+    while len(cache) >= _CACHE_SIZE and key not in cache:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
 
 @dataclass
 class DistributionStats:
@@ -143,7 +162,11 @@ class DistributionAnalyzer:
             annualized_std=annualized_std,
         )
     
-    def test_normality(self, alpha: float = 0.05) -> Dict[str, NormalityTest]:
+    def _sample(self, max_samples: Optional[int]) -> np.ndarray:
+        """Returns as an array, or a reproducible random subsample of max_samples."""
+        return _subsample(self.returns.to_numpy(dtype=np.float64), max_samples)
+    
+    def test_normality(self, alpha: float = 0.05, max_samples: Optional[int] = None) -> Dict[str, NormalityTest]:
         """
         Perform multiple normality tests.
         
@@ -152,80 +175,27 @@ class DistributionAnalyzer:
         - Shapiro-Wilk: Most powerful for small samples
         - D'Agostino-Pearson: Omnibus test, good for larger samples
         
+        Results are memoized by a fingerprint of the returns.
+        
         Args:
             alpha: Significance level
+            max_samples: Bounded-cost mode for large (e.g. intraday) samples:
+                run every test on a reproducible random subsample of this size
             
         Returns:
             Dictionary of test results
         """
-        results = {}
-        n = len(self.returns)
-        
-        # Jarque-Bera Test
-        try:
-            jb_stat, jb_p = stats.jarque_bera(self.returns)
-            results['jarque_bera'] = NormalityTest(
-                test_name="Jarque-Bera",
-                statistic=jb_stat,
-                p_value=jb_p,
-                is_normal=jb_p > alpha,
-                interpretation=self._interpret_normality(jb_p, alpha)
-            )
-        except Exception as e:
-            warnings.warn(f"Jarque-Bera test failed: {e}")
-        
-        # Shapiro-Wilk Test (for n < 5000)
-        if n < 5000:
-            try:
-                sw_stat, sw_p = stats.shapiro(self.returns)
-                results['shapiro_wilk'] = NormalityTest(
-                    test_name="Shapiro-Wilk",
-                    statistic=sw_stat,
-                    p_value=sw_p,
-                    is_normal=sw_p > alpha,
-                    interpretation=self._interpret_normality(sw_p, alpha)
-                )
-            except Exception as e:
-                warnings.warn(f"Shapiro-Wilk test failed: {e}")
-        
-        # D'Agostino-Pearson Test (requires n >= 20)
-        if n >= 20:
-            try:
-                da_stat, da_p = stats.normaltest(self.returns)
-                results['dagostino_pearson'] = NormalityTest(
-                    test_name="D'Agostino-Pearson",
-                    statistic=da_stat,
-                    p_value=da_p,
-                    is_normal=da_p > alpha,
-                    interpretation=self._interpret_normality(da_p, alpha)
-                )
-            except Exception as e:
-                warnings.warn(f"D'Agostino-Pearson test failed: {e}")
-        
-        # Anderson-Darling Test
-        try:
-            ad_result = stats.anderson(self.returns, dist='norm')
-            # Use 5% significance level
-            idx = list(ad_result.significance_level).index(5.0)
-            is_normal = ad_result.statistic < ad_result.critical_values[idx]
-            results['anderson_darling'] = NormalityTest(
-                test_name="Anderson-Darling",
-                statistic=ad_result.statistic,
-                p_value=np.nan,  # AD test doesn't provide p-value directly
-                is_normal=is_normal,
-                interpretation=f"Statistic {ad_result.statistic:.4f} vs critical value {ad_result.critical_values[idx]:.4f} at 5%"
-            )
-        except Exception as e:
-            warnings.warn(f"Anderson-Darling test failed: {e}")
-        
-        return results
+        x = self._sample(max_samples)
+        key = (returns_fingerprint(x), alpha, len(self.returns))
+        cached = _NORMALITY_CACHE.get(key)
+        if cached is None:
+            cached = _test_normality(x, alpha, len(self.returns))
+            _cache_put(_NORMALITY_CACHE, key, cached)
+        return copy.deepcopy(cached)
     
     def _interpret_normality(self, p_value: float, alpha: float) -> str:
         """Interpret normality test p-value."""
-        if p_value > alpha:
-            return f"Cannot reject normality (p={p_value:.4f} > α={alpha})"
-        else:
-            return f"Reject normality (p={p_value:.4f} ≤ α={alpha})"
+        return _interpret_normality(p_value, alpha)
     
     def compute_var(
         self,
@@ -282,49 +252,29 @@ class DistributionAnalyzer:
         
         return self.returns.mean() + z_cf * self.returns.std()
     
-    def fit_distributions(self) -> Dict[str, Dict[str, Any]]:
+    def fit_distributions(self, max_samples: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
         """
         Fit various distributions to the return data.
         
+        MLE fits start from moment-based guesses (scipy's defaults for
+        degenerate samples) and are memoized by a fingerprint of the returns.
+        The starting values can move the fitted parameters slightly versus
+        scipy's default start.
+        
+        Args:
+            max_samples: Fit on a reproducible random subsample of this size
+                (bounded cost for large intraday samples)
+        
         Returns:
             Dictionary with fitted distribution parameters and goodness-of-fit
         """
-        results = {}
-        
-        # Normal distribution
-        norm_params = stats.norm.fit(self.returns)
-        norm_ks = stats.kstest(self.returns, 'norm', args=norm_params)
-        results['normal'] = {
-            'params': {'loc': norm_params[0], 'scale': norm_params[1]},
-            'ks_statistic': norm_ks.statistic,
-            'ks_pvalue': norm_ks.pvalue
-        }
-        
-        # Student's t distribution (better for fat tails)
-        try:
-            t_params = stats.t.fit(self.returns)
-            t_ks = stats.kstest(self.returns, 't', args=t_params)
-            results['student_t'] = {
-                'params': {'df': t_params[0], 'loc': t_params[1], 'scale': t_params[2]},
-                'ks_statistic': t_ks.statistic,
-                'ks_pvalue': t_ks.pvalue
-            }
-        except Exception as e:
-            warnings.warn(f"Student's t fit failed: {e}")
-        
-        # Generalized Error Distribution (for heavy tails)
-        try:
-            gennorm_params = stats.gennorm.fit(self.returns)
-            gennorm_ks = stats.kstest(self.returns, 'gennorm', args=gennorm_params)
-            results['generalized_normal'] = {
-                'params': {'beta': gennorm_params[0], 'loc': gennorm_params[1], 'scale': gennorm_params[2]},
-                'ks_statistic': gennorm_ks.statistic,
-                'ks_pvalue': gennorm_ks.pvalue
-            }
-        except Exception as e:
-            warnings.warn(f"Generalized normal fit failed: {e}")
-        
-        return results
+        x = self._sample(max_samples)
+        key = (returns_fingerprint(x),)
+        cached = _FIT_CACHE.get(key)
+        if cached is None:
+            cached = _fit_distributions(x)
+            _cache_put(_FIT_CACHE, key, cached)
+        return copy.deepcopy(cached)
     
     def get_tail_analysis(self) -> Dict[str, Any]:
         """
@@ -381,6 +331,261 @@ class DistributionAnalyzer:
             return f"Approximately symmetric (s={skewness:.2f})."
 
 
+def returns_fingerprint(values: np.ndarray) -> str:
+    """Stable fingerprint of a returns array (cache key)."""
+    return hashlib.blake2b(np.ascontiguousarray(values, dtype=np.float64).tobytes(), digest_size=12).hexdigest()
+
+
+def _subsample(x: np.ndarray, max_samples: Optional[int]) -> np.ndarray:
+    """Reproducible random subsample (seeded by the data, original order kept)."""
+    if max_samples is None or len(x) <= max_samples:
+        return x
+    seed = int(returns_fingerprint(x)[:8], 16)
+    idx = np.sort(np.random.default_rng(seed).choice(len(x), max_samples, replace=False))
+    return x[idx]
+
+
+def _interpret_normality(p_value: float, alpha: float) -> str:
+    """Interpret normality test p-value."""
+    if p_value > alpha:
+        return f"Cannot reject normality (p={p_value:.4f} > α={alpha})"
+    else:
+        return f"Reject normality (p={p_value:.4f} ≤ α={alpha})"
+
+
+def _ged_kurtosis(beta: float) -> float:
+    """Excess kurtosis of the generalized normal distribution."""
+    return np.exp(special.gammaln(5 / beta) + special.gammaln(1 / beta) - 2 * special.gammaln(3 / beta)) - 3
+
+
+def _moment_guesses(x: np.ndarray) -> Optional[Dict[str, float]]:
+    """
+    Method-of-moments starting values for the MLE fits.
+    
+    Student-t: excess kurtosis = 6 / (df - 4); GED: kurtosis solved for beta.
+    Scales are set so the guessed variance equals the sample variance.
+    Returns None for degenerate samples (zero variance, undefined kurtosis),
+    where the fits fall back to scipy's default starting values.
+    """
+    mean, std = x.mean(), x.std()
+    if not std > 0:
+        return None
+    kurt = stats.kurtosis(x)
+    if not np.isfinite(kurt):
+        return None
+    
+    df = 4 + 6 / kurt if kurt > 0.06 else 100.0
+    t_scale = std * np.sqrt((df - 2) / df)
+    
+    # GED kurtosis decreases in beta: 3 at beta=1 (Laplace), 0 at beta=2 (normal)
+    lo, hi = 0.3, 20.0
+    target = np.clip(kurt, _ged_kurtosis(hi) + 1e-9, _ged_kurtosis(lo) - 1e-9)
+    beta = optimize.brentq(lambda b: _ged_kurtosis(b) - target, lo, hi)
+    ged_scale = std * np.exp(0.5 * (special.gammaln(1 / beta) - special.gammaln(3 / beta)))
+    
+    return {'loc': mean, 'df': df, 't_scale': t_scale, 'beta': beta, 'ged_scale': ged_scale}
+
+
+def _fit_distributions(x: np.ndarray) -> Dict[str, Dict[str, Any]]:
+    """
+    Fit normal, Student-t and GED to one sample (see DistributionAnalyzer.fit_distributions).
+    
+    Args:
+        x: Returns
+        
+    Returns:
+        Dictionary with fitted distribution parameters and goodness-of-fit
+    """
+    results = {}
+    guesses = _moment_guesses(x)
+    
+    # Normal distribution
+    norm_params = stats.norm.fit(x)
+    norm_ks = stats.kstest(x, 'norm', args=norm_params)
+    results['normal'] = {
+        'params': {'loc': norm_params[0], 'scale': norm_params[1]},
+        'ks_statistic': norm_ks.statistic,
+        'ks_pvalue': norm_ks.pvalue
+    }
+    
+    # Student's t distribution (better for fat tails)
+    try:
+        if guesses:
+            t_params = stats.t.fit(x, guesses['df'], loc=guesses['loc'], scale=guesses['t_scale'])
+        else:
+            t_params = stats.t.fit(x)
+        t_ks = stats.kstest(x, 't', args=t_params)
+        results['student_t'] = {
+            'params': {'df': t_params[0], 'loc': t_params[1], 'scale': t_params[2]},
+            'ks_statistic': t_ks.statistic,
+            'ks_pvalue': t_ks.pvalue
+        }
+    except Exception as e:
+        warnings.warn(f"Student's t fit failed: {e}")
+    
+    # Generalized Error Distribution (for heavy tails)
+    try:
+        if guesses:
+            gennorm_params = stats.gennorm.fit(x, guesses['beta'], loc=guesses['loc'], scale=guesses['ged_scale'])
+        else:
+            gennorm_params = stats.gennorm.fit(x)
+        gennorm_ks = stats.kstest(x, 'gennorm', args=gennorm_params)
+        results['generalized_normal'] = {
+            'params': {'beta': gennorm_params[0], 'loc': gennorm_params[1], 'scale': gennorm_params[2]},
+            'ks_statistic': gennorm_ks.statistic,
+            'ks_pvalue': gennorm_ks.pvalue
+        }
+    except Exception as e:
+        warnings.warn(f"Generalized normal fit failed: {e}")
+    
+    return results
+
+
+def _test_normality(x: np.ndarray, alpha: float, n_total: int) -> Dict[str, NormalityTest]:
+    """
+    Normality tests of one sample (see DistributionAnalyzer.test_normality).
+    
+    Args:
+        x: Returns (possibly a subsample)
+        alpha: Significance level
+        n_total: Size of the full sample (noted when x is a subsample)
+        
+    Returns:
+        Dictionary of test results
+    """
+    results = {}
+    n = len(x)
+    note = f" [subsample of {n} from {n_total}]" if n < n_total else ""
+    
+    # Jarque-Bera Test
+    try:
+        jb_stat, jb_p = stats.jarque_bera(x)
+        results['jarque_bera'] = NormalityTest(
+            test_name="Jarque-Bera",
+            statistic=jb_stat,
+            p_value=jb_p,
+            is_normal=jb_p > alpha,
+            interpretation=_interpret_normality(jb_p, alpha) + note
+        )
+    except Exception as e:
+        warnings.warn(f"Jarque-Bera test failed: {e}")
+    
+    # Shapiro-Wilk Test (for n < 5000)
+    if n < 5000:
+        try:
+            sw_stat, sw_p = stats.shapiro(x)
+            results['shapiro_wilk'] = NormalityTest(
+                test_name="Shapiro-Wilk",
+                statistic=sw_stat,
+                p_value=sw_p,
+                is_normal=sw_p > alpha,
+                interpretation=_interpret_normality(sw_p, alpha) + note
+            )
+        except Exception as e:
+            warnings.warn(f"Shapiro-Wilk test failed: {e}")
+    
+    # D'Agostino-Pearson Test (requires n >= 20)
+    if n >= 20:
+        try:
+            da_stat, da_p = stats.normaltest(x)
+            results['dagostino_pearson'] = NormalityTest(
+                test_name="D'Agostino-Pearson",
+                statistic=da_stat,
+                p_value=da_p,
+                is_normal=da_p > alpha,
+                interpretation=_interpret_normality(da_p, alpha) + note
+            )
+        except Exception as e:
+            warnings.warn(f"D'Agostino-Pearson test failed: {e}")
+    
+    # Anderson-Darling Test
+    try:
+        ad_result = stats.anderson(x, dist='norm')
+        # Use 5% significance level
+        idx = list(ad_result.significance_level).index(5.0)
+        is_normal = ad_result.statistic < ad_result.critical_values[idx]
+        results['anderson_darling'] = NormalityTest(
+            test_name="Anderson-Darling",
+            statistic=ad_result.statistic,
+            p_value=np.nan,  # AD test doesn't provide p-value directly
+            is_normal=is_normal,
+            interpretation=f"Statistic {ad_result.statistic:.4f} vs critical value {ad_result.critical_values[idx]:.4f} at 5%" + note
+        )
+    except Exception as e:
+        warnings.warn(f"Anderson-Darling test failed: {e}")
+    
+    return results
+
+
+def _analyze_job(job):
+    """Process pool worker: (key, x, n_total, alpha, fits, normality)."""
+    key, x, n_total, alpha, fits, normality = job
+    return (key,
+            _fit_distributions(x) if fits else None,
+            _test_normality(x, alpha, n_total) if normality else None)
+
+
+def warm_distribution_cache(
+    samples: Iterable[pd.Series],
+    alpha: float = 0.05,
+    max_samples: Optional[int] = None,
+    fits: bool = True,
+    normality: bool = True,
+    max_workers: Optional[int] = None
+) -> None:
+    """
+    Compute fits and normality tests of many return series in a process pool.
+    
+    Results land in the same cache DistributionAnalyzer reads, so the
+    following fit_distributions / test_normality calls on these series
+    (e.g. every timeframe of every asset) are cache hits. Each cache keeps
+    the newest _CACHE_SIZE results, so warm at most that many series at once.
+    
+    Args:
+        samples: Return series (NaN dropped as in DistributionAnalyzer)
+        alpha: Significance level of the normality tests
+        max_samples: Bounded-cost subsample size (see test_normality)
+        fits: Whether to fit distributions
+        normality: Whether to run normality tests
+        max_workers: Pool size (1 = run in this process)
+    """
+    jobs = {}
+    for returns in samples:
+        full = returns.dropna().to_numpy(dtype=np.float64)
+        x = _subsample(full, max_samples)
+        key = returns_fingerprint(x)
+        need_fit = fits and (key,) not in _FIT_CACHE
+        need_norm = normality and (key, alpha, len(full)) not in _NORMALITY_CACHE
+        if need_fit or need_norm:
+            jobs[key] = (key, x, len(full), alpha, need_fit, need_norm)
+    
+    def store(result):
+        key, fitted, tests = result
+        if fitted is not None:
+            _cache_put(_FIT_CACHE, (key,), fitted)
+        if tests is not None:
+            _cache_put(_NORMALITY_CACHE, (key, alpha, jobs[key][2]), tests)
+    
+    if max_workers == 1 or len(jobs) <= 1:
+        for job in jobs.values():
+            store(_analyze_job(job))
+        return
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {key: pool.submit(_analyze_job, job) for key, job in jobs.items()}
+        for key, future in futures.items():
+            try:
+                store(future.result())
+            except Exception as e:
+                logger.warning(f"Distribution analysis failed for sample {key}: {e}")
+
+
+def clear_distribution_cache() -> None:
+    """Drop every memoized fit and normality test."""
+    _FIT_CACHE.clear()
+    _NORMALITY_CACHE.clear()
+
+
 def analyze_distribution(
     returns: pd.Series,
     periods_per_year: float = 252
@@ -0,0 +1,202 @@
+"""
+Prefix Moments Module
+O(1) window statistics of a return series from cumulative power sums.
+
+For a series x the store keeps the prefix sums of (x - c)^p for p = 0..4
+(c = full-sample mean, which keeps the sums well conditioned). The count,
+mean, std, skewness and kurtosis of any [start, end] window then come from
+five subtractions, so a start-year x end-year stability grid costs one
+vectorized pass instead of one slice-and-describe per window:
+
+    S_p[start, end] = P_p[j] - P_p[i]        P_p = [0, cumsum((x - c)^p)]
+
+Skewness and kurtosis are the bias-corrected estimators of pandas
+Series.skew() / Series.kurtosis(). Quantiles are not prefix-decomposable:
+they select the needed order statistics of the window slice with
+np.partition, O(window length) per query rather than a full-series pass.
+"""
+
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data.calendar_index import data_version
+from .distribution_analyzer import returns_fingerprint
+
+_CACHE: Dict[Tuple[str, str, str, str], 'PrefixMoments'] = {}
+
+DateLike = Union[str, pd.Timestamp, None]
+
+
+class PrefixMoments:
+    """
+    Cumulative-moment store of one return series.
+
+    Windows are given as dates (inclusive on both ends, None = open end).
+    """
+
+    def __init__(self, returns: pd.Series):
+        """
+        Initialize PrefixMoments.
+
+        Args:
+            returns: Return series with a sorted DatetimeIndex (NaN dropped)
+        """
+        returns = returns.dropna()
+        self.index = returns.index
+        self.values = returns.to_numpy(dtype=np.float64)
+        self.center = float(self.values.mean()) if len(self.values) else 0.0
+
+        d = self.values - self.center
+        powers = np.vstack([np.ones_like(d), d, d ** 2, d ** 3, d ** 4])
+        self.prefix = np.hstack([np.zeros((5, 1)), np.cumsum(powers, axis=1)])
+
+    def positions(self, start: DateLike = None, end: DateLike = None) -> Tuple[int, int]:
+        """Half-open position range [i, j) of the dates start..end (inclusive)."""
+        i = 0 if start is None else int(self.index.searchsorted(pd.Timestamp(start), side='left'))
+        j = len(self.index) if end is None else int(self.index.searchsorted(pd.Timestamp(end), side='right'))
+        return i, max(i, j)
+
+    def window_stats(self, starts: Sequence[DateLike], ends: Sequence[DateLike]) -> pd.DataFrame:
+        """
+        Moments of many windows at once.
+
+        Args:
+            starts: Window start dates
+            ends: Window end dates (same length as starts)
+
+        Returns:
+            DataFrame (one row per window) with start, end, count, mean,
+            std, skew, kurtosis, sum
+        """
+        bounds = np.array([self.positions(s, e) for s, e in zip(starts, ends)], dtype=np.int64).reshape(-1, 2)
+        sums = self.prefix[:, bounds[:, 1]] - self.prefix[:, bounds[:, 0]]
+        n = sums[0]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            a = sums[1] / n
+            b = sums[2] / n
+            c = sums[3] / n
+            d = sums[4] / n
+            # Biased central moments from raw moments about the center
+            m2 = np.maximum(b - a * a, 0.0)
+            m3 = c - 3 * a * b + 2 * a ** 3
+            m4 = d - 4 * a * c + 6 * a * a * b - 3 * a ** 4
+
+            var = m2 * n / (n - 1)
+            skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+            kurt = ((n + 1) * n * (n - 1) * (n * m4) / ((n - 2) * (n - 3) * (n * m2) ** 2)
+                    - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+
+        return pd.DataFrame({
+            'start': list(starts),
+            'end': list(ends),
+            'count': n.astype(np.int64),
+            'mean': np.where(n > 0, a + self.center, np.nan),
+            'std': np.where(n > 1, np.sqrt(var), np.nan),
+            'skew': np.where((n > 2) & (m2 > 0), skew, np.nan),
+            'kurtosis': np.where((n > 3) & (m2 > 0), kurt, np.nan),
+            'sum': sums[1] + n * self.center,
+        })
+
+    def stats(self, start: DateLike = None, end: DateLike = None) -> Dict[str, float]:
+        """Moments of one window (see window_stats)."""
+        row = self.window_stats([start], [end]).iloc[0]
+        return {k: row[k] for k in ['count', 'mean', 'std', 'skew', 'kurtosis', 'sum']}
+
+    def sigma_thresholds(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        sigmas: Sequence[float] = (1, 1.5, 2)
+    ) -> pd.DataFrame:
+        """
+        mean +/- k * std of a window.
+
+        Returns:
+            DataFrame indexed by sigma with lower and upper
+        """
+        s = self.stats(start, end)
+        k = np.asarray(sigmas, dtype=np.float64)
+        return pd.DataFrame({'lower': s['mean'] - k * s['std'], 'upper': s['mean'] + k * s['std']},
+                            index=pd.Index(list(sigmas), name='sigma'))
+
+    def window_sorted(self, start: DateLike = None, end: DateLike = None) -> np.ndarray:
+        """Values of a window in ascending order (sorts the window slice only)."""
+        i, j = self.positions(start, end)
+        return np.sort(self.values[i:j])
+
+    def quantiles(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        q: Sequence[float] = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+    ) -> pd.Series:
+        """
+        Quantiles of a window (linear interpolation, as np.percentile).
+
+        Only the bracketing order statistics are selected (np.partition on
+        the window slice), so one call is O(window length), not O(N log N).
+
+        Returns:
+            Series indexed by q (NaN for empty windows)
+        """
+        i, j = self.positions(start, end)
+        q = np.asarray(q, dtype=np.float64)
+        if j == i:
+            return pd.Series(np.nan, index=q)
+        pos = q * (j - i - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, j - i - 1)
+        x = np.partition(self.values[i:j], np.unique(np.concatenate([lo, hi])))
+        return pd.Series(x[lo] + (x[hi] - x[lo]) * (pos - lo), index=q)
+
+    def stability_grid(
+        self,
+        start_years: Sequence[int],
+        end_years: Sequence[int],
+        stat: str = 'mean'
+    ) -> pd.DataFrame:
+        """
+        One statistic for every start year x end year window.
+
+        Args:
+            start_years: First calendar year of each window
+            end_years: Last calendar year of each window (inclusive)
+            stat: Column of window_stats (mean, std, skew, kurtosis, count, sum)
+
+        Returns:
+            DataFrame (start_year x end_year); NaN where end < start
+        """
+        pairs = [(s, e) for s in start_years for e in end_years]
+        table = self.window_stats([f'{s}-01-01' for s, _ in pairs], [f'{e}-12-31' for _, e in pairs])
+        values = np.where([e >= s for s, e in pairs], table[stat].to_numpy(dtype=np.float64), np.nan)
+        return pd.DataFrame(values.reshape(len(start_years), len(end_years)),
+                            index=pd.Index(list(start_years), name='start_year'),
+                            columns=pd.Index(list(end_years), name='end_year'))
+
+
+def get_prefix_moments(returns: pd.Series, asset_key: str = '', timeframe: str = '') -> PrefixMoments:
+    """
+    Cached PrefixMoments, keyed by (asset, timeframe, index and values fingerprints).
+
+    Args:
+        returns: Return series
+        asset_key: Asset identifier
+        timeframe: Timeframe label (e.g. 'daily')
+
+    Returns:
+        PrefixMoments instance (treat as read-only)
+    """
+    key = (asset_key, timeframe, data_version(returns.index), returns_fingerprint(returns.to_numpy()))
+    store = _CACHE.get(key)
+    if store is None:
+        store = PrefixMoments(returns)
+        _CACHE[key] = store
+    return store
+
+
+def clear_prefix_cache() -> None:
+    """Drop every cached prefix-moment store."""
+    _CACHE.clear()
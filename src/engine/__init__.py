@@ -0,0 +1,8 @@
+"""
+Engine Module
+Incremental signal layers shared by the API and the live monitor.
+"""
+
+from .signal_engine import SignalEngine, AssetState, layers_from_arrays, fractal_mode, get_grade
+
+__all__ = ['SignalEngine', 'AssetState', 'layers_from_arrays', 'fractal_mode', 'get_grade']
@@ -2,15 +2,12 @@ import pandas as pd
 from datetime import datetime, timedelta
 from src.engine.alpha_constants import (
     WEEKLY_SEASONAL,
-    MONTHLY_BIAS,
-    WEEKLY_ALPHA_MATRIX,
-    W2_MONTHLY,
-    DAILY_ALPHA_TRIGGERS,
-    WEEKLY_BIAS_TRIGGERS,
-    SIGMA_UPPER,
-    SIGMA_LOWER,
     WEEKLY_SEASONAL_D3,
 )
+from src.engine.signal_engine import SignalEngine, fractal_mode, get_grade
+
+# Month / week state of every asset, updated incrementally from each cycle's daily history
+ENGINE = SignalEngine()
 
 
 class AlphaBrain:
@@ -80,11 +77,18 @@ class AlphaBrain:
     def calculate_state(cls, asset_key, market_data):
         if asset_key not in cls.ALPHAS: return None
 
-        # 1. Monthly Layer (Strategic) - Returns list of signals
-        monthly_signals = cls._calculate_monthly_layer(asset_key, market_data['monthly_history'])
+        # Only the bars since the last cycle are applied to the engine state
+        history_df = market_data.get('monthly_history')
+        with ENGINE.lock:
+            if history_df is not None and not history_df.empty:
+                ENGINE.sync(asset_key, history_df)
+            state = ENGINE.state(asset_key)
+
+            # 1. Monthly Layer (Strategic) - Returns list of signals
+            monthly_signals = cls._calculate_monthly_layer(asset_key, state)
 
-        # 2. Weekly Layer (Tactical)
-        weekly_bias = cls._calculate_weekly_layer(asset_key, market_data['weekly_history'])
+            # 2. Weekly Layer (Tactical)
+            weekly_bias = cls._calculate_weekly_layer(asset_key, state)
 
         # 3. Daily Layer (Execution)
         daily_trigger = cls._calculate_daily_layer(asset_key, market_data['live_o2c'])
@@ -101,40 +105,34 @@ class AlphaBrain:
         }
 
     @classmethod
-    def _calculate_monthly_layer(cls, asset_key, history_df):
+    def _calculate_monthly_layer(cls, asset_key, state):
         """
         Evaluates Monthly Structure and returns multiple distinct objectives.
         Checks if objectives (New Low/High) have already been met.
+        The month is the one of the last data bar (SignalEngine state).
         """
-        if history_df is None or history_df.empty:
+        if state is None or state.last_bar is None:
             return []
 
-        now = datetime.now()
-        current_month = now.month
-        
-        try:
-            current_month_df = history_df[history_df.index.month == current_month]
-        except AttributeError:
-             return []
+        current_month = state.last_date.month
 
-        if current_month_df.empty or now.day <= 13:
+        if state.last_date.day <= 13:
              return [] # Forming...
 
-        # Get data up to Day 13 (Signal Lock)
-        w1_w2_df = current_month_df[current_month_df.index.day <= 13]
-        if len(w1_w2_df) < 5: return []
+        # Data up to Day 13 (Signal Lock)
+        if state.w2_count < 5: return []
 
-        range_high = w1_w2_df['High'].max()
-        range_low = w1_w2_df['Low'].min()
-        w2_close = w1_w2_df['Close'].iloc[-1]
+        range_high = state.w2_high
+        range_low = state.w2_low
+        w2_close = state.w2_close
         rng = range_high - range_low
         if rng == 0: return []
         
         pos = (w2_close - range_low) / rng
         
         # Determine Current Status (Fulfillment Check)
-        current_low = current_month_df['Low'].min()
-        current_high = current_month_df['High'].max()
+        current_low = state.month_low
+        current_high = state.month_high
         
         # Check if we broke the W1-W2 range
         broke_low = current_low < range_low
@@ -202,48 +200,28 @@ class AlphaBrain:
         return signals
 
     # _calculate_weekly_layer and _calculate_daily_layer remain identical to v5.0
-    @staticmethod
-    def get_grade(p):
-        if p >= 90: return 'DIAMOND'
-        if p >= 82: return 'GOLD+'
-        if p >= 75: return 'GOLD'
-        return 'SILVER'
+    get_grade = staticmethod(get_grade)
 
     @classmethod
-    def _calculate_weekly_layer(cls, asset_key, history_df):
-        if history_df is None or history_df.empty: 
+    def _calculate_weekly_layer(cls, asset_key, state):
+        if state is None or state.last_bar is None: 
             return {'status': 'NO DATA', 'prob': 0.0, 'color': 'GRAY', 'grade': 'NOISE'}
             
-        now = datetime.now()
-        current_year = now.year
-        current_month = now.month
-        current_week = now.isocalendar()[1]
+        current_month = state.last_date.month
         
-        # Filter for current week's data
-        # Note: history_df usually contains daily bars.
-        week_df = history_df[(history_df.index.isocalendar().week == current_week) & (history_df.index.isocalendar().year == current_year)]
+        # Current ISO week's bars (week of the last data bar)
+        week_bars = state.week_bars
         
         # --- PRIORITY 1: D2/D3 FRACTAL SIGNAL ---
         # D2: Tue 18:00 EST (23:00 UTC) up to Wed 16:30 EST (21:30 UTC)
         # D3: Wed 16:30 EST (21:30 UTC) onwards
-        now_utc = datetime.utcnow()
-        show_d2, show_d3 = False, False
-        
-        if now_utc.weekday() > 2: # Thu, Fri, Sat, Sun
-            show_d3 = True
-        elif now_utc.weekday() == 2: # Wednesday (2)
-            if now_utc.hour > 21 or (now_utc.hour == 21 and now_utc.minute >= 30):
-                show_d3 = True
-            else:
-                show_d2 = True
-        elif now_utc.weekday() == 1: # Tuesday (1)
-            if now_utc.hour >= 23:
-                show_d2 = True
+        mode = fractal_mode()
+        show_d2, show_d3 = mode == 'd2', mode == 'd3'
                 
         if show_d2 or show_d3:
             try:
-                if not week_df.empty:
-                    if show_d3 and len(week_df) >= 3:
+                if week_bars:
+                    if show_d3 and len(week_bars) >= 3:
                         # D3 Logic
                         prefix_target = ""
                         dataset = WEEKLY_SEASONAL_D3.get(asset_key, {}).get(current_month, None)
@@ -254,10 +232,7 @@ class AlphaBrain:
                         dataset = WEEKLY_SEASONAL.get(asset_key, {}).get(current_month, None)
                         d_end = 2
                         
-                    base_df = week_df.iloc[:d_end]
-                    hi = float(base_df['High'].max())
-                    lo = float(base_df['Low'].min())
-                    curr_close = float(base_df['Close'].iloc[-1])
+                    hi, lo, curr_close = state.week_range(min(d_end, len(week_bars)))
                     
                     rng = hi - lo
                     if rng > 0:
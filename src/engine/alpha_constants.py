@@ -1,5 +1,132 @@
 
+# ============================================================
+# AUDITED PROBABILITY TABLES
+# EVERY number here MUST have a source in the repo
+# Single source for the API (api/index.py) and the live monitor (AlphaBrain)
+# ============================================================
+
+# Source: output/charts/strategy/W2/ (complete 12-month matrices)
+# Based on 2000-2026 History | * = >80% Win Rate
+W2_MONTHLY = {
+    'NQ': {
+        1:  {'bull': {'prob_green': 78, 'prob_high': 89}, 'bear': {'prob_red': 75, 'prob_low': 88}},
+        2:  {'bull': {'prob_green': 67, 'prob_high': 87}, 'bear': {'prob_red': 91, 'prob_low': 55}},
+        3:  {'bull': {'prob_green': 91, 'prob_high': 82}, 'bear': {'prob_red': 57, 'prob_low': 86}},
+        4:  {'bull': {'prob_green': 86, 'prob_high': 71}, 'bear': {'prob_red': 64, 'prob_low': 73}},
+        5:  {'bull': {'prob_green': 92, 'prob_high': 92}, 'bear': {'prob_red': 62, 'prob_low': 62}},
+        6:  {'bull': {'prob_green': 92, 'prob_high': 83}, 'bear': {'prob_red': 69, 'prob_low': 85}},
+        7:  {'bull': {'prob_green': 84, 'prob_high': 89}, 'bear': {'prob_red': 50, 'prob_low': 67}},
+        8:  {'bull': {'prob_green': 71, 'prob_high': 86}, 'bear': {'prob_red': 64, 'prob_low': 64}},
+        9:  {'bull': {'prob_green': 77, 'prob_high': 85}, 'bear': {'prob_red': 85, 'prob_low': 85}},
+        10: {'bull': {'prob_green': 75, 'prob_high': 94}, 'bear': {'prob_red': 60, 'prob_low': 50}},
+        11: {'bull': {'prob_green': 94, 'prob_high': 88}, 'bear': {'prob_red': 60, 'prob_low': 90}},
+        12: {'bull': {'prob_green': 85, 'prob_high': 85}, 'bear': {'prob_red': 77, 'prob_low': 85}},
+    },
+    'ES': {
+        1:  {'bull': {'prob_green': 67, 'prob_high': 83}, 'bear': {'prob_red': 75, 'prob_low': 88}},
+        2:  {'bull': {'prob_green': 80, 'prob_high': 80}, 'bear': {'prob_red': 82, 'prob_low': 55}},
+        3:  {'bull': {'prob_green': 91, 'prob_high': 100}, 'bear': {'prob_red': 64, 'prob_low': 79}},
+        4:  {'bull': {'prob_green': 79, 'prob_high': 79}, 'bear': {'prob_red': 36, 'prob_low': 64}},
+        5:  {'bull': {'prob_green': 92, 'prob_high': 77}, 'bear': {'prob_red': 50, 'prob_low': 67}},
+        6:  {'bull': {'prob_green': 73, 'prob_high': 87}, 'bear': {'prob_red': 70, 'prob_low': 80}},
+        7:  {'bull': {'prob_green': 80, 'prob_high': 90}, 'bear': {'prob_red': 80, 'prob_low': 80}},
+        8:  {'bull': {'prob_green': 73, 'prob_high': 87}, 'bear': {'prob_red': 60, 'prob_low': 70}},
+        9:  {'bull': {'prob_green': 85, 'prob_high': 85}, 'bear': {'prob_red': 85, 'prob_low': 85}},
+        10: {'bull': {'prob_green': 75, 'prob_high': 88}, 'bear': {'prob_red': 60, 'prob_low': 60}},
+        11: {'bull': {'prob_green': 88, 'prob_high': 82}, 'bear': {'prob_red': 56, 'prob_low': 100}},
+        12: {'bull': {'prob_green': 100, 'prob_high': 85}, 'bear': {'prob_red': 54, 'prob_low': 85}},
+    },
+    'YM': {
+        1:  {'bull': {'prob_green': 59, 'prob_high': 76}, 'bear': {'prob_red': 70, 'prob_low': 90}},
+        2:  {'bull': {'prob_green': 81, 'prob_high': 75}, 'bear': {'prob_red': 73, 'prob_low': 64}},
+        3:  {'bull': {'prob_green': 83, 'prob_high': 92}, 'bear': {'prob_red': 57, 'prob_low': 57}},
+        4:  {'bull': {'prob_green': 85, 'prob_high': 85}, 'bear': {'prob_red': 38, 'prob_low': 54}},
+        5:  {'bull': {'prob_green': 85, 'prob_high': 85}, 'bear': {'prob_red': 62, 'prob_low': 77}},
+        6:  {'bull': {'prob_green': 64, 'prob_high': 82}, 'bear': {'prob_red': 73, 'prob_low': 73}},
+        7:  {'bull': {'prob_green': 85, 'prob_high': 95}, 'bear': {'prob_red': 33, 'prob_low': 83}},
+        8:  {'bull': {'prob_green': 64, 'prob_high': 86}, 'bear': {'prob_red': 58, 'prob_low': 67}},
+        9:  {'bull': {'prob_green': 71, 'prob_high': 71}, 'bear': {'prob_red': 83, 'prob_low': 83}},
+        10: {'bull': {'prob_green': 82, 'prob_high': 94}, 'bear': {'prob_red': 67, 'prob_low': 67}},
+        11: {'bull': {'prob_green': 100, 'prob_high': 87}, 'bear': {'prob_red': 64, 'prob_low': 100}},
+        12: {'bull': {'prob_green': 94, 'prob_high': 88}, 'bear': {'prob_red': 80, 'prob_low': 80}},
+    },
+    'GC': {
+        1:  {'bull': {'prob_green': 79, 'prob_high': 84}, 'bear': {'prob_red': 71, 'prob_low': 71}},
+        2:  {'bull': {'prob_green': 81, 'prob_high': 75}, 'bear': {'prob_red': 80, 'prob_low': 90}},
+        3:  {'bull': {'prob_green': 36, 'prob_high': 71}, 'bear': {'prob_red': 55, 'prob_low': 64}},
+        4:  {'bull': {'prob_green': 74, 'prob_high': 74}, 'bear': {'prob_red': 67, 'prob_low': 83}},
+        5:  {'bull': {'prob_green': 80, 'prob_high': 67}, 'bear': {'prob_red': 80, 'prob_low': 80}},
+        6:  {'bull': {'prob_green': 64, 'prob_high': 73}, 'bear': {'prob_red': 79, 'prob_low': 64}},
+        7:  {'bull': {'prob_green': 67, 'prob_high': 89}, 'bear': {'prob_red': 57, 'prob_low': 86}},
+        8:  {'bull': {'prob_green': 94, 'prob_high': 67}, 'bear': {'prob_red': 100, 'prob_low': 86}},
+        9:  {'bull': {'prob_green': 73, 'prob_high': 73}, 'bear': {'prob_red': 67, 'prob_low': 60}},
+        10: {'bull': {'prob_green': 79, 'prob_high': 93}, 'bear': {'prob_red': 83, 'prob_low': 67}},
+        11: {'bull': {'prob_green': 71, 'prob_high': 79}, 'bear': {'prob_red': 58, 'prob_low': 67}},
+        12: {'bull': {'prob_green': 92, 'prob_high': 92}, 'bear': {'prob_red': 62, 'prob_low': 85}},
+    }
+}
+
+WEEKLY_SEASONAL_D3 = {
+    'NQ': {
+        1:  {'bull_50': {'prob_high': 66.2, 'prob_green': 73.2}, 'bear_50': {'prob_low': 68.2, 'prob_red': 79.5}, 'bull_75': {'prob_high': 73.8, 'prob_green': 85.7}, 'bear_25': {'prob_low': 78.6, 'prob_red': 85.7}},
+        2:  {'bull_50': {'prob_high': 69.7, 'prob_green': 71.2}, 'bear_50': {'prob_low': 68.4, 'prob_red': 68.4}, 'bull_75': {'prob_high': 83.7, 'prob_green': 76.7}, 'bear_25': {'prob_low': 84.2, 'prob_red': 84.2}},
+        3:  {'bull_50': {'prob_high': 65.2, 'prob_green': 73.9}, 'bear_50': {'prob_low': 61.9, 'prob_red': 71.4}, 'bull_75': {'prob_high': 75.7, 'prob_green': 78.4}, 'bear_25': {'prob_low': 82.6, 'prob_red': 78.3}},
+        4:  {'bull_50': {'prob_high': 78.0, 'prob_green': 78.0}, 'bear_50': {'prob_low': 58.3, 'prob_red': 79.2}, 'bull_75': {'prob_high': 85.7, 'prob_green': 82.9}, 'bear_25': {'prob_low': 73.9, 'prob_red': 82.6}},
+        5:  {'bull_50': {'prob_high': 73.3, 'prob_green': 80.0}, 'bear_50': {'prob_low': 70.8, 'prob_red': 72.9}, 'bull_75': {'prob_high': 82.1, 'prob_green': 82.1}, 'bear_25': {'prob_low': 76.7, 'prob_red': 76.7}},
+        6:  {'bull_50': {'prob_high': 75.4, 'prob_green': 60.9}, 'bear_50': {'prob_low': 73.7, 'prob_red': 76.3}, 'bull_75': {'prob_high': 88.1, 'prob_green': 71.4}, 'bear_25': {'prob_low': 80.8, 'prob_red': 84.6}},
+        7:  {'bull_50': {'prob_high': 71.6, 'prob_green': 71.6}, 'bear_50': {'prob_low': 64.9, 'prob_red': 78.4}, 'bull_75': {'prob_high': 87.0, 'prob_green': 82.6}, 'bear_25': {'prob_low': 94.4, 'prob_red': 100.0}},
+        8:  {'bull_50': {'prob_high': 77.6, 'prob_green': 79.1}, 'bear_50': {'prob_low': 84.1, 'prob_red': 79.5}, 'bull_75': {'prob_high': 92.9, 'prob_green': 85.7}, 'bear_25': {'prob_low': 95.5, 'prob_red': 90.9}},
+        9:  {'bull_50': {'prob_high': 65.1, 'prob_green': 77.8}, 'bear_50': {'prob_low': 75.0, 'prob_red': 75.0}, 'bull_75': {'prob_high': 68.4, 'prob_green': 81.6}, 'bear_25': {'prob_low': 88.9, 'prob_red': 81.5}},
+        10:  {'bull_50': {'prob_high': 77.3, 'prob_green': 84.8}, 'bear_50': {'prob_low': 67.3, 'prob_red': 61.2}, 'bull_75': {'prob_high': 86.0, 'prob_green': 83.7}, 'bear_25': {'prob_low': 88.0, 'prob_red': 80.0}},
+        11:  {'bull_50': {'prob_high': 73.8, 'prob_green': 90.8}, 'bear_50': {'prob_low': 69.6, 'prob_red': 78.3}, 'bull_75': {'prob_high': 83.3, 'prob_green': 93.8}, 'bear_25': {'prob_low': 75.9, 'prob_red': 86.2}},
+        12:  {'bull_50': {'prob_high': 55.4, 'prob_green': 75.4}, 'bear_50': {'prob_low': 65.3, 'prob_red': 75.5}, 'bull_75': {'prob_high': 78.4, 'prob_green': 83.8}, 'bear_25': {'prob_low': 77.8, 'prob_red': 88.9}},
+    },
+    'ES': {
+        1:  {'bull_50': {'prob_high': 74.0, 'prob_green': 74.0}, 'bear_50': {'prob_low': 64.3, 'prob_red': 83.3}, 'bull_75': {'prob_high': 78.7, 'prob_green': 83.0}, 'bear_25': {'prob_low': 77.8, 'prob_red': 85.2}},
+        2:  {'bull_50': {'prob_high': 52.9, 'prob_green': 70.6}, 'bear_50': {'prob_low': 64.9, 'prob_red': 62.2}, 'bull_75': {'prob_high': 65.9, 'prob_green': 80.5}, 'bear_25': {'prob_low': 66.7, 'prob_red': 66.7}},
+        3:  {'bull_50': {'prob_high': 73.0, 'prob_green': 74.6}, 'bear_50': {'prob_low': 66.7, 'prob_red': 70.8}, 'bull_75': {'prob_high': 84.6, 'prob_green': 89.7}, 'bear_25': {'prob_low': 78.6, 'prob_red': 78.6}},
+        4:  {'bull_50': {'prob_high': 77.6, 'prob_green': 75.9}, 'bear_50': {'prob_low': 57.1, 'prob_red': 61.2}, 'bull_75': {'prob_high': 86.0, 'prob_green': 76.7}, 'bear_25': {'prob_low': 73.7, 'prob_red': 78.9}},
+        5:  {'bull_50': {'prob_high': 69.6, 'prob_green': 73.2}, 'bear_50': {'prob_low': 71.2, 'prob_red': 71.2}, 'bull_75': {'prob_high': 80.0, 'prob_green': 82.9}, 'bear_25': {'prob_low': 89.7, 'prob_red': 82.8}},
+        6:  {'bull_50': {'prob_high': 66.1, 'prob_green': 67.8}, 'bear_50': {'prob_low': 72.0, 'prob_red': 72.0}, 'bull_75': {'prob_high': 82.1, 'prob_green': 82.1}, 'bear_25': {'prob_low': 85.7, 'prob_red': 78.6}},
+        7:  {'bull_50': {'prob_high': 76.1, 'prob_green': 81.7}, 'bear_50': {'prob_low': 62.5, 'prob_red': 72.5}, 'bull_75': {'prob_high': 82.0, 'prob_green': 86.0}, 'bear_25': {'prob_low': 78.6, 'prob_red': 78.6}},
+        8:  {'bull_50': {'prob_high': 75.8, 'prob_green': 79.0}, 'bear_50': {'prob_low': 69.4, 'prob_red': 65.3}, 'bull_75': {'prob_high': 82.1, 'prob_green': 87.2}, 'bear_25': {'prob_low': 94.7, 'prob_red': 89.5}},
+        9:  {'bull_50': {'prob_high': 71.2, 'prob_green': 78.0}, 'bear_50': {'prob_low': 66.7, 'prob_red': 75.0}, 'bull_75': {'prob_high': 80.0, 'prob_green': 87.5}, 'bear_25': {'prob_low': 71.0, 'prob_red': 87.1}},
+        10:  {'bull_50': {'prob_high': 72.7, 'prob_green': 80.3}, 'bear_50': {'prob_low': 67.3, 'prob_red': 69.4}, 'bull_75': {'prob_high': 81.6, 'prob_green': 84.2}, 'bear_25': {'prob_low': 88.5, 'prob_red': 80.8}},
+        11:  {'bull_50': {'prob_high': 68.6, 'prob_green': 81.4}, 'bear_50': {'prob_low': 68.3, 'prob_red': 73.2}, 'bull_75': {'prob_high': 74.5, 'prob_green': 85.5}, 'bear_25': {'prob_low': 76.7, 'prob_red': 80.0}},
+        12:  {'bull_50': {'prob_high': 72.3, 'prob_green': 83.1}, 'bear_50': {'prob_low': 69.6, 'prob_red': 73.9}, 'bull_75': {'prob_high': 85.4, 'prob_green': 91.7}, 'bear_25': {'prob_low': 84.0, 'prob_red': 84.0}},
+    },
+    'YM': {
+        1:  {'bull_50': {'prob_high': 60.3, 'prob_green': 72.6}, 'bear_50': {'prob_low': 69.6, 'prob_red': 73.9}, 'bull_75': {'prob_high': 62.2, 'prob_green': 77.8}, 'bear_25': {'prob_low': 78.1, 'prob_red': 81.2}},
+        2:  {'bull_50': {'prob_high': 59.0, 'prob_green': 65.6}, 'bear_50': {'prob_low': 62.5, 'prob_red': 56.2}, 'bull_75': {'prob_high': 65.1, 'prob_green': 74.4}, 'bear_25': {'prob_low': 77.8, 'prob_red': 61.1}},
+        3:  {'bull_50': {'prob_high': 75.0, 'prob_green': 80.0}, 'bear_50': {'prob_low': 62.5, 'prob_red': 66.1}, 'bull_75': {'prob_high': 80.4, 'prob_green': 80.4}, 'bear_25': {'prob_low': 65.7, 'prob_red': 68.6}},
+        4:  {'bull_50': {'prob_high': 63.6, 'prob_green': 77.3}, 'bear_50': {'prob_low': 57.8, 'prob_red': 66.7}, 'bull_75': {'prob_high': 75.0, 'prob_green': 75.0}, 'bear_25': {'prob_low': 74.1, 'prob_red': 70.4}},
+        5:  {'bull_50': {'prob_high': 63.5, 'prob_green': 75.0}, 'bear_50': {'prob_low': 65.0, 'prob_red': 76.7}, 'bull_75': {'prob_high': 86.7, 'prob_green': 93.3}, 'bear_25': {'prob_low': 81.2, 'prob_red': 84.4}},
+        6:  {'bull_50': {'prob_high': 61.3, 'prob_green': 69.4}, 'bear_50': {'prob_low': 73.6, 'prob_red': 81.1}, 'bull_75': {'prob_high': 82.9, 'prob_green': 82.9}, 'bear_25': {'prob_low': 88.2, 'prob_red': 91.2}},
+        7:  {'bull_50': {'prob_high': 64.9, 'prob_green': 75.3}, 'bear_50': {'prob_low': 65.8, 'prob_red': 63.2}, 'bull_75': {'prob_high': 68.9, 'prob_green': 86.7}, 'bear_25': {'prob_low': 71.4, 'prob_red': 71.4}},
+        8:  {'bull_50': {'prob_high': 71.4, 'prob_green': 77.8}, 'bear_50': {'prob_low': 66.0, 'prob_red': 64.2}, 'bull_75': {'prob_high': 82.1, 'prob_green': 87.2}, 'bear_25': {'prob_low': 75.0, 'prob_red': 78.1}},
+        9:  {'bull_50': {'prob_high': 78.9, 'prob_green': 73.7}, 'bear_50': {'prob_low': 63.5, 'prob_red': 80.8}, 'bull_75': {'prob_high': 91.7, 'prob_green': 86.1}, 'bear_25': {'prob_low': 70.6, 'prob_red': 85.3}},
+        10:  {'bull_50': {'prob_high': 71.9, 'prob_green': 82.8}, 'bear_50': {'prob_low': 70.6, 'prob_red': 62.7}, 'bull_75': {'prob_high': 86.5, 'prob_green': 86.5}, 'bear_25': {'prob_low': 86.2, 'prob_red': 79.3}},
+        11:  {'bull_50': {'prob_high': 64.7, 'prob_green': 82.4}, 'bear_50': {'prob_low': 61.4, 'prob_red': 65.9}, 'bull_75': {'prob_high': 73.3, 'prob_green': 91.1}, 'bear_25': {'prob_low': 69.0, 'prob_red': 82.8}},
+        12:  {'bull_50': {'prob_high': 60.3, 'prob_green': 76.5}, 'bear_50': {'prob_low': 54.3, 'prob_red': 65.2}, 'bull_75': {'prob_high': 81.4, 'prob_green': 90.7}, 'bear_25': {'prob_low': 73.1, 'prob_red': 73.1}},
+    },
+    'GC': {
+        1:  {'bull_50': {'prob_high': 65.3, 'prob_green': 87.5}, 'bear_50': {'prob_low': 60.5, 'prob_red': 72.1}, 'bull_75': {'prob_high': 66.7, 'prob_green': 87.0}, 'bear_25': {'prob_low': 64.7, 'prob_red': 70.6}},
+        2:  {'bull_50': {'prob_high': 60.7, 'prob_green': 83.9}, 'bear_50': {'prob_low': 60.0, 'prob_red': 76.0}, 'bull_75': {'prob_high': 65.7, 'prob_green': 91.4}, 'bear_25': {'prob_low': 76.2, 'prob_red': 81.0}},
+        3:  {'bull_50': {'prob_high': 66.7, 'prob_green': 75.9}, 'bear_50': {'prob_low': 59.6, 'prob_red': 66.7}, 'bull_75': {'prob_high': 66.7, 'prob_green': 73.8}, 'bear_25': {'prob_low': 61.0, 'prob_red': 70.7}},
+        4:  {'bull_50': {'prob_high': 68.9, 'prob_green': 70.5}, 'bear_50': {'prob_low': 54.3, 'prob_red': 71.7}, 'bull_75': {'prob_high': 73.0, 'prob_green': 75.7}, 'bear_25': {'prob_low': 60.0, 'prob_red': 80.0}},
+        5:  {'bull_50': {'prob_high': 66.7, 'prob_green': 74.1}, 'bear_50': {'prob_low': 61.1, 'prob_red': 63.0}, 'bull_75': {'prob_high': 71.8, 'prob_green': 76.9}, 'bear_25': {'prob_low': 67.5, 'prob_red': 62.5}},
+        6:  {'bull_50': {'prob_high': 66.0, 'prob_green': 68.0}, 'bear_50': {'prob_low': 58.3, 'prob_red': 66.7}, 'bull_75': {'prob_high': 56.5, 'prob_green': 60.9}, 'bear_25': {'prob_low': 56.2, 'prob_red': 75.0}},
+        7:  {'bull_50': {'prob_high': 57.9, 'prob_green': 80.7}, 'bear_50': {'prob_low': 52.0, 'prob_red': 70.0}, 'bull_75': {'prob_high': 58.3, 'prob_green': 86.1}, 'bear_25': {'prob_low': 57.9, 'prob_red': 73.7}},
+        8:  {'bull_50': {'prob_high': 71.6, 'prob_green': 79.1}, 'bear_50': {'prob_low': 55.8, 'prob_red': 65.1}, 'bull_75': {'prob_high': 72.5, 'prob_green': 85.0}, 'bear_25': {'prob_low': 77.3, 'prob_red': 68.2}},
+        9:  {'bull_50': {'prob_high': 62.5, 'prob_green': 73.4}, 'bear_50': {'prob_low': 57.8, 'prob_red': 71.1}, 'bull_75': {'prob_high': 70.7, 'prob_green': 78.0}, 'bear_25': {'prob_low': 69.0, 'prob_red': 75.9}},
+        10:  {'bull_50': {'prob_high': 53.4, 'prob_green': 74.1}, 'bear_50': {'prob_low': 57.9, 'prob_red': 64.9}, 'bull_75': {'prob_high': 65.7, 'prob_green': 82.9}, 'bear_25': {'prob_low': 56.2, 'prob_red': 71.9}},
+        11:  {'bull_50': {'prob_high': 64.8, 'prob_green': 74.1}, 'bear_50': {'prob_low': 54.9, 'prob_red': 64.7}, 'bull_75': {'prob_high': 76.3, 'prob_green': 78.9}, 'bear_25': {'prob_low': 52.6, 'prob_red': 68.4}},
+        12:  {'bull_50': {'prob_high': 55.2, 'prob_green': 70.1}, 'bear_50': {'prob_low': 43.2, 'prob_red': 68.2}, 'bull_75': {'prob_high': 65.3, 'prob_green': 75.5}, 'bear_25': {'prob_low': 60.7, 'prob_red': 78.6}},
+    },
+}
+
 # Source: output/charts/strategy/D2/ (NQ_weekly_fractal_seasonality_styled.png, etc.)
+# Fully audited 12-month tables for D2 Signal (Tuesday Close vs Mon-Tue Range)
 WEEKLY_SEASONAL = {
     'NQ': {
         1:  {'bull_50': {'prob_high': 86.5, 'prob_green': 75.7}, 'bear_50': {'prob_low': 78.0, 'prob_red': 85.4}, 'bull_75': {'prob_high': 89.7, 'prob_green': 79.5}, 'bear_25': {'prob_low': 83.3, 'prob_red': 88.9}},
@@ -61,77 +188,58 @@ WEEKLY_SEASONAL = {
 
 
 
+# Source: output/charts/Multi/weekly/alpha_matrix_all_indices_weekly.png
+# Only Mean Reversion kept — Bull Momentum removed (T < 1, not significant)
+# Probabilities re-computed on 2015-2025 data, audited 18/02/2026
 WEEKLY_ALPHA_MATRIX = {
     'NQ': {
-        'bull_momentum':  {'threshold': 0.0355, 'prob': 61.0, 'target': 'CONTINUACIÓN FUERTE', 'grade': 'GOLD+'},
-        'mean_reversion': {'threshold': -0.0273, 'prob': 55.8, 'target': 'REBOTE MODERADO', 'grade': 'MEDIUM'}
+        'mean_reversion': {'threshold': -0.0273, 'prob': 57.5, 'target': 'REBOTE MODERADO', 'grade': 'SILVER (T=2.19)'}
     },
     'ES': {
-        'bull_momentum':  {'threshold': 0.0298, 'prob': 54.3, 'target': 'CONTINUACIÓN EN W+1', 'grade': 'MEDIUM'},
-        'mean_reversion': {'threshold': -0.0233, 'prob': 65.8, 'target': 'REBOTE ALTA PROB', 'grade': 'GOLD+'}
+        'mean_reversion': {'threshold': -0.0233, 'prob': 66.7, 'target': 'REBOTE ALTA PROB', 'grade': 'GOLD (T=3.13)'}
     },
     'YM': {
-        'bull_momentum':  {'threshold': 0.0290, 'prob': 56.2, 'target': 'CONTINUACIÓN EN W+1', 'grade': 'MEDIUM'},
-        'mean_reversion': {'threshold': -0.0241, 'prob': 67.7, 'target': 'REBOTE POR CAPITULACIÓN', 'grade': 'GOLD+'}
+        'mean_reversion': {'threshold': -0.0241, 'prob': 71.4, 'target': 'REBOTE POR CAPITULACIÓN', 'grade': 'GOLD (T=2.65)'}
     }
 }
 
-WEEKLY_SEASONAL_D3 = {
-    'NQ': {
-        1:  {'bull_50': {'prob_high': 66.2, 'prob_green': 73.2}, 'bear_50': {'prob_low': 68.2, 'prob_red': 79.5}, 'bull_75': {'prob_high': 73.8, 'prob_green': 85.7}, 'bear_25': {'prob_low': 78.6, 'prob_red': 85.7}},
-        2:  {'bull_50': {'prob_high': 69.7, 'prob_green': 71.2}, 'bear_50': {'prob_low': 68.4, 'prob_red': 68.4}, 'bull_75': {'prob_high': 83.7, 'prob_green': 76.7}, 'bear_25': {'prob_low': 84.2, 'prob_red': 84.2}},
-        3:  {'bull_50': {'prob_high': 65.2, 'prob_green': 73.9}, 'bear_50': {'prob_low': 61.9, 'prob_red': 71.4}, 'bull_75': {'prob_high': 75.7, 'prob_green': 78.4}, 'bear_25': {'prob_low': 82.6, 'prob_red': 78.3}},
-        4:  {'bull_50': {'prob_high': 78.0, 'prob_green': 78.0}, 'bear_50': {'prob_low': 58.3, 'prob_red': 79.2}, 'bull_75': {'prob_high': 85.7, 'prob_green': 82.9}, 'bear_25': {'prob_low': 73.9, 'prob_red': 82.6}},
-        5:  {'bull_50': {'prob_high': 73.3, 'prob_green': 80.0}, 'bear_50': {'prob_low': 70.8, 'prob_red': 72.9}, 'bull_75': {'prob_high': 82.1, 'prob_green': 82.1}, 'bear_25': {'prob_low': 76.7, 'prob_red': 76.7}},
-        6:  {'bull_50': {'prob_high': 75.4, 'prob_green': 60.9}, 'bear_50': {'prob_low': 73.7, 'prob_red': 76.3}, 'bull_75': {'prob_high': 88.1, 'prob_green': 71.4}, 'bear_25': {'prob_low': 80.8, 'prob_red': 84.6}},
-        7:  {'bull_50': {'prob_high': 71.6, 'prob_green': 71.6}, 'bear_50': {'prob_low': 64.9, 'prob_red': 78.4}, 'bull_75': {'prob_high': 87.0, 'prob_green': 82.6}, 'bear_25': {'prob_low': 94.4, 'prob_red': 100.0}},
-        8:  {'bull_50': {'prob_high': 77.6, 'prob_green': 79.1}, 'bear_50': {'prob_low': 84.1, 'prob_red': 79.5}, 'bull_75': {'prob_high': 92.9, 'prob_green': 85.7}, 'bear_25': {'prob_low': 95.5, 'prob_red': 90.9}},
-        9:  {'bull_50': {'prob_high': 65.1, 'prob_green': 77.8}, 'bear_50': {'prob_low': 75.0, 'prob_red': 75.0}, 'bull_75': {'prob_high': 68.4, 'prob_green': 81.6}, 'bear_25': {'prob_low': 88.9, 'prob_red': 81.5}},
-        10:  {'bull_50': {'prob_high': 77.3, 'prob_green': 84.8}, 'bear_50': {'prob_low': 67.3, 'prob_red': 61.2}, 'bull_75': {'prob_high': 86.0, 'prob_green': 83.7}, 'bear_25': {'prob_low': 88.0, 'prob_red': 80.0}},
-        11:  {'bull_50': {'prob_high': 73.8, 'prob_green': 90.8}, 'bear_50': {'prob_low': 69.6, 'prob_red': 78.3}, 'bull_75': {'prob_high': 83.3, 'prob_green': 93.8}, 'bear_25': {'prob_low': 75.9, 'prob_red': 86.2}},
-        12:  {'bull_50': {'prob_high': 55.4, 'prob_green': 75.4}, 'bear_50': {'prob_low': 65.3, 'prob_red': 75.5}, 'bull_75': {'prob_high': 78.4, 'prob_green': 83.8}, 'bear_25': {'prob_low': 77.8, 'prob_red': 88.9}},
-    },
-    'ES': {
-        1:  {'bull_50': {'prob_high': 74.0, 'prob_green': 74.0}, 'bear_50': {'prob_low': 64.3, 'prob_red': 83.3}, 'bull_75': {'prob_high': 78.7, 'prob_green': 83.0}, 'bear_25': {'prob_low': 77.8, 'prob_red': 85.2}},
-        2:  {'bull_50': {'prob_high': 52.9, 'prob_green': 70.6}, 'bear_50': {'prob_low': 64.9, 'prob_red': 62.2}, 'bull_75': {'prob_high': 65.9, 'prob_green': 80.5}, 'bear_25': {'prob_low': 66.7, 'prob_red': 66.7}},
-        3:  {'bull_50': {'prob_high': 73.0, 'prob_green': 74.6}, 'bear_50': {'prob_low': 66.7, 'prob_red': 70.8}, 'bull_75': {'prob_high': 84.6, 'prob_green': 89.7}, 'bear_25': {'prob_low': 78.6, 'prob_red': 78.6}},
-        4:  {'bull_50': {'prob_high': 77.6, 'prob_green': 75.9}, 'bear_50': {'prob_low': 57.1, 'prob_red': 61.2}, 'bull_75': {'prob_high': 86.0, 'prob_green': 76.7}, 'bear_25': {'prob_low': 73.7, 'prob_red': 78.9}},
-        5:  {'bull_50': {'prob_high': 69.6, 'prob_green': 73.2}, 'bear_50': {'prob_low': 71.2, 'prob_red': 71.2}, 'bull_75': {'prob_high': 80.0, 'prob_green': 82.9}, 'bear_25': {'prob_low': 89.7, 'prob_red': 82.8}},
-        6:  {'bull_50': {'prob_high': 66.1, 'prob_green': 67.8}, 'bear_50': {'prob_low': 72.0, 'prob_red': 72.0}, 'bull_75': {'prob_high': 82.1, 'prob_green': 82.1}, 'bear_25': {'prob_low': 85.7, 'prob_red': 78.6}},
-        7:  {'bull_50': {'prob_high': 76.1, 'prob_green': 81.7}, 'bear_50': {'prob_low': 62.5, 'prob_red': 72.5}, 'bull_75': {'prob_high': 82.0, 'prob_green': 86.0}, 'bear_25': {'prob_low': 78.6, 'prob_red': 78.6}},
-        8:  {'bull_50': {'prob_high': 75.8, 'prob_green': 79.0}, 'bear_50': {'prob_low': 69.4, 'prob_red': 65.3}, 'bull_75': {'prob_high': 82.1, 'prob_green': 87.2}, 'bear_25': {'prob_low': 94.7, 'prob_red': 89.5}},
-        9:  {'bull_50': {'prob_high': 71.2, 'prob_green': 78.0}, 'bear_50': {'prob_low': 66.7, 'prob_red': 75.0}, 'bull_75': {'prob_high': 80.0, 'prob_green': 87.5}, 'bear_25': {'prob_low': 71.0, 'prob_red': 87.1}},
-        10:  {'bull_50': {'prob_high': 72.7, 'prob_green': 80.3}, 'bear_50': {'prob_low': 67.3, 'prob_red': 69.4}, 'bull_75': {'prob_high': 81.6, 'prob_green': 84.2}, 'bear_25': {'prob_low': 88.5, 'prob_red': 80.8}},
-        11:  {'bull_50': {'prob_high': 68.6, 'prob_green': 81.4}, 'bear_50': {'prob_low': 68.3, 'prob_red': 73.2}, 'bull_75': {'prob_high': 74.5, 'prob_green': 85.5}, 'bear_25': {'prob_low': 76.7, 'prob_red': 80.0}},
-        12:  {'bull_50': {'prob_high': 72.3, 'prob_green': 83.1}, 'bear_50': {'prob_low': 69.6, 'prob_red': 73.9}, 'bull_75': {'prob_high': 85.4, 'prob_green': 91.7}, 'bear_25': {'prob_low': 84.0, 'prob_red': 84.0}},
-    },
-    'YM': {
-        1:  {'bull_50': {'prob_high': 60.3, 'prob_green': 72.6}, 'bear_50': {'prob_low': 69.6, 'prob_red': 73.9}, 'bull_75': {'prob_high': 62.2, 'prob_green': 77.8}, 'bear_25': {'prob_low': 78.1, 'prob_red': 81.2}},
-        2:  {'bull_50': {'prob_high': 59.0, 'prob_green': 65.6}, 'bear_50': {'prob_low': 62.5, 'prob_red': 56.2}, 'bull_75': {'prob_high': 65.1, 'prob_green': 74.4}, 'bear_25': {'prob_low': 77.8, 'prob_red': 61.1}},
-        3:  {'bull_50': {'prob_high': 75.0, 'prob_green': 80.0}, 'bear_50': {'prob_low': 62.5, 'prob_red': 66.1}, 'bull_75': {'prob_high': 80.4, 'prob_green': 80.4}, 'bear_25': {'prob_low': 65.7, 'prob_red': 68.6}},
-        4:  {'bull_50': {'prob_high': 63.6, 'prob_green': 77.3}, 'bear_50': {'prob_low': 57.8, 'prob_red': 66.7}, 'bull_75': {'prob_high': 75.0, 'prob_green': 75.0}, 'bear_25': {'prob_low': 74.1, 'prob_red': 70.4}},
-        5:  {'bull_50': {'prob_high': 63.5, 'prob_green': 75.0}, 'bear_50': {'prob_low': 65.0, 'prob_red': 76.7}, 'bull_75': {'prob_high': 86.7, 'prob_green': 93.3}, 'bear_25': {'prob_low': 81.2, 'prob_red': 84.4}},
-        6:  {'bull_50': {'prob_high': 61.3, 'prob_green': 69.4}, 'bear_50': {'prob_low': 73.6, 'prob_red': 81.1}, 'bull_75': {'prob_high': 82.9, 'prob_green': 82.9}, 'bear_25': {'prob_low': 88.2, 'prob_red': 91.2}},
-        7:  {'bull_50': {'prob_high': 64.9, 'prob_green': 75.3}, 'bear_50': {'prob_low': 65.8, 'prob_red': 63.2}, 'bull_75': {'prob_high': 68.9, 'prob_green': 86.7}, 'bear_25': {'prob_low': 71.4, 'prob_red': 71.4}},
-        8:  {'bull_50': {'prob_high': 71.4, 'prob_green': 77.8}, 'bear_50': {'prob_low': 66.0, 'prob_red': 64.2}, 'bull_75': {'prob_high': 82.1, 'prob_green': 87.2}, 'bear_25': {'prob_low': 75.0, 'prob_red': 78.1}},
-        9:  {'bull_50': {'prob_high': 78.9, 'prob_green': 73.7}, 'bear_50': {'prob_low': 63.5, 'prob_red': 80.8}, 'bull_75': {'prob_high': 91.7, 'prob_green': 86.1}, 'bear_25': {'prob_low': 70.6, 'prob_red': 85.3}},
-        10:  {'bull_50': {'prob_high': 71.9, 'prob_green': 82.8}, 'bear_50': {'prob_low': 70.6, 'prob_red': 62.7}, 'bull_75': {'prob_high': 86.5, 'prob_green': 86.5}, 'bear_25': {'prob_low': 86.2, 'prob_red': 79.3}},
-        11:  {'bull_50': {'prob_high': 64.7, 'prob_green': 82.4}, 'bear_50': {'prob_low': 61.4, 'prob_red': 65.9}, 'bull_75': {'prob_high': 73.3, 'prob_green': 91.1}, 'bear_25': {'prob_low': 69.0, 'prob_red': 82.8}},
-        12:  {'bull_50': {'prob_high': 60.3, 'prob_green': 76.5}, 'bear_50': {'prob_low': 54.3, 'prob_red': 65.2}, 'bull_75': {'prob_high': 81.4, 'prob_green': 90.7}, 'bear_25': {'prob_low': 73.1, 'prob_red': 73.1}},
-    },
-    'GC': {
-        1:  {'bull_50': {'prob_high': 65.3, 'prob_green': 87.5}, 'bear_50': {'prob_low': 60.5, 'prob_red': 72.1}, 'bull_75': {'prob_high': 66.7, 'prob_green': 87.0}, 'bear_25': {'prob_low': 64.7, 'prob_red': 70.6}},
-        2:  {'bull_50': {'prob_high': 60.7, 'prob_green': 83.9}, 'bear_50': {'prob_low': 60.0, 'prob_red': 76.0}, 'bull_75': {'prob_high': 65.7, 'prob_green': 91.4}, 'bear_25': {'prob_low': 76.2, 'prob_red': 81.0}},
-        3:  {'bull_50': {'prob_high': 66.7, 'prob_green': 75.9}, 'bear_50': {'prob_low': 59.6, 'prob_red': 66.7}, 'bull_75': {'prob_high': 66.7, 'prob_green': 73.8}, 'bear_25': {'prob_low': 61.0, 'prob_red': 70.7}},
-        4:  {'bull_50': {'prob_high': 68.9, 'prob_green': 70.5}, 'bear_50': {'prob_low': 54.3, 'prob_red': 71.7}, 'bull_75': {'prob_high': 73.0, 'prob_green': 75.7}, 'bear_25': {'prob_low': 60.0, 'prob_red': 80.0}},
-        5:  {'bull_50': {'prob_high': 66.7, 'prob_green': 74.1}, 'bear_50': {'prob_low': 61.1, 'prob_red': 63.0}, 'bull_75': {'prob_high': 71.8, 'prob_green': 76.9}, 'bear_25': {'prob_low': 67.5, 'prob_red': 62.5}},
-        6:  {'bull_50': {'prob_high': 66.0, 'prob_green': 68.0}, 'bear_50': {'prob_low': 58.3, 'prob_red': 66.7}, 'bull_75': {'prob_high': 56.5, 'prob_green': 60.9}, 'bear_25': {'prob_low': 56.2, 'prob_red': 75.0}},
-        7:  {'bull_50': {'prob_high': 57.9, 'prob_green': 80.7}, 'bear_50': {'prob_low': 52.0, 'prob_red': 70.0}, 'bull_75': {'prob_high': 58.3, 'prob_green': 86.1}, 'bear_25': {'prob_low': 57.9, 'prob_red': 73.7}},
-        8:  {'bull_50': {'prob_high': 71.6, 'prob_green': 79.1}, 'bear_50': {'prob_low': 55.8, 'prob_red': 65.1}, 'bull_75': {'prob_high': 72.5, 'prob_green': 85.0}, 'bear_25': {'prob_low': 77.3, 'prob_red': 68.2}},
-        9:  {'bull_50': {'prob_high': 62.5, 'prob_green': 73.4}, 'bear_50': {'prob_low': 57.8, 'prob_red': 71.1}, 'bull_75': {'prob_high': 70.7, 'prob_green': 78.0}, 'bear_25': {'prob_low': 69.0, 'prob_red': 75.9}},
-        10:  {'bull_50': {'prob_high': 53.4, 'prob_green': 74.1}, 'bear_50': {'prob_low': 57.9, 'prob_red': 64.9}, 'bull_75': {'prob_high': 65.7, 'prob_green': 82.9}, 'bear_25': {'prob_low': 56.2, 'prob_red': 71.9}},
-        11:  {'bull_50': {'prob_high': 64.8, 'prob_green': 74.1}, 'bear_50': {'prob_low': 54.9, 'prob_red': 64.7}, 'bull_75': {'prob_high': 76.3, 'prob_green': 78.9}, 'bear_25': {'prob_low': 52.6, 'prob_red': 68.4}},
-        12:  {'bull_50': {'prob_high': 55.2, 'prob_green': 70.1}, 'bear_50': {'prob_low': 43.2, 'prob_red': 68.2}, 'bull_75': {'prob_high': 65.3, 'prob_green': 75.5}, 'bear_25': {'prob_low': 60.7, 'prob_red': 78.6}},
-    },
+# --- WEEKLY BIAS & INERTIA (Daily σ Breach → Weekly Close Direction) ---
+# Source: output/charts/Multi/daily/weekly_bias_inertia_matrix.png
+# AUDITED 2026-03-04: All values verified against chart (Periodo 2005-2025, AUDITED 15/02/2026)
+# Key: (asset, weekday, type) where weekday: 0=Mon 1=Tue 2=Wed 3=Thu 4=Fri
+WEEKLY_BIAS_TRIGGERS = {
+    ('NQ', 0, 'drive'):  {'direction': 'BULL', 'prob': 82.3, 'avg_ret': '+2.82%', 't_stat': 6.53, 'grade': 'GOLD+'},
+    ('NQ', 4, 'panic'):  {'direction': 'BEAR', 'prob': 84.5, 'avg_ret': '-2.44%', 't_stat': 7.40, 'grade': 'GOLD+'},
+    ('ES', 0, 'drive'):  {'direction': 'BULL', 'prob': 86.5, 'avg_ret': '+2.65%', 't_stat': 7.30, 'grade': 'GOLD+'},
+    ('ES', 4, 'panic'):  {'direction': 'BEAR', 'prob': 91.8, 'avg_ret': '-2.16%', 't_stat': 5.97, 'grade': 'GOLD+'},
+    ('NQ', 3, 'panic'):  {'direction': 'BEAR', 'prob': 78.5, 'avg_ret': '-2.12%', 't_stat': 6.26, 'grade': 'GOLD'},
+    ('YM', 2, 'panic'):  {'direction': 'BEAR', 'prob': 75.5, 'avg_ret': '-1.93%', 't_stat': 4.58, 'grade': 'GOLD'},
+    ('ES', 1, 'drive'):  {'direction': 'BULL', 'prob': 75.5, 'avg_ret': '+1.75%', 't_stat': 3.65, 'grade': 'SILVER'},
+    # NQ/ES Wed Drive omitted — D2 signal already establishes weekly bias by Wednesday
+}
+
+# Source: output/charts/seasonality/{ASSET}/monthly/{ASSET}_monthly_seasonality.png
+# Probability of GREEN (positive) close per month — SeasonalityCalculator.hit_rate (2000-2026)
+MONTHLY_BIAS = {
+    'NQ': {1: 61.5, 2: 38.5, 3: 64.0, 4: 64.0, 5: 64.0, 6: 60.0, 7: 76.0, 8: 56.0, 9: 48.0, 10: 61.5, 11: 73.1, 12: 53.8},
+    'ES': {1: 53.8, 2: 46.2, 3: 60.0, 4: 72.0, 5: 76.0, 6: 56.0, 7: 72.0, 8: 64.0, 9: 52.0, 10: 61.5, 11: 73.1, 12: 73.1},
+    'YM': {1: 54.2, 2: 62.5, 3: 65.2, 4: 73.9, 5: 62.5, 6: 50.0, 7: 70.8, 8: 62.5, 9: 50.0, 10: 58.3, 11: 79.2, 12: 62.5},
+    'GC': {1: 65.4, 2: 53.8, 3: 48.0, 4: 64.0, 5: 52.0, 6: 44.0, 7: 56.0, 8: 72.0, 9: 50.0, 10: 50.0, 11: 57.7, 12: 65.4},
+}
+
+# Source: DOR output charts (output/charts/*/daily/DOR_O2C_D_*_2020-2025_*.png)
+# Asymmetric thresholds: mean + std (drive) / mean - std (panic)
+SIGMA_UPPER = {'NQ': 0.01634, 'ES': 0.01324, 'YM': 0.01259, 'GC': 0.00968}
+SIGMA_LOWER = {'NQ': -0.01486, 'ES': -0.01207, 'YM': -0.01180, 'GC': -0.00896}
+
+# --- D+1 DAILY ALPHA MATRIX (Daily σ Breach → Next-Day Direction) ---
+# Source: output/charts/Multi/daily/daily_alpha_matrix_weekdays.png
+# AUDITED 2026-03-04: Only edges with T ≥ 1.3 included (NOISE excluded)
+# Key: (asset, weekday, type) → {signal, prob, avg_ret_d1, t_stat, grade}
+DAILY_ALPHA_TRIGGERS = {
+    ('NQ', 1, 'panic'):  {'signal': 'REBOUND (Miércoles)', 'prob': 55.4, 'avg_ret_d1': '+0.543%', 't_stat': 2.1, 'grade': 'GOLD (T>2.1)'},
+    ('YM', 4, 'panic'):  {'signal': 'REBOUND (Lunes)',     'prob': 67.9, 'avg_ret_d1': '+0.444%', 't_stat': 1.5, 'grade': 'SILVER (T>1.5)'},
+    ('NQ', 3, 'drive'):  {'signal': 'REVERSION (Viernes)', 'prob': 57.8, 'avg_ret_d1': '-0.271%', 't_stat': 1.4, 'grade': 'BRONZE (T>1.3)'},
 }
 
+DAY_NAMES = ['LUN', 'MAR', 'MIÉ', 'JUE', 'VIE', 'SAB', 'DOM']
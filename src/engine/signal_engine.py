@@ -0,0 +1,651 @@
+"""
+Signal Engine Module
+Incremental per-asset state of the monthly, weekly and daily signal layers.
+
+The monthly W2, weekly D2/D3, alpha-matrix, weekly-bias and D+1 layers only
+look at the current month, the current ISO week, the previous week's open /
+close and the previous bar. AssetState keeps exactly that (running highs and
+lows, the W1-W2 range of days 1-13, the bars of the week) and every layer is
+cached against a version counter of the scope it reads:
+
+    new daily bar      -> month, week and day layers recomputed
+    same-day revision  -> month and week layers recomputed (D+1 reads the previous bar)
+    layers() re-read   -> served from cache
+
+so an update touches at most the current week and month instead of
+re-filtering the whole history. SignalEngine holds the states of several
+assets; sync() feeds it a fresh history frame and only pushes the bars from
+the last one it has already seen. A cold state is built without a per-bar loop
+by AssetState.from_arrays (plain OHLC arrays + calendar_arrays integer
+fields); layers_from_arrays is the same kernel as a stateless function.
+The probability tables live in
+alpha_constants; the API (calc_layers) and AlphaBrain both read them through
+this engine.
+"""
+
+import threading
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.calendar_index import calendar_arrays
+from src.signals.base import ohlc_arrays
+from src.engine.alpha_constants import (
+    W2_MONTHLY,
+    WEEKLY_SEASONAL,
+    WEEKLY_SEASONAL_D3,
+    WEEKLY_ALPHA_MATRIX,
+    WEEKLY_BIAS_TRIGGERS,
+    MONTHLY_BIAS,
+    SIGMA_UPPER,
+    SIGMA_LOWER,
+    DAILY_ALPHA_TRIGGERS,
+    DAY_NAMES,
+)
+
+Bar = namedtuple('Bar', ['date', 'open', 'high', 'low', 'close'])
+
+# Calendar day on which the W1-W2 range of the month is locked
+W2_LOCK_DAY = 13
+
+# Completed weeks kept for the alpha-matrix lookup
+WEEK_HISTORY = 4
+
+
+def get_grade(p):
+    if p >= 90: return 'DIAMOND'
+    if p >= 82: return 'GOLD+'
+    if p >= 75: return 'GOLD'
+    return 'SILVER'
+
+
+def fractal_mode(now_utc: Optional[datetime] = None) -> Optional[str]:
+    """
+    Which weekly fractal signal is live at now_utc.
+
+    D2: Tue 18:00 EST (23:00 UTC) up to Wed 16:30 EST (21:30 UTC)
+    D3: Wed 16:30 EST (21:30 UTC) onwards
+
+    Returns:
+        'd2', 'd3' or None (Mon / Tue before the D2 lock)
+    """
+    now_utc = now_utc or datetime.now(timezone.utc)
+    if now_utc.weekday() > 2: # Thu, Fri, Sat, Sun
+        return 'd3'
+    if now_utc.weekday() == 2: # Wednesday (2)
+        if now_utc.hour > 21 or (now_utc.hour == 21 and now_utc.minute >= 30):
+            return 'd3'
+        return 'd2'
+    if now_utc.weekday() == 1 and now_utc.hour >= 23: # Tuesday (1)
+        return 'd2'
+    return None
+
+
+def bar_o2c(bar: Bar) -> float:
+    """Open-to-close return of a bar (0 for a zero open)."""
+    return (bar.close - bar.open) / bar.open if bar.open != 0 else 0
+
+
+class AssetState:
+    """
+    Current month / week / previous-bar state of one asset.
+
+    Bars are pushed in date order; a bar with the date of the last one
+    replaces it (intraday revisions of the forming daily bar).
+    """
+
+    def __init__(self, asset: str):
+        self.asset = asset
+        self.last_bar: Optional[Bar] = None
+        self.prev_bar: Optional[Bar] = None
+        self.month_key: Optional[Tuple[int, int]] = None
+        self.month_bars: List[Bar] = []
+        self.week_key: Optional[Tuple[int, int]] = None
+        self.prev_week_key: Optional[Tuple[int, int]] = None
+        self.week_bars: List[Bar] = []
+        self.week_history: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self.versions = {'month': 0, 'week': 0, 'day': 0}
+        self._reset_month()
+        self._reset_week()
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return self.last_bar.date if self.last_bar is not None else None
+
+    def _reset_month(self):
+        self.month_high = self.w2_high = float('-inf')
+        self.month_low = self.w2_low = float('inf')
+        self.w2_close = None
+        self.w2_count = 0
+
+    def _reset_week(self):
+        self.week_high = float('-inf')
+        self.week_low = float('inf')
+
+    def _add_to_month(self, bar: Bar):
+        self.month_high = max(self.month_high, bar.high)
+        self.month_low = min(self.month_low, bar.low)
+        if bar.date.day <= W2_LOCK_DAY:
+            self.w2_high = max(self.w2_high, bar.high)
+            self.w2_low = min(self.w2_low, bar.low)
+            self.w2_close = bar.close
+            self.w2_count += 1
+
+    def _add_to_week(self, bar: Bar):
+        self.week_high = max(self.week_high, bar.high)
+        self.week_low = min(self.week_low, bar.low)
+
+    def push(self, date, open_: float, high: float, low: float, close: float):
+        """
+        Add (or revise) one daily bar.
+
+        Raises:
+            ValueError: If date is older than the last bar
+        """
+        bar = Bar(pd.Timestamp(date), float(open_), float(high), float(low), float(close))
+        if self.last_bar is not None and bar.date < self.last_bar.date:
+            raise ValueError(f"{self.asset}: bar {bar.date} is older than the last bar {self.last_bar.date}")
+
+        if self.last_bar is not None and bar.date == self.last_bar.date:
+            # Revision of the forming bar: rebuild the running month / week aggregates
+            self.last_bar = bar
+            self.month_bars[-1] = bar
+            self.week_bars[-1] = bar
+            self._reset_month()
+            for b in self.month_bars:
+                self._add_to_month(b)
+            self._reset_week()
+            for b in self.week_bars:
+                self._add_to_week(b)
+            self.versions['month'] += 1
+            self.versions['week'] += 1
+            return
+
+        self.prev_bar, self.last_bar = self.last_bar, bar
+
+        month_key = (bar.date.year, bar.date.month)
+        if month_key != self.month_key:
+            self.month_key = month_key
+            self.month_bars = []
+            self._reset_month()
+        self.month_bars.append(bar)
+        self._add_to_month(bar)
+
+        iso = bar.date.isocalendar()
+        week_key = (iso[0], iso[1])
+        if week_key != self.week_key:
+            if self.week_bars:
+                self.week_history[self.week_key] = (self.week_bars[0].open, self.week_bars[-1].close)
+                for key in sorted(self.week_history)[:-WEEK_HISTORY]:
+                    del self.week_history[key]
+            self.week_key = week_key
+            prev_monday = date.fromisocalendar(week_key[0], week_key[1], 1) - timedelta(days=7)
+            self.prev_week_key = tuple(prev_monday.isocalendar())[:2]
+            self.week_bars = []
+            self._reset_week()
+        self.week_bars.append(bar)
+        self._add_to_week(bar)
+
+        for scope in self.versions:
+            self.versions[scope] += 1
+
+    @classmethod
+    def from_arrays(
+        cls,
+        asset: str,
+        dates: pd.DatetimeIndex,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        calendar: Dict[str, np.ndarray]
+    ) -> 'AssetState':
+        """
+        Build the state of a whole history at once (same state as pushing every bar).
+
+        Month and week boundaries come from searchsorted on the integer
+        calendar keys (both are non-decreasing in time) and the aggregates
+        from one max / min per slice; only the bars of the current month and
+        week become Bar objects.
+
+        Args:
+            asset: Asset key
+            dates: Sorted daily index
+            open_, high, low, close: float64 arrays aligned with dates
+            calendar: calendar_arrays(dates) (year, month, day, iso_year, iso_week)
+
+        Returns:
+            AssetState
+        """
+        state = cls(asset)
+        n = len(dates)
+        if n == 0:
+            return state
+
+        month_key = calendar['year'] * 100 + calendar['month']
+        week_key = calendar['iso_year'] * 100 + calendar['iso_week']
+        m0 = int(np.searchsorted(month_key, month_key[-1]))
+        w0 = int(np.searchsorted(week_key, week_key[-1]))
+        lo = min(m0, w0, n - 2) if n > 1 else 0
+        bars = [Bar(*row) for row in zip(dates[lo:], open_[lo:].tolist(), high[lo:].tolist(),
+                                         low[lo:].tolist(), close[lo:].tolist())]
+
+        state.last_bar = bars[-1]
+        state.prev_bar = bars[-2] if n > 1 else None
+
+        state.month_key = (int(calendar['year'][-1]), int(calendar['month'][-1]))
+        state.month_bars = bars[m0 - lo:]
+        state.month_high = float(high[m0:].max())
+        state.month_low = float(low[m0:].min())
+        w2_end = m0 + int(np.searchsorted(calendar['day'][m0:], W2_LOCK_DAY, side='right'))
+        if w2_end > m0:
+            state.w2_high = float(high[m0:w2_end].max())
+            state.w2_low = float(low[m0:w2_end].min())
+            state.w2_close = float(close[w2_end - 1])
+            state.w2_count = w2_end - m0
+
+        state.week_key = (int(calendar['iso_year'][-1]), int(calendar['iso_week'][-1]))
+        prev_monday = date.fromisocalendar(state.week_key[0], state.week_key[1], 1) - timedelta(days=7)
+        state.prev_week_key = tuple(prev_monday.isocalendar())[:2]
+        state.week_bars = bars[w0 - lo:]
+        state.week_high = float(high[w0:].max())
+        state.week_low = float(low[w0:].min())
+
+        # Open / close of the completed weeks before the current one
+        end = w0
+        while end > 0 and len(state.week_history) < WEEK_HISTORY:
+            key = week_key[end - 1]
+            start = int(np.searchsorted(week_key, key))
+            state.week_history[(int(key // 100), int(key % 100))] = (float(open_[start]), float(close[end - 1]))
+            end = start
+
+        for scope in state.versions:
+            state.versions[scope] += 1
+        return state
+
+    def week_range(self, n_days: int) -> Optional[Tuple[float, float, float]]:
+        """(high, low, close) of the first n_days bars of the week (None if fewer)."""
+        if len(self.week_bars) < n_days:
+            return None
+        base = self.week_bars[:n_days]
+        return max(b.high for b in base), min(b.low for b in base), base[-1].close
+
+    def prev_week_return(self) -> Optional[float]:
+        """Open-to-close return of the ISO week before the last bar's (None if not seen)."""
+        prev = self.week_history.get(self.prev_week_key)
+        if prev is None:
+            return None
+        return (prev[1] - prev[0]) / prev[0]
+
+
+# ============================================================
+# LAYERS (pure functions of an AssetState)
+# ============================================================
+
+def monthly_layer(state: AssetState) -> Dict:
+    """Seasonal monthly bias (always) + W2 signal (once the W1-W2 range is locked)."""
+    asset = state.asset
+    last_date = state.last_date
+    month = last_date.month
+    m_signals = []
+    m_bias = None
+
+    hit_rate = MONTHLY_BIAS.get(asset, {}).get(month, None)
+    if hit_rate is not None and hit_rate != 50.0:
+        is_bullish = hit_rate > 50
+        direction_prob = round(hit_rate, 1) if is_bullish else round(100 - hit_rate, 1)
+        m_bias = "ALCISTA" if is_bullish else "BAJISTA"
+        m_signals.append({
+            'target': 'SESGO ALCISTA' if is_bullish else 'SESGO BAJISTA',
+            'prob': direction_prob,
+            'status': 'ACTIVO',
+            'grade': get_grade(direction_prob),
+            'color': 'green' if is_bullish else 'red'
+        })
+
+    # W2 — Only show if the W2 signal is LOCKED (day >= 13)
+    if last_date.day >= W2_LOCK_DAY and state.w2_count:
+        hi, lo, w2c = state.w2_high, state.w2_low, state.w2_close
+        pos = (w2c - lo) / (hi - lo) if (hi - lo) != 0 else 0.5
+        is_bear = pos < 0.5
+        m_bias = "BAJISTA" if is_bear else "ALCISTA"
+
+        curr_lo, curr_hi = state.month_low, state.month_high
+        probs = W2_MONTHLY.get(asset, {}).get(month, None)
+        if probs:
+            p_set = probs.get('bear') if is_bear else probs.get('bull')
+            if p_set and is_bear:
+                m_signals.append({'target': 'CIERRE BAJISTA', 'prob': p_set['prob_red'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_red']), 'color': 'red'})
+                s = 'COMPLETADO' if curr_lo < (lo * 0.9995) else 'PENDIENTE'
+                m_signals.append({'target': 'NUEVO BAJO', 'prob': p_set['prob_low'], 'status': s, 'grade': get_grade(p_set['prob_low']), 'color': 'red' if s=='PENDIENTE' else 'green'})
+            elif p_set and not is_bear:
+                m_signals.append({'target': 'CIERRE ALCISTA', 'prob': p_set['prob_green'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_green']), 'color': 'green'})
+                s = 'COMPLETADO' if curr_hi > (hi * 1.0005) else 'PENDIENTE'
+                m_signals.append({'target': 'NUEVO ALTO', 'prob': p_set['prob_high'], 'status': s, 'grade': get_grade(p_set['prob_high']), 'color': 'green'})
+            # If p_set is None → this month/direction has no audited data → m_signals stays empty
+
+    return {'bias': m_bias, 'signals': m_signals}
+
+
+def fractal_layer(state: AssetState, mode: Optional[str]) -> Dict:
+    """Weekly D2 / D3 fractal signal (needs the week's Mon + Tue bars)."""
+    week = state.week_bars
+    w_signals = []
+    w_bias = None
+
+    # D2 requires Mon (d1) + Tue (d2) data. Skip holiday weeks with missing days.
+    if mode is None or len(week) < 2 or week[0].date.weekday() != 0 or week[1].date.weekday() != 1:
+        return {'bias': w_bias, 'signals': w_signals}
+
+    month = state.last_date.month
+    if mode == 'd3' and len(week) >= 3:
+        dataset = WEEKLY_SEASONAL_D3.get(state.asset, {}).get(month, None)
+        d_end = 3 # slicing up to Wed
+    else:
+        # D2 Logic (fallback if D3 triggered but not enough data)
+        dataset = WEEKLY_SEASONAL.get(state.asset, {}).get(month, None)
+        d_end = 2 # slicing up to Tue
+
+    hi, lo, close_val = state.week_range(d_end)
+    pos = (close_val - lo) / (hi - lo) if (hi - lo) != 0 else 0.5
+    is_bull = pos > 0.5
+    w_bias = "ALCISTA" if is_bull else "BAJISTA"
+
+    if pos > 0.75:
+        tier_key = 'bull_75'
+        target_close = 'CIERRE ALCISTA → ALTA CONVICCIÓN'
+    elif pos > 0.50:
+        tier_key = 'bull_50'
+        target_close = 'CIERRE ALCISTA'
+    elif pos < 0.25:
+        tier_key = 'bear_25'
+        target_close = 'CIERRE BAJISTA → ALTA CONVICCIÓN'
+    else:
+        tier_key = 'bear_50'
+        target_close = 'CIERRE BAJISTA'
+
+    # For checking completado/pendiente, we check the actual high/low of the entire week
+    curr_lo, curr_hi = state.week_low, state.week_high
+
+    if dataset:
+        p_set = dataset.get(tier_key)
+        if p_set:
+            if is_bull:
+                w_signals.append({'target': target_close, 'prob': p_set['prob_green'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_green']), 'color': 'green'})
+                s = 'COMPLETADO' if curr_hi > (hi * 1.0005) else 'PENDIENTE'
+                w_signals.append({'target': 'NUEVO ALTO', 'prob': p_set['prob_high'], 'status': s, 'grade': get_grade(p_set['prob_high']), 'color': 'green'})
+            else:
+                w_signals.append({'target': target_close, 'prob': p_set['prob_red'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_red']), 'color': 'red'})
+                s = 'COMPLETADO' if curr_lo < (lo * 0.9995) else 'PENDIENTE'
+                w_signals.append({'target': 'NUEVO BAJO', 'prob': p_set['prob_low'], 'status': s, 'grade': get_grade(p_set['prob_low']), 'color': 'red' if s=='PENDIENTE' else 'green'})
+
+    return {'bias': w_bias, 'signals': w_signals}
+
+
+def alpha_layer(state: AssetState) -> List[Dict]:
+    """Weekly alpha matrix: previous week closed beyond the mean-reversion threshold."""
+    alpha_signals = []
+    pw_ret = state.prev_week_return()
+    a_matrix = WEEKLY_ALPHA_MATRIX.get(state.asset)
+    if pw_ret is not None and a_matrix and pw_ret <= a_matrix['mean_reversion']['threshold']:
+        r = a_matrix['mean_reversion']
+        alpha_signals.append({'target': r['target'], 'prob': r['prob'], 'status': 'ACTIVO', 'grade': r['grade'], 'color': 'green'})
+    return alpha_signals
+
+
+def bias_layer(state: AssetState) -> Optional[Dict]:
+    """Weekly bias & inertia: strongest daily sigma breach of the week (None if none)."""
+    asset = state.asset
+    s_upper = SIGMA_UPPER.get(asset, 0.013)
+    s_lower = SIGMA_LOWER.get(asset, -0.013)
+    bias_candidates = []
+
+    for bar in state.week_bars:
+        o2c = bar_o2c(bar)
+        weekday = bar.date.weekday()
+        if o2c > s_upper:
+            trigger = WEEKLY_BIAS_TRIGGERS.get((asset, weekday, 'drive'))
+        elif o2c < s_lower:
+            trigger = WEEKLY_BIAS_TRIGGERS.get((asset, weekday, 'panic'))
+        else:
+            trigger = None
+        if trigger:
+            bias_candidates.append({**trigger, 'day_name': DAY_NAMES[weekday], 'o2c': o2c})
+
+    if not bias_candidates:
+        return None
+    best = max(bias_candidates, key=lambda x: x['prob'])
+    is_bull = best['direction'] == 'BULL'
+    return {
+        'target': f'SESGO {"ALCISTA" if is_bull else "BAJISTA"}',
+        'prob': best['prob'],
+        'status': 'ACTIVO',
+        'grade': best['grade'],
+        'color': 'green' if is_bull else 'red',
+        'val': f'{best["day_name"]} {best["o2c"]*100:+.2f}% → AVG {best["avg_ret"]} Sem.'
+    }
+
+
+def daily_layer(state: AssetState) -> List[Dict]:
+    """D+1 alpha: yesterday's sigma breach → today's prediction."""
+    d_signals = []
+    prev_bar = state.prev_bar
+    if prev_bar is None:
+        return d_signals
+
+    asset = state.asset
+    prev_o2c = bar_o2c(prev_bar)
+    prev_weekday = prev_bar.date.weekday()
+    prev_day_name = DAY_NAMES[prev_weekday]
+
+    if prev_o2c > SIGMA_UPPER.get(asset, 0.013):
+        d1_trigger = DAILY_ALPHA_TRIGGERS.get((asset, prev_weekday, 'drive'))
+        if d1_trigger:
+            d_signals.append({
+                'target': d1_trigger['signal'],
+                'prob': d1_trigger['prob'],
+                'status': 'ACTIVO',
+                'grade': d1_trigger['grade'],
+                'color': 'red' if 'REVERSION' in d1_trigger['signal'] else 'green',
+                'val': f'{prev_day_name} {prev_o2c*100:+.2f}% (DRIVE) → AVG D+1 {d1_trigger["avg_ret_d1"]}'
+            })
+    elif prev_o2c < SIGMA_LOWER.get(asset, -0.013):
+        d1_trigger = DAILY_ALPHA_TRIGGERS.get((asset, prev_weekday, 'panic'))
+        if d1_trigger:
+            d_signals.append({
+                'target': d1_trigger['signal'],
+                'prob': d1_trigger['prob'],
+                'status': 'ACTIVO',
+                'grade': d1_trigger['grade'],
+                'color': 'green' if 'REBOUND' in d1_trigger['signal'] else 'red',
+                'val': f'{prev_day_name} {prev_o2c*100:+.2f}% (PANIC) → AVG D+1 {d1_trigger["avg_ret_d1"]}'
+            })
+    return d_signals
+
+
+# Layer name -> (scope whose version it depends on, builder)
+LAYERS = {
+    'monthly': ('month', monthly_layer),
+    'alpha': ('week', alpha_layer),
+    'bias': ('week', bias_layer),
+    'daily': ('day', daily_layer),
+}
+
+
+def combine_layers(monthly: Dict, fractal: Dict, alpha: List[Dict], bias: Optional[Dict], daily: List[Dict]) -> Dict:
+    """Assemble the calc_layers dict from the individual layers (fresh containers)."""
+    w_bias = fractal['bias']
+    bias_signals = []
+    if bias is not None:
+        bias_signals.append(bias)
+        # Set weekly bias if D2 hasn't set it yet
+        if w_bias is None:
+            w_bias = "ALCISTA" if bias['color'] == 'green' else "BAJISTA"
+
+    return {
+        'monthly': {'bias': monthly['bias'], 'signals': list(monthly['signals'])},
+        'weekly': {'bias': w_bias, 'signals': fractal['signals'] + alpha + bias_signals},
+        'daily': {'signals': list(daily)}
+    }
+
+
+def layers_from_arrays(
+    asset: str,
+    dates: pd.DatetimeIndex,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    calendar: Optional[Dict[str, np.ndarray]] = None,
+    now_utc: Optional[datetime] = None
+) -> Optional[Dict]:
+    """
+    Stateless kernel: calc_layers dict of a daily history given as arrays.
+
+    Args:
+        asset: Asset key
+        dates: Sorted daily index
+        open_, high, low, close: float64 arrays aligned with dates
+        calendar: calendar_arrays(dates) (computed if omitted)
+        now_utc: Clock deciding whether D2 or D3 is live (default: now)
+
+    Returns:
+        Layer dict (see SignalEngine.layers), None for an empty history
+    """
+    if len(dates) == 0:
+        return None
+    calendar = calendar if calendar is not None else calendar_arrays(dates)
+    state = AssetState.from_arrays(asset, dates, open_, high, low, close, calendar)
+    return combine_layers(monthly_layer(state), fractal_layer(state, fractal_mode(now_utc)),
+                          alpha_layer(state), bias_layer(state), daily_layer(state))
+
+
+class SignalEngine:
+    """
+    Per-asset AssetState plus a cache of the layers built from it.
+
+    Usage:
+        engine = SignalEngine()
+        engine.sync('NQ', df)        # df: daily OHLC history (any column case)
+        engine.layers('NQ')          # {'monthly': ..., 'weekly': ..., 'daily': ...}
+        engine.push('NQ', date, o, h, l, c)  # single live bar
+
+    The public methods hold a re-entrant lock, so concurrent requests
+    (e.g. an API refresh that outlived its timeout and a newer one) never
+    interleave pushes on the same AssetState. Callers that read a state
+    across several calls hold engine.lock themselves.
+    """
+
+    def __init__(self):
+        self.states: Dict[str, AssetState] = {}
+        self._cache: Dict[Tuple[str, str], Tuple[tuple, object]] = {}
+        self.lock = threading.RLock()
+
+    def state(self, asset: str) -> Optional[AssetState]:
+        """State of an asset (None before its first bar)."""
+        return self.states.get(asset)
+
+    def reset(self, asset: Optional[str] = None):
+        """Drop the state of one asset (or of all)."""
+        with self.lock:
+            for key in ([asset] if asset is not None else list(self.states)):
+                self.states.pop(key, None)
+                for name in list(LAYERS) + ['fractal']:
+                    self._cache.pop((key, name), None)
+
+    def push(self, asset: str, date, open_: float, high: float, low: float, close: float):
+        """Add (or revise) one daily bar of an asset."""
+        with self.lock:
+            state = self.states.get(asset)
+            if state is None:
+                state = self.states[asset] = AssetState(asset)
+            state.push(date, open_, high, low, close)
+
+    def load(self, asset: str, df: pd.DataFrame):
+        """Rebuild an asset's state from a daily history (AssetState.from_arrays)."""
+        with self.lock:
+            self.reset(asset)
+            if df.empty:
+                return
+            arrays = ohlc_arrays(df)
+            self.states[asset] = AssetState.from_arrays(asset, df.index, arrays['open'], arrays['high'],
+                                                        arrays['low'], arrays['close'], calendar_arrays(df.index))
+
+    def sync(self, asset: str, df: pd.DataFrame) -> int:
+        """
+        Bring an asset's state up to date with a (possibly overlapping) history frame.
+
+        Bars from the last one already seen onwards are pushed (the last one
+        as a revision). If the frame does not contain that bar, or the bar
+        before it changed, the state is rebuilt with load().
+
+        Returns:
+            Number of bars applied (including the revised one; len(df) on a rebuild)
+        """
+        with self.lock:
+            if df.empty:
+                return 0
+            state = self.states.get(asset)
+            index = df.index
+            if state is None or state.last_bar is None or str(index.tz) != str(state.last_date.tz):
+                # Cold start, or a tz-aware vs naive index (not the same source)
+                self.load(asset, df)
+                return len(df)
+
+            pos = int(index.searchsorted(state.last_date))
+            arrays = ohlc_arrays(df)
+            aligned = pos < len(index) and index[pos] == state.last_date
+            if aligned and pos > 0 and state.prev_bar is not None:
+                # A revised previous bar (late settlement) invalidates the state
+                aligned = (index[pos - 1] == state.prev_bar.date
+                           and (arrays['open'][pos - 1], arrays['high'][pos - 1],
+                                arrays['low'][pos - 1], arrays['close'][pos - 1]) == state.prev_bar[1:])
+            if not aligned:
+                self.load(asset, df)
+                return len(df)
+
+            for i in range(pos, len(index)):
+                state.push(index[i], arrays['open'][i], arrays['high'][i], arrays['low'][i], arrays['close'][i])
+            return len(index) - pos
+
+    def _layer(self, state: AssetState, name: str, key: tuple, build):
+        cached = self._cache.get((state.asset, name))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._cache[(state.asset, name)] = (key, value)
+        return value
+
+    def layers(self, asset: str, now_utc: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        Monthly / weekly / daily layers of an asset (None before its first bar).
+
+        Month, week and day are those of the LAST DATA BAR, not the server
+        clock. This avoids timezone drift (e.g. 7pm CST is Tuesday in UTC
+        while the data is still Monday); now_utc only gates D2 / D3.
+
+        Args:
+            asset: Asset key
+            now_utc: Clock deciding whether D2 or D3 is live (default: now)
+
+        Returns:
+            {'monthly': {'bias', 'signals'}, 'weekly': {'bias', 'signals'},
+             'daily': {'signals'}}
+        """
+        with self.lock:
+            state = self.states.get(asset)
+            if state is None or state.last_bar is None:
+                return None
+
+            built = {
+                name: self._layer(state, name, (state.versions[scope],), lambda b=build: b(state))
+                for name, (scope, build) in LAYERS.items()
+            }
+            mode = fractal_mode(now_utc)
+            fractal = self._layer(state, 'fractal', (state.versions['week'], mode), lambda: fractal_layer(state, mode))
+
+            # Fresh containers so callers can mutate the result without touching the cache
+            return combine_layers(built['monthly'], fractal, built['alpha'], built['bias'], built['daily'])
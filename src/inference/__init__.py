@@ -0,0 +1,18 @@
+"""
+Inference Module
+Vectorized significance testing over event tables.
+"""
+
+from .grouped_stats import sufficient_stats, stats_from_sufficient, grouped_stats
+from .bootstrap import bootstrap_means, grouped_bootstrap, bootstrap_tables
+from .permutation import permutation_test, benjamini_hochberg
+from .walk_forward import walk_forward, point_in_time_table
+from .pattern_search import condition_grid, evaluate_conditions, pattern_search, pattern_search_multi
+
+__all__ = [
+    'sufficient_stats', 'stats_from_sufficient', 'grouped_stats',
+    'bootstrap_means', 'grouped_bootstrap', 'bootstrap_tables',
+    'permutation_test', 'benjamini_hochberg',
+    'walk_forward', 'point_in_time_table',
+    'condition_grid', 'evaluate_conditions', 'pattern_search', 'pattern_search_multi',
+]
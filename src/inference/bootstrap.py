@@ -0,0 +1,196 @@
+"""
+Bootstrap Module
+Percentile bootstrap confidence intervals for every cell of an event table.
+
+Resamples are drawn as index matrices: for a batch of cells padded to a
+common length, one (cells, replicates, n) array of random indices gathers all
+resampled values at once and a masked mean reduces them (0/1 outcomes are
+drawn directly from the equivalent binomial). Cells are sorted by
+size so padding stays small, and batches are capped by an element budget so
+memory stays bounded. Several assets are spread across a process pool with
+independent, reproducible random streams (SeedSequence.spawn).
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from .grouped_stats import cell_codes
+
+logger = logging.getLogger(__name__)
+
+# Max elements of one (cells x replicates x n) gather (~64 MB of float64)
+ELEMENT_BUDGET = 8_000_000
+
+
+def bootstrap_means(
+    samples: List[np.ndarray],
+    n_boot: int = 5000,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Bootstrap distribution of the mean for many samples at once.
+
+    Args:
+        samples: List of 1-D arrays (one per cell, NaN-free, may differ in length)
+        n_boot: Number of replicates per cell
+        rng: Random generator (default: fresh unseeded generator)
+
+    Returns:
+        Array (len(samples), n_boot) of resampled means (NaN rows for empty cells)
+    """
+    rng = rng or np.random.default_rng()
+    sizes = np.array([len(s) for s in samples])
+    out = np.full((len(samples), n_boot), np.nan)
+
+    # 0/1 outcomes: the resampled mean is exactly Binomial(n, p) / n
+    binary = np.array([len(s) > 0 and np.all((s == 0) | (s == 1)) for s in samples], dtype=bool)
+    for cell in np.flatnonzero(binary):
+        n = sizes[cell]
+        out[cell] = rng.binomial(n, samples[cell].mean(), n_boot) / n
+
+    order = np.argsort(sizes, kind='stable')
+    order = order[(sizes[order] > 0) & ~binary[order]]
+    pos = 0
+    while pos < len(order):
+        end = pos + 1
+        # Grow the batch while the padded gather stays within budget
+        while end < len(order) and (end - pos + 1) * n_boot * sizes[order[end]] <= ELEMENT_BUDGET:
+            end += 1
+        batch = order[pos:end]
+        max_n = sizes[batch[-1]]
+        n_batch = len(batch)
+
+        values = np.zeros((n_batch, max_n))
+        for i, cell in enumerate(batch):
+            values[i, :sizes[cell]] = samples[cell]
+        n_cell = sizes[batch].astype(np.float64)
+        valid = np.arange(max_n)[None, None, :] < sizes[batch][:, None, None]
+
+        # Split replicates when even a single cell exceeds the budget
+        b_step = max(1, min(n_boot, ELEMENT_BUDGET // max(1, n_batch * max_n)))
+        for b0 in range(0, n_boot, b_step):
+            b1 = min(n_boot, b0 + b_step)
+            idx = (rng.random((n_batch, b1 - b0, max_n)) * n_cell[:, None, None]).astype(np.int64)
+            drawn = np.take_along_axis(values[:, None, :], idx, axis=2)
+            out[batch, b0:b1] = np.where(valid, drawn, 0.0).sum(axis=2) / n_cell[:, None]
+        pos = end
+    return out
+
+
+def grouped_bootstrap(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    values: Union[str, List[str]],
+    n_boot: int = 5000,
+    ci_level: float = 0.95,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None
+) -> pd.DataFrame:
+    """
+    Bootstrap CI of the mean (hit rate for boolean outcomes) of every cell.
+
+    Args:
+        events: Event table
+        by: Grouping column(s)
+        values: Outcome column(s); booleans are treated as 0/1, NaN ignored
+        n_boot: Replicates per cell
+        ci_level: Confidence level of the percentile interval
+        seed: Seed for reproducible intervals
+
+    Returns:
+        DataFrame indexed by (*by, 'metric'), or by `by` alone when a single
+        value column is given, with n, estimate, boot_se, boot_low, boot_high
+    """
+    by_cols = [by] if isinstance(by, str) else list(by)
+    value_cols = [values] if isinstance(values, str) else list(values)
+    rng = np.random.default_rng(seed)
+
+    grouper = events.groupby(by_cols, sort=True, observed=True)
+    keys = grouper.size().index
+    codes = cell_codes(grouper)
+    # Rows with a NaN cell key (code -1) sort first and fall outside every cell's bounds
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(keys) + 1))
+
+    alpha = 1 - ci_level
+    frames = []
+    for metric in value_cols:
+        x = events[metric].to_numpy(dtype=np.float64)[order]
+        samples = [x[bounds[i]:bounds[i + 1]] for i in range(len(keys))]
+        samples = [s[~np.isnan(s)] for s in samples]
+        boot = bootstrap_means(samples, n_boot, rng)
+        with np.errstate(invalid='ignore'):
+            low, high = np.quantile(boot, [alpha / 2, 1 - alpha / 2], axis=1)
+        frames.append(pd.DataFrame({
+            'n': [len(s) for s in samples],
+            'estimate': [s.mean() if len(s) else np.nan for s in samples],
+            'boot_se': boot.std(axis=1, ddof=1),
+            'boot_low': low,
+            'boot_high': high,
+            'metric': metric,
+        }, index=keys).set_index('metric', append=True))
+
+    result = pd.concat(frames)
+    if isinstance(values, str):
+        result = result.droplevel('metric')
+    return result
+
+
+def _bootstrap_asset(job):
+    """Process pool worker: (asset, events, by, values, n_boot, ci_level, seed)."""
+    asset, events, by, values, n_boot, ci_level, seed = job
+    return asset, grouped_bootstrap(events, by, values, n_boot, ci_level, seed)
+
+
+def bootstrap_tables(
+    tables: Dict[str, pd.DataFrame],
+    by: Union[str, List[str]],
+    values: Union[str, List[str]],
+    n_boot: int = 5000,
+    ci_level: float = 0.95,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Bootstrap the event tables of several assets in a process pool.
+
+    Each asset gets its own child of SeedSequence(seed), so results are
+    reproducible and independent of scheduling.
+
+    Args:
+        tables: Dictionary of asset_key to event table
+        by: Grouping column(s)
+        values: Outcome column(s)
+        n_boot: Replicates per cell
+        ci_level: Confidence level
+        seed: Root seed
+        max_workers: Pool size (1 = run in this process)
+
+    Returns:
+        Dictionary of asset_key to bootstrap table; failed assets are
+        logged and omitted
+    """
+    children = np.random.SeedSequence(seed).spawn(len(tables))
+    jobs = [(asset, events, by, values, n_boot, ci_level, child)
+            for (asset, events), child in zip(tables.items(), children)]
+
+    results = {}
+    if max_workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                results[job[0]] = _bootstrap_asset(job)[1]
+            except Exception as e:
+                logger.warning(f"Bootstrap failed for {job[0]}: {e}")
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {job[0]: pool.submit(_bootstrap_asset, job) for job in jobs}
+        for asset, future in futures.items():
+            try:
+                results[asset] = future.result()[1]
+            except Exception as e:
+                logger.warning(f"Bootstrap failed for {asset}: {e}")
+    return results
@@ -0,0 +1,183 @@
+"""
+Grouped Statistics Module
+Hit rate, mean, t-test and binomial confidence intervals for every cell of
+an event table in one vectorized pass.
+
+Each cell (e.g. asset x month x tier x weekday) is reduced to its sufficient
+statistics (n, sum x, sum x^2, hits). Everything else is derived from those
+arrays at once, so a full audit matrix costs one groupby instead of one
+scipy.stats.ttest_1samp call per cell. Sufficient statistics of disjoint
+samples add up, so a refreshed data set only needs the new events reduced.
+
+The t-test matches scipy.stats.ttest_1samp (sample std, ddof=1).
+"""
+
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+SUFFICIENT_COLUMNS = ['n', 'sum', 'sumsq', 'hits']
+
+
+def cell_codes(grouper) -> np.ndarray:
+    """
+    Cell number of every row of a groupby, as int64.
+
+    Rows with a NaN/None grouping key (e.g. d3_tier of a holiday week) belong
+    to no cell: pandas gives them a NaN code, returned here as -1.
+    """
+    codes = grouper.ngroup().to_numpy(dtype=np.float64)
+    return np.where(np.isnan(codes), -1, codes).astype(np.int64)
+
+
+def sufficient_stats(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    values: Union[str, List[str]],
+    hit_threshold: float = 0.0
+) -> pd.DataFrame:
+    """
+    Reduce an event table to per-cell sufficient statistics.
+
+    Args:
+        events: Event table (one row per event)
+        by: Grouping column(s) defining the cells
+        values: Outcome column(s); booleans are treated as 0/1
+        hit_threshold: A value counts as a hit when it is > hit_threshold
+
+    Returns:
+        DataFrame indexed by (*by, 'metric') with n, sum, sumsq, hits.
+        NaN outcomes and rows with a NaN grouping key are ignored.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    values = [values] if isinstance(values, str) else list(values)
+
+    # One factorization of the cell keys, then bincount per statistic
+    grouper = events.groupby(by, sort=True, observed=True)
+    codes = cell_codes(grouper)
+    keep = codes >= 0
+    codes = codes[keep]
+    n_cells = grouper.ngroups
+    keys = grouper.size().index
+
+    frames = []
+    for metric in values:
+        x = events[metric].to_numpy(dtype=np.float64)[keep]
+        valid = ~np.isnan(x)
+        x0 = np.where(valid, x, 0.0)
+        frames.append(pd.DataFrame({
+            'n': np.bincount(codes, weights=valid, minlength=n_cells).astype(np.int64),
+            'sum': np.bincount(codes, weights=x0, minlength=n_cells),
+            'sumsq': np.bincount(codes, weights=x0 * x0, minlength=n_cells),
+            'hits': np.bincount(codes, weights=x > hit_threshold, minlength=n_cells).astype(np.int64),
+            'metric': metric,
+        }, index=keys).set_index('metric', append=True))
+    return pd.concat(frames)
+
+
+def stats_from_sufficient(
+    suff: pd.DataFrame,
+    null: float = 0.0,
+    alternative: str = 'two-sided',
+    ci_level: float = 0.95,
+    ci_method: str = 'wilson'
+) -> pd.DataFrame:
+    """
+    Derive the test statistics of every cell from its sufficient statistics.
+
+    Args:
+        suff: Output of sufficient_stats (or a sum of several)
+        null: Hypothesized mean of the t-test (0 for returns, 0.5 for 0/1 outcomes)
+        alternative: 'two-sided', 'greater' or 'less'
+        ci_level: Confidence level of the hit-rate interval
+        ci_method: 'wilson' or 'exact' (Clopper-Pearson)
+
+    Returns:
+        DataFrame with n, hit_rate, mean, std, t_stat, p_value, ci_low, ci_high
+    """
+    if alternative not in ('two-sided', 'greater', 'less'):
+        raise ValueError(f"Unknown alternative: {alternative}. Available: ['two-sided', 'greater', 'less']")
+    if ci_method not in ('wilson', 'exact'):
+        raise ValueError(f"Unknown ci_method: {ci_method}. Available: ['wilson', 'exact']")
+
+    n = suff['n'].to_numpy(dtype=np.float64)
+    s1 = suff['sum'].to_numpy(dtype=np.float64)
+    s2 = suff['sumsq'].to_numpy(dtype=np.float64)
+    hits = suff['hits'].to_numpy(dtype=np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = s1 / n
+        var = np.maximum(s2 - n * mean * mean, 0.0) / (n - 1)
+        std = np.where(n > 1, np.sqrt(var), np.nan)
+        t_stat = (mean - null) / (std / np.sqrt(n))
+        hit_rate = hits / n
+
+    df = n - 1
+    if alternative == 'two-sided':
+        p_value = 2 * stats.t.sf(np.abs(t_stat), df)
+    elif alternative == 'greater':
+        p_value = stats.t.sf(t_stat, df)
+    else:
+        p_value = stats.t.cdf(t_stat, df)
+
+    alpha = 1 - ci_level
+    if ci_method == 'wilson':
+        z = stats.norm.ppf(1 - alpha / 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            denom = 1 + z * z / n
+            center = (hit_rate + z * z / (2 * n)) / denom
+            half = z * np.sqrt(hit_rate * (1 - hit_rate) / n + z * z / (4 * n * n)) / denom
+        ci_low, ci_high = center - half, center + half
+    else:
+        with np.errstate(invalid='ignore'):
+            ci_low = np.where(hits > 0, stats.beta.ppf(alpha / 2, hits, n - hits + 1), 0.0)
+            ci_high = np.where(hits < n, stats.beta.ppf(1 - alpha / 2, hits + 1, n - hits), 1.0)
+
+    return pd.DataFrame({
+        'n': n.astype(np.int64),
+        'hit_rate': hit_rate,
+        'mean': mean,
+        'std': std,
+        't_stat': t_stat,
+        'p_value': p_value,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+    }, index=suff.index)
+
+
+def grouped_stats(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    values: Union[str, List[str]],
+    null: float = 0.0,
+    alternative: str = 'two-sided',
+    hit_threshold: float = 0.0,
+    ci_level: float = 0.95,
+    ci_method: str = 'wilson'
+) -> pd.DataFrame:
+    """
+    Statistics of every (group, metric) cell of an event table.
+
+    Args:
+        events: Event table
+        by: Grouping column(s)
+        values: Outcome column(s); booleans are treated as 0/1
+        null: Hypothesized mean of the t-test
+        alternative: 'two-sided', 'greater' or 'less'
+        hit_threshold: Hit when value > threshold (0: True for booleans,
+            positive for returns)
+        ci_level: Confidence level of the hit-rate interval
+        ci_method: 'wilson' or 'exact'
+
+    Returns:
+        DataFrame indexed by (*by, 'metric'), or by `by` alone when a single
+        value column is given, with n, hit_rate, mean, std, t_stat, p_value,
+        ci_low, ci_high
+    """
+    suff = sufficient_stats(events, by, values, hit_threshold)
+    result = stats_from_sufficient(suff, null, alternative, ci_level, ci_method)
+    if isinstance(values, str):
+        result = result.droplevel('metric')
+    return result
@@ -0,0 +1,270 @@
+"""
+Pattern Search Module
+Declarative condition x outcome search over event tables.
+
+Conditions are declared once as boolean columns of an event table (a
+DataFrame.eval expression, a callable or an array) and crossed in pairs or
+triples against chosen outcomes:
+
+    conditions = {
+        'd2_bull': "d2_signal == 'BULL'",
+        'd3_broke_high': 'd3_broke_high',
+        **condition_grid('d2_month', range(1, 13)),
+    }
+    table = pattern_search(events, conditions, ['green_week', 'week_ret'], max_order=2)
+
+Conditions are stored bit-packed (np.packbits, 8 events per byte). Support
+counts of candidate prefixes are AND + popcount on the packed rows, so
+prefixes with fewer than `min_n` events are pruned before any statistics
+are computed. For each surviving prefix, one matrix product of the extended
+condition matrix with the outcome matrix yields n, sum, sum of squares and
+hits of every (prefix & condition, outcome) cell at once; the statistics
+come from stats_from_sufficient. Assets are spread across a process pool,
+and only the packed conditions and outcome arrays are sent to the workers.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Callable, Dict, Iterable, List, Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from .grouped_stats import stats_from_sufficient
+from .permutation import benjamini_hochberg
+
+logger = logging.getLogger(__name__)
+
+ConditionSpec = Union[str, Callable[[pd.DataFrame], pd.Series], np.ndarray, pd.Series]
+
+# Set bits of every byte value (popcount lookup for packed rows)
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def condition_grid(column: str, values: Iterable, name: Optional[str] = None) -> Dict[str, str]:
+    """
+    One equality condition per value of a column.
+
+    Args:
+        column: Event table column (e.g. 'd2_month')
+        values: Values to test (e.g. range(1, 13))
+        name: Prefix of the condition names (default: column)
+
+    Returns:
+        Dictionary of condition name ('<name>=<value>') to eval expression
+    """
+    name = name or column
+    return {f'{name}={v}': f'{column} == {v!r}' for v in values}
+
+
+def evaluate_conditions(events: pd.DataFrame, conditions: Dict[str, ConditionSpec]) -> np.ndarray:
+    """
+    Evaluate declared conditions into a boolean matrix.
+
+    Args:
+        events: Event table
+        conditions: Dictionary of name to DataFrame.eval expression, callable
+            (events -> boolean Series) or boolean array aligned with events
+
+    Returns:
+        Boolean array (len(conditions), len(events)); NaN comparisons are False
+    """
+    rows = []
+    for name, spec in conditions.items():
+        if isinstance(spec, str):
+            mask = events.eval(spec)
+        elif callable(spec):
+            mask = spec(events)
+        else:
+            mask = spec
+        mask = np.asarray(pd.Series(mask, index=events.index).fillna(False), dtype=bool)
+        if mask.shape != (len(events),):
+            raise ValueError(f"Condition '{name}' does not align with the event table")
+        rows.append(mask)
+    return np.vstack(rows) if rows else np.zeros((0, len(events)), dtype=bool)
+
+
+def _popcount(packed: np.ndarray) -> np.ndarray:
+    """Set bits per row of a packed boolean matrix."""
+    return _POPCOUNT[packed].sum(axis=-1)
+
+
+def _search_packed(job) -> pd.DataFrame:
+    """
+    Process pool worker: every pattern of one asset.
+
+    job = (asset, names, packed, n_events, outcomes, values, max_order, min_n, hit_threshold)
+    """
+    asset, names, packed, n_events, outcome_names, values, max_order, min_n, hit_threshold = job
+    k = len(names)
+    conds = np.unpackbits(packed, axis=1, count=n_events).astype(np.float64)
+
+    # Outcome design matrix: per outcome [valid, x, x^2, hit] (NaN outcomes ignored)
+    valid = ~np.isnan(values)
+    x0 = np.where(valid, values, 0.0)
+    design = np.hstack([valid, x0, x0 * x0, valid & (x0 > hit_threshold)]).astype(np.float64)
+    m = len(outcome_names)
+
+    rows = []
+    support = _popcount(packed)
+
+    def extend(prefix: tuple, prefix_bits: Optional[np.ndarray]):
+        # Extensions by conditions after the prefix's last one (no repeats)
+        first = prefix[-1] + 1 if prefix else 0
+        if first >= k:
+            return
+        block = conds[first:]
+        if prefix_bits is not None:
+            block = block * np.unpackbits(prefix_bits, count=n_events).astype(np.float64)
+        sums = block @ design
+        for j in np.flatnonzero(sums[:, :m].max(axis=1) >= min_n):
+            combo = prefix + (first + j,)
+            rows.append((combo, sums[j]))
+
+    extend((), None)
+    for order in range(2, max_order + 1):
+        for prefix in combinations(range(k), order - 1):
+            if support[list(prefix)].min() < min_n:
+                continue
+            bits = np.bitwise_and.reduce(packed[list(prefix)], axis=0)
+            # Apriori pruning: a pattern never has more events than its prefix
+            if _popcount(bits) < min_n:
+                continue
+            extend(prefix, bits)
+
+    if not rows:
+        return pd.DataFrame()
+
+    combos = [r[0] for r in rows]
+    sums = np.vstack([r[1] for r in rows]).reshape(len(rows), 4, m)
+    records = {
+        'asset': np.repeat(asset, len(rows) * m),
+        'pattern': np.repeat([' & '.join(names[i] for i in c) for c in combos], m),
+        'order': np.repeat([len(c) for c in combos], m),
+        'outcome': np.tile(outcome_names, len(rows)),
+    }
+    suff = pd.DataFrame({
+        'n': sums[:, 0, :].ravel().round().astype(np.int64),
+        'sum': sums[:, 1, :].ravel(),
+        'sumsq': sums[:, 2, :].ravel(),
+        'hits': sums[:, 3, :].ravel().round().astype(np.int64),
+    })
+    return pd.concat([pd.DataFrame(records), suff], axis=1)
+
+
+def _finish(suff: pd.DataFrame, min_n: int, null: float, alternative: str) -> pd.DataFrame:
+    """Statistics, q-values and ordering of raw pattern sums."""
+    if suff.empty:
+        return pd.DataFrame(columns=['asset', 'pattern', 'order', 'outcome', 'n', 'hit_rate', 'mean',
+                                     'std', 't_stat', 'p_value', 'ci_low', 'ci_high', 'q_fdr'])
+    suff = suff[suff['n'] >= min_n].reset_index(drop=True)
+    stats = stats_from_sufficient(suff, null, alternative)
+    result = pd.concat([suff[['asset', 'pattern', 'order', 'outcome']], stats], axis=1)
+    result['q_fdr'] = benjamini_hochberg(result['p_value'].to_numpy())
+    return result.sort_values('p_value', kind='stable').reset_index(drop=True)
+
+
+def _build_job(asset, events, conditions, outcomes, max_order, min_n, hit_threshold):
+    """Evaluate and pack the conditions of one asset for a worker."""
+    if max_order not in (1, 2, 3):
+        raise ValueError(f"Unknown max_order: {max_order}. Available: [1, 2, 3]")
+    outcome_names = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+    matrix = evaluate_conditions(events, conditions)
+    values = events[outcome_names].to_numpy(dtype=np.float64)
+    return (asset, list(conditions), np.packbits(matrix, axis=1), len(events),
+            outcome_names, values, max_order, min_n, hit_threshold)
+
+
+def pattern_search(
+    events: pd.DataFrame,
+    conditions: Dict[str, ConditionSpec],
+    outcomes: Union[str, List[str]],
+    max_order: int = 2,
+    min_n: int = 20,
+    null: float = 0.0,
+    alternative: str = 'two-sided',
+    hit_threshold: float = 0.0,
+    asset: str = ''
+) -> pd.DataFrame:
+    """
+    Evaluate every combination of up to `max_order` conditions against the outcomes.
+
+    Args:
+        events: Event table
+        conditions: Dictionary of name to condition (see evaluate_conditions)
+        outcomes: Outcome column(s); booleans are treated as 0/1
+        max_order: Largest number of conditions combined with AND (1, 2 or 3)
+        min_n: Minimum number of events of a reported pattern
+        null: Hypothesized mean of the t-test (0.5 for 0/1 outcomes)
+        alternative: 'two-sided', 'greater' or 'less'
+        hit_threshold: Hit when outcome > threshold
+        asset: Label of the asset column
+
+    Returns:
+        DataFrame with asset, pattern, order, outcome, the grouped_stats
+        columns and q_fdr (Benjamini-Hochberg over all reported patterns),
+        sorted by p_value
+    """
+    job = _build_job(asset, events, conditions, outcomes, max_order, min_n, hit_threshold)
+    return _finish(_search_packed(job), min_n, null, alternative)
+
+
+def pattern_search_multi(
+    tables: Dict[str, pd.DataFrame],
+    conditions: Dict[str, ConditionSpec],
+    outcomes: Union[str, List[str]],
+    max_order: int = 2,
+    min_n: int = 20,
+    null: float = 0.0,
+    alternative: str = 'two-sided',
+    hit_threshold: float = 0.0,
+    max_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Pattern search over the event tables of several assets in a process pool.
+
+    Conditions are evaluated in this process (callables need not be
+    picklable); workers receive the packed condition matrix and outcome arrays.
+
+    Args:
+        tables: Dictionary of asset_key to event table
+        conditions: Dictionary of name to condition
+        outcomes: Outcome column(s)
+        max_order: Largest number of conditions combined (1, 2 or 3)
+        min_n: Minimum number of events of a reported pattern
+        null: Hypothesized mean of the t-test
+        alternative: 'two-sided', 'greater' or 'less'
+        hit_threshold: Hit when outcome > threshold
+        max_workers: Pool size (1 = run in this process)
+
+    Returns:
+        Combined table of every asset (q_fdr over all assets and patterns);
+        failed assets are logged and omitted
+    """
+    jobs = []
+    for asset, events in tables.items():
+        try:
+            jobs.append(_build_job(asset, events, conditions, outcomes, max_order, min_n, hit_threshold))
+        except Exception as e:
+            logger.warning(f"Pattern search failed for {asset}: {e}")
+
+    results = []
+    if max_workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                results.append(_search_packed(job))
+            except Exception as e:
+                logger.warning(f"Pattern search failed for {job[0]}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {job[0]: pool.submit(_search_packed, job) for job in jobs}
+            for asset, future in futures.items():
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.warning(f"Pattern search failed for {asset}: {e}")
+
+    results = [r for r in results if not r.empty]
+    suff = pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+    return _finish(suff, min_n, null, alternative)
@@ -0,0 +1,152 @@
+"""
+Permutation Test Module
+Label-shuffling significance for pattern scans with multiple-comparison control.
+
+A scan evaluates many cells (asset x month x direction, ...) and keeps the
+best ones, so some survivors are luck. Under the null hypothesis the outcome
+of an event does not depend on the cell it falls in. The outcome rows are
+shuffled within each stratum (asset), every cell statistic is recomputed for
+every permutation, and the observed statistics are compared with:
+
+- p_raw:  per-cell permutation p-value
+- p_fwer: Westfall-Young single-step maxT (family-wise error over all cells,
+          statistics standardized per cell so different sample sizes compare)
+- q_fdr:  Benjamini-Hochberg adjusted p_raw
+
+Permutations are index matrices: one (permutations, events) argsort per
+stratum gathers every shuffled outcome, and a matrix product with the
+one-hot cell membership yields all cell sums at once.
+"""
+
+from typing import Dict, List, Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from .grouped_stats import cell_codes
+
+# Max elements of one (permutations x events) gather
+ELEMENT_BUDGET = 4_000_000
+
+
+def benjamini_hochberg(p_values: np.ndarray) -> np.ndarray:
+    """Benjamini-Hochberg adjusted p-values (q-values); NaN entries are left out."""
+    p = np.asarray(p_values, dtype=np.float64)
+    q = np.full_like(p, np.nan)
+    valid = np.flatnonzero(~np.isnan(p))
+    if len(valid) == 0:
+        return q
+    order = valid[np.argsort(p[valid])]
+    m = len(order)
+    ranked = p[order] * m / np.arange(1, m + 1)
+    q[order] = np.minimum(1.0, np.minimum.accumulate(ranked[::-1])[::-1])
+    return q
+
+
+def permutation_test(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    outcome: Union[str, Dict[str, str]],
+    side: Optional[str] = None,
+    strata: Optional[str] = 'asset',
+    n_perm: int = 10000,
+    alternative: str = 'greater',
+    seed: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Permutation test of the mean outcome (win rate for 0/1 outcomes) of every cell.
+
+    Args:
+        events: Event table
+        by: Cell columns (e.g. ['asset', 'month', 'signal'])
+        outcome: Outcome column (NaN-free), or a mapping from the value of the `side`
+            column to the outcome column that counts for it, e.g.
+            {'BULL': 'green', 'BEAR': 'red'}. All outcome columns of an event
+            are shuffled together, so direction-dependent wins stay consistent.
+        side: Column selecting the outcome when `outcome` is a mapping
+        strata: Column whose groups are shuffled independently (None = all events)
+        n_perm: Number of permutations
+        alternative: 'greater' (cell mean unusually high) or 'less'
+        seed: Seed for reproducible p-values
+
+    Returns:
+        DataFrame indexed by the cells with n, stat (observed mean),
+        perm_mean, p_raw, p_fwer, q_fdr
+    """
+    if alternative not in ('greater', 'less'):
+        raise ValueError(f"Unknown alternative: {alternative}. Available: ['greater', 'less']")
+
+    by_cols = [by] if isinstance(by, str) else list(by)
+    grouper = events.groupby(by_cols, sort=True, observed=True)
+    keys = grouper.size().index
+    cell = cell_codes(grouper)
+    stratum = (cell_codes(events.groupby(strata, sort=False))
+               if strata is not None else np.zeros(len(events), dtype=np.int64))
+    # Events with a NaN cell or stratum key belong to no cell and are not shuffled
+    keep = (cell >= 0) & (stratum >= 0)
+    events, cell, stratum = events[keep], cell[keep], stratum[keep]
+    n_cells = len(keys)
+
+    if isinstance(outcome, str):
+        outcome_cols = [outcome]
+        side_idx = np.zeros(len(events), dtype=np.int64)
+    else:
+        if side is None:
+            raise ValueError("side is required when outcome is a mapping")
+        outcome_cols = list(outcome.values())
+        lookup = {key: i for i, key in enumerate(outcome)}
+        side_idx = events[side].map(lookup).to_numpy()
+        if pd.isna(side_idx).any():
+            raise ValueError(f"Values of '{side}' without an outcome column: "
+                             f"{sorted(set(events[side]) - set(outcome))}")
+        side_idx = side_idx.astype(np.int64)
+
+    values = events[outcome_cols].to_numpy(dtype=np.float64)
+
+    rng = np.random.default_rng(seed)
+    sign = 1.0 if alternative == 'greater' else -1.0
+
+    n = np.bincount(cell, minlength=n_cells).astype(np.float64)
+    observed = np.bincount(cell, weights=values[np.arange(len(events)), side_idx], minlength=n_cells) / n
+    perm_sums = np.zeros((n_perm, n_cells))
+
+    for s in np.unique(stratum):
+        rows = np.flatnonzero(stratum == s)
+        n_rows = len(rows)
+        vals = values[rows]
+        sides = side_idx[rows]
+        onehot = np.zeros((n_rows, n_cells))
+        onehot[np.arange(n_rows), cell[rows]] = 1.0
+
+        step = max(1, ELEMENT_BUDGET // max(1, n_rows))
+        for p0 in range(0, n_perm, step):
+            p1 = min(n_perm, p0 + step)
+            perm = np.argsort(rng.random((p1 - p0, n_rows)), axis=1)
+            shuffled = vals[perm, sides[None, :]]
+            perm_sums[p0:p1] += shuffled @ onehot
+
+    perm_stats = perm_sums / n
+    perm_mean = perm_stats.mean(axis=0)
+    perm_std = perm_stats.std(axis=0)
+
+    # Per-cell p-value (+1 smoothing so p is never 0)
+    exceed = (sign * perm_stats >= sign * observed - 1e-12).sum(axis=0)
+    p_raw = (1 + exceed) / (1 + n_perm)
+
+    # Westfall-Young maxT on per-cell standardized statistics
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z_obs = sign * (observed - perm_mean) / perm_std
+        z_perm = sign * (perm_stats - perm_mean) / perm_std
+    z_obs = np.where(perm_std > 0, z_obs, -np.inf)
+    max_perm = np.where(perm_std > 0, z_perm, -np.inf).max(axis=1)
+    p_fwer = (1 + (max_perm[:, None] >= z_obs[None, :] - 1e-12).sum(axis=0)) / (1 + n_perm)
+    p_fwer = np.where(perm_std > 0, p_fwer, 1.0)
+
+    return pd.DataFrame({
+        'n': n.astype(np.int64),
+        'stat': observed,
+        'perm_mean': perm_mean,
+        'p_raw': p_raw,
+        'p_fwer': p_fwer,
+        'q_fdr': benjamini_hochberg(p_raw),
+    }, index=keys)
@@ -0,0 +1,119 @@
+"""
+Walk-Forward Module
+Point-in-time (lookahead-free) probability estimates for signal cells.
+
+For every event, the probability of its cell (e.g. month x signal) is
+estimated only from earlier events of the same cell: an expanding estimate
+over all prior events, or a rolling one over the last `window` events.
+Both come from per-cell cumulative sums of the sorted event table, so the
+full history costs O(n) after sorting instead of one re-estimate per date.
+
+Events are ordered by `time_col` and an event only sees events with a
+strictly earlier time. Use the signal time of non-overlapping periods
+(w2_end, week_start, ...): a previous period's outcome is always resolved
+before the next period's signal. point_in_time_table instead filters on a
+resolution-time column (the period end), since a table as of a date may only
+hold outcomes already resolved by then.
+"""
+
+from typing import List, Union, Optional
+
+import numpy as np
+import pandas as pd
+
+from .grouped_stats import grouped_stats
+
+
+def walk_forward(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    outcomes: Union[str, List[str]],
+    time_col: str,
+    window: Optional[int] = None,
+    min_periods: int = 1
+) -> pd.DataFrame:
+    """
+    Point-in-time cell estimates for every event.
+
+    Args:
+        events: Event table
+        by: Cell columns (e.g. ['month', 'signal'])
+        outcomes: Outcome column(s), NaN-free; booleans are treated as 0/1
+        time_col: Event time column
+        window: Use only the last `window` prior events of the cell
+            (None = expanding over all prior events)
+        min_periods: Minimum prior events for an estimate (NaN below)
+
+    Returns:
+        DataFrame aligned with events.index with prior_n and, per outcome,
+        '<outcome>_prob' (mean of the prior events = hit rate for 0/1 outcomes)
+    """
+    by_cols = [by] if isinstance(by, str) else list(by)
+    outcome_cols = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+
+    cell = events.groupby(by_cols, sort=False, observed=True).ngroup().to_numpy()
+    times = events[time_col].to_numpy()
+    order = np.lexsort((times, cell))
+    cell_s, time_s = cell[order], times[order]
+    n = len(order)
+
+    new_cell = np.r_[True, cell_s[1:] != cell_s[:-1]] if n else np.zeros(0, dtype=bool)
+    cell_start = np.maximum.accumulate(np.where(new_cell, np.arange(n), 0))
+    # Events sharing a time inside a cell see the same prior (the tie's first row)
+    new_time = new_cell | np.r_[True, time_s[1:] != time_s[:-1]] if n else new_cell
+    tie_start = np.maximum.accumulate(np.where(new_time, np.arange(n), 0))
+
+    # Prior events of row i: positions [lo, tie_start[i]) within its cell
+    hi = tie_start
+    lo = cell_start if window is None else np.maximum(cell_start, hi - window)
+    prior_n = hi - lo
+
+    result = pd.DataFrame(index=events.index)
+    prior_n_out = np.empty(n, dtype=np.int64)
+    prior_n_out[order] = prior_n
+    result['prior_n'] = prior_n_out
+
+    for col in outcome_cols:
+        x = events[col].to_numpy(dtype=np.float64)[order]
+        # Exclusive prefix sums: cs[k] = sum of the first k sorted rows
+        cs = np.concatenate([[0.0], np.cumsum(x)])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            prob = (cs[hi] - cs[lo]) / prior_n
+        prob = np.where(prior_n >= min_periods, prob, np.nan)
+        out = np.empty(n)
+        out[order] = prob
+        result[f'{col}_prob'] = out
+    return result
+
+
+def point_in_time_table(
+    events: pd.DataFrame,
+    by: Union[str, List[str]],
+    values: Union[str, List[str]],
+    end_col: str,
+    as_of,
+    window: Optional[int] = None,
+    **stats_kwargs
+) -> pd.DataFrame:
+    """
+    Cell statistics as they were known at `as_of` (events resolved strictly before it).
+
+    Args:
+        events: Event table
+        by: Cell columns
+        values: Outcome column(s)
+        end_col: Resolution time column (period end, e.g. month_end, week_end);
+            an event whose signal fired before as_of but whose period is still
+            open is excluded
+        as_of: Cut-off time
+        window: Keep only the last `window` resolved events of each cell
+        **stats_kwargs: Passed to grouped_stats (null, alternative, ...)
+
+    Returns:
+        grouped_stats table of the events known at as_of
+    """
+    by_cols = [by] if isinstance(by, str) else list(by)
+    known = events[events[end_col] < as_of]
+    if window is not None:
+        known = known.sort_values(end_col).groupby(by_cols, sort=False, observed=True).tail(window)
+    return grouped_stats(known, by_cols, values, **stats_kwargs)
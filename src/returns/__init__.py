@@ -3,5 +3,6 @@ Returns Module
 """
 
 from .returns_calculator import ReturnsCalculator, calculate_returns
+from .forward_returns import ForwardReturns, get_forward_returns
 
-__all__ = ['ReturnsCalculator', 'calculate_returns']
+__all__ = ['ReturnsCalculator', 'calculate_returns', 'ForwardReturns', 'get_forward_returns']
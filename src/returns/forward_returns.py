@@ -0,0 +1,172 @@
+"""
+Forward Returns Module
+Cached per-asset tensor of forward returns for conditional studies.
+
+For every bar t the tensor holds close-to-close returns to t+1 .. t+N and to
+the close of the current week, month and quarter:
+
+    R[t, k] = close[t + k] / close[t] - 1        (k = 1..N)
+    R[t, 'week'] = close[last bar of t's week] / close[t] - 1
+
+The N fixed horizons are read from a sliding-window view of the padded close
+series (no per-horizon copies or shift() calls). Any boolean condition mask
+is evaluated against every horizon in one reduction, and many masks at once
+with a single matrix product (sweep).
+"""
+
+from typing import Dict, Tuple, Optional, List
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.data.calendar_index import get_calendar, data_version
+from src.signals.base import ohlc_fingerprint
+
+_CACHE: Dict[Tuple[str, str, str, int], 'ForwardReturns'] = {}
+# Oldest entries are evicted beyond this many cached tensors
+_CACHE_SIZE = 32
+
+PERIOD_END_FLAGS = {
+    'week': 'is_week_end',
+    'month': 'is_month_end',
+    'quarter': 'is_quarter_end',
+}
+
+
+def _period_end_close(close: np.ndarray, is_end: np.ndarray) -> np.ndarray:
+    """Close of the last bar of each bar's period."""
+    n = len(close)
+    end_pos = np.flatnonzero(is_end)
+    # Next period-end position at or after each bar
+    nxt = np.searchsorted(end_pos, np.arange(n))
+    out = np.full(n, np.nan)
+    valid = nxt < len(end_pos)
+    out[valid] = close[end_pos[nxt[valid]]]
+    return out
+
+
+class ForwardReturns:
+    """
+    Forward return matrix of one asset.
+
+    Columns are the fixed horizons d1..dN followed by the period-end horizons
+    week, month and quarter. Missing horizons (past the end of the data) are NaN.
+    The last period of the series counts as closed at the last bar.
+    """
+
+    def __init__(self, data: pd.DataFrame, horizons: int = 20, asset_key: Optional[str] = None):
+        """
+        Initialize ForwardReturns.
+
+        Args:
+            data: Daily price DataFrame with a 'close' (or 'Close') column
+            horizons: Number of fixed trading-day horizons
+            asset_key: Asset identifier for the calendar cache
+        """
+        close_col = 'close' if 'close' in data.columns else 'Close'
+        close = data[close_col].to_numpy(dtype=np.float64)
+        n = len(close)
+
+        self.index = data.index
+        self.horizons = horizons
+
+        # (n, horizons + 1) strided view: row t = close[t .. t + horizons]
+        padded = np.concatenate([close, np.full(horizons, np.nan)])
+        window = sliding_window_view(padded, horizons + 1)
+        fixed = window[:, 1:] / window[:, :1] - 1
+
+        cal = get_calendar(data, asset_key)
+        period = []
+        for name, flag in PERIOD_END_FLAGS.items():
+            period.append(_period_end_close(close, cal[flag].to_numpy()) / close - 1)
+
+        self.matrix = np.column_stack([fixed] + period) if n else np.empty((0, horizons + 3))
+        self.columns: List[str] = [f'd{k}' for k in range(1, horizons + 1)] + list(PERIOD_END_FLAGS)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Forward return matrix as a DataFrame."""
+        return pd.DataFrame(self.matrix, index=self.index, columns=self.columns)
+
+    def conditional(self, mask) -> pd.DataFrame:
+        """
+        Outcome statistics of every horizon over the bars where mask is True.
+
+        Args:
+            mask: Boolean array / Series aligned with the data
+
+        Returns:
+            DataFrame indexed by horizon with n, mean, std, hit_rate (share of
+            positive returns) and t_stat (mean / (std / sqrt(n)))
+        """
+        mask = np.asarray(mask, dtype=bool)
+        return self.sweep({'mask': mask}).loc['mask']
+
+    def sweep(self, masks: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        Outcome statistics of many condition masks against every horizon.
+
+        All masks are stacked into one (m, n) matrix and reduced against the
+        return matrix with matrix products (counts, sums, sums of squares, hits).
+
+        Args:
+            masks: Dictionary of condition name to boolean mask
+
+        Returns:
+            DataFrame with a (condition, horizon) MultiIndex and columns
+            n, mean, std, hit_rate, t_stat
+        """
+        names = list(masks)
+        m = np.vstack([np.asarray(masks[k], dtype=bool) for k in names]).astype(np.float64)
+
+        valid = ~np.isnan(self.matrix)
+        r = np.where(valid, self.matrix, 0.0)
+
+        n = m @ valid
+        s1 = m @ r
+        s2 = m @ (r * r)
+        pos = m @ (r > 0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = s1 / n
+            var = (s2 - n * mean * mean) / (n - 1)
+            std = np.sqrt(np.maximum(var, 0.0))
+            hit = pos / n
+            t_stat = mean / (std / np.sqrt(n))
+
+        idx = pd.MultiIndex.from_product([names, self.columns], names=['condition', 'horizon'])
+        return pd.DataFrame({
+            'n': n.ravel().astype(int),
+            'mean': mean.ravel(),
+            'std': std.ravel(),
+            'hit_rate': hit.ravel(),
+            't_stat': t_stat.ravel(),
+        }, index=idx)
+
+
+def get_forward_returns(data: pd.DataFrame, asset_key: Optional[str] = None, horizons: int = 20) -> ForwardReturns:
+    """
+    Cached ForwardReturns, keyed by (asset, index and OHLC fingerprints, horizons).
+
+    Args:
+        data: Daily price DataFrame
+        asset_key: Asset identifier (default: data.attrs['asset_key'])
+        horizons: Number of fixed trading-day horizons
+
+    Returns:
+        ForwardReturns instance (treat as read-only)
+    """
+    asset_key = asset_key or data.attrs.get('asset_key', '')
+    key = (asset_key, data_version(data.index), ohlc_fingerprint(data), horizons)
+    fwd = _CACHE.get(key)
+    if fwd is None:
+        fwd = ForwardReturns(data, horizons, asset_key)
+        while len(_CACHE) >= _CACHE_SIZE:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = fwd
+    return fwd
+
+
+def clear_forward_cache() -> None:
+    """Drop every cached forward return matrix."""
+    _CACHE.clear()
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 import os
+from src.data.calendar_index import get_calendar
 
 class ExtremesAnalyzer:
     """
@@ -11,8 +12,9 @@ class ExtremesAnalyzer:
     def __init__(self, data: pd.DataFrame):
         self.data = data.copy()
         if 'trading_day_year' not in self.data.columns:
-            self.data['year'] = self.data.index.year
-            self.data['trading_day_year'] = self.data.groupby('year').cumcount() + 1
+            cal = get_calendar(data)
+            self.data['year'] = cal['year'].to_numpy()
+            self.data['trading_day_year'] = cal['tdoy'].to_numpy()
             
     def analyze_extremes(self) -> pd.DataFrame:
         """
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
+from src.data.calendar_index import get_calendar
 
 class SeasonalityCalculator:
     def __init__(self, data: pd.DataFrame):
@@ -22,9 +23,13 @@ class SeasonalityCalculator:
         # We do NOT dropna here, because we want to keep the first row for Monthly resampling (as a base)
         # self.data.dropna(inplace=True)  <-- REMOVED
         
-        self.data['month'] = self.data.index.month
-        self.data['year'] = self.data.index.year
-        self.data['day'] = self.data.index.day
+        # Calendar fields come from the shared per-asset calendar table
+        cal = get_calendar(data)
+        self.data['month'] = cal['month'].to_numpy()
+        self.data['year'] = cal['year'].to_numpy()
+        self.data['day'] = cal['day'].to_numpy()
+        self.data['tdom'] = cal['tdom'].to_numpy()
+        self.data['tdoq'] = cal['tdoq'].to_numpy()
 
     def calculate_monthly_stats(self) -> pd.DataFrame:
         """
@@ -87,8 +92,8 @@ class SeasonalityCalculator:
         # Filter target month
         month_data = self.data[self.data['month'] == target_month].copy()
         
-        # Assign Trading Day Rank for each year
-        month_data['trading_day'] = month_data.groupby('year')['day'].rank(method='first').astype(int)
+        # Trading Day Rank within the month (precomputed calendar)
+        month_data['trading_day'] = month_data['tdom'].astype(int)
         
         # Calculate mean daily return
         mean_daily_returns = month_data.pivot(index='trading_day', columns='year', values='pct_change').mean(axis=1)
@@ -112,9 +117,8 @@ class SeasonalityCalculator:
         # Filter target quarter
         q_data = self.data[self.data.index.quarter == target_quarter].copy()
         
-        # Assign Trading Day Rank within the quarter for each year
-        # We rank absolute dates within each (year, quarter) group
-        q_data['trading_day'] = q_data.groupby(['year'])['close'].cumcount() + 1
+        # Trading Day Rank within the quarter (precomputed calendar)
+        q_data['trading_day'] = q_data['tdoq'].astype(int)
         
         # Calculate mean daily return
         pivoted = q_data.pivot(index='trading_day', columns='year', values='pct_change')
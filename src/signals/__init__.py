@@ -0,0 +1,20 @@
+"""
+Signals Module
+Vectorized event tables for the fractal and sigma signals.
+"""
+
+from .monthly_w2 import build_w2_events, build_w2_events_multi, summarize_w2
+from .weekly_fractal import (
+    build_weekly_events,
+    build_weekly_events_multi,
+    weekly_seasonal_table,
+    build_weekly_seasonal,
+)
+from .sigma_breach import build_breach_index, get_breach_index, breach_events, weekly_breaches
+
+__all__ = [
+    'build_w2_events', 'build_w2_events_multi', 'summarize_w2',
+    'build_weekly_events', 'build_weekly_events_multi',
+    'weekly_seasonal_table', 'build_weekly_seasonal',
+    'build_breach_index', 'get_breach_index', 'breach_events', 'weekly_breaches',
+]
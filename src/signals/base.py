@@ -0,0 +1,90 @@
+"""
+Signal Engine Helpers
+Array utilities shared by the vectorized event-table engines.
+
+All engines work on contiguous segments of a sorted daily index (months,
+ISO weeks) and reduce them with np.ufunc.reduceat instead of Python loops.
+"""
+
+import hashlib
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def ohlc_arrays(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Extract open/high/low/close as float64 arrays.
+
+    Accepts the lowercase columns of DataLoader and the capitalized columns
+    of raw yfinance frames. An all-numeric frame is converted with a single
+    to_numpy() (one contiguous row per column) instead of four column lookups.
+    """
+    cols = {c.lower(): c for c in data.columns}
+    missing = [c for c in ('open', 'high', 'low', 'close') if c not in cols]
+    if missing:
+        raise ValueError(f"Data is missing OHLC columns: {missing}")
+    try:
+        block = np.ascontiguousarray(data.to_numpy(dtype=np.float64).T)
+    except (TypeError, ValueError):
+        return {c: data[cols[c]].to_numpy(dtype=np.float64) for c in ('open', 'high', 'low', 'close')}
+    return {c: block[data.columns.get_loc(cols[c])] for c in ('open', 'high', 'low', 'close')}
+
+
+def ohlc_fingerprint(data: pd.DataFrame) -> str:
+    """
+    Stable fingerprint of the OHLC values (cache key next to data_version).
+
+    data_version only covers the index; this changes whenever a bar is
+    revised or a different frame shares the same dates. Price columns that
+    are absent (e.g. a close-only frame) are skipped.
+    """
+    cols = {c.lower(): c for c in data.columns}
+    h = hashlib.blake2b(digest_size=12)
+    for c in ('open', 'high', 'low', 'close'):
+        if c in cols:
+            h.update(c.encode())
+            h.update(np.ascontiguousarray(data[cols[c]].to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+def segment_bounds(is_start: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Segment layout from a boolean "first row of segment" flag.
+
+    Returns:
+        (starts, ends, segment_id): start positions, exclusive end positions
+        and, for every row, the number of the segment it belongs to
+    """
+    starts = np.flatnonzero(is_start)
+    ends = np.r_[starts[1:], len(is_start)]
+    segment_id = np.cumsum(is_start) - 1
+    return starts, ends, segment_id
+
+
+def masked_max(values: np.ndarray, mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-segment max over the rows where mask is True (-inf if none)."""
+    return np.maximum.reduceat(np.where(mask, values, -np.inf), starts)
+
+
+def masked_min(values: np.ndarray, mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-segment min over the rows where mask is True (+inf if none)."""
+    return np.minimum.reduceat(np.where(mask, values, np.inf), starts)
+
+
+def masked_last(mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-segment position of the last row where mask is True (-1 if none)."""
+    return np.maximum.reduceat(np.where(mask, np.arange(len(mask)), -1), starts)
+
+
+def position_tier(pos: np.ndarray) -> np.ndarray:
+    """
+    Close-position tiers used across the fractal signals:
+    bull_75 (> 75%), bull_50 (> 50%), bear_25 (< 25%), bear_50 (otherwise).
+    """
+    return np.select(
+        [pos > 0.75, pos > 0.50, pos < 0.25],
+        ['bull_75', 'bull_50', 'bear_25'],
+        default='bear_50'
+    )
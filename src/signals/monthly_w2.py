@@ -0,0 +1,198 @@
+"""
+Monthly W2 Signal Engine
+Vectorized per-month event table of the W2 fractal signal.
+
+For every calendar month the W1-W2 range (high/low of all bars up to the
+close of the second ISO week) is compared with the W2 close:
+
+- BULL: W2 close above the range midpoint
+- BEAR: W2 close at or below the midpoint
+
+and the rest of the month is scored (new high / new low beyond the range,
+green month, O2C, MFE/MAE). All months of an asset are computed in one
+grouped pass over contiguous month segments, reproducing the loop used in
+research_scripts/audit_master_fractal*.py.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.calendar_index import get_calendar
+from .base import ohlc_arrays, segment_bounds, masked_max, masked_min, masked_last, position_tier
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = [
+    'asset', 'year', 'month', 'w2_end', 'month_end', 'range_high', 'range_low', 'w2_close',
+    'w2_pos', 'signal', 'tier', 'new_high', 'new_low', 'green_month',
+    'month_o2c', 'rest_ret', 'mfe', 'mae', 'n_days',
+]
+
+
+def _dense_week_rank(week_key: np.ndarray, segment_id: np.ndarray) -> np.ndarray:
+    """1-based rank of each row's ISO week among the sorted week numbers of its month."""
+    order = np.lexsort((week_key, segment_id))
+    seg_sorted, week_sorted = segment_id[order], week_key[order]
+    new_seg = np.r_[True, seg_sorted[1:] != seg_sorted[:-1]]
+    new_week = new_seg | np.r_[True, week_sorted[1:] != week_sorted[:-1]]
+    seen = np.cumsum(new_week)
+    rank_sorted = seen - np.maximum.accumulate(np.where(new_seg, seen, 0)) + 1
+    rank = np.empty_like(rank_sorted)
+    rank[order] = rank_sorted
+    return rank
+
+
+def build_w2_events(
+    data: pd.DataFrame,
+    asset_key: Optional[str] = None,
+    week_order: str = 'appearance'
+) -> pd.DataFrame:
+    """
+    Build the monthly W2 event table of one asset.
+
+    Args:
+        data: Daily OHLC DataFrame (lowercase or capitalized columns)
+        asset_key: Asset identifier (default: data.attrs['asset_key'])
+        week_order: How W1/W2 are picked inside a month:
+            'appearance' - first two ISO weeks in index order; the range is
+                           every bar up to the W2 close (audit_master_fractal)
+            'sorted'     - two lowest ISO week numbers; the range is the bars
+                           of those two weeks only (stress_test_w2,
+                           analyze_w2_by_month)
+
+    Returns:
+        DataFrame with EVENT_COLUMNS, one row per month with a W2 and a
+        non-empty range. mfe/mae are measured after W2 in the signal
+        direction and are NaN when the month ends with W2.
+    """
+    if week_order not in ('appearance', 'sorted'):
+        raise ValueError(f"Unknown week_order: {week_order}. Available: ['appearance', 'sorted']")
+
+    asset_key = asset_key or data.attrs.get('asset_key', '')
+    if data.empty:
+        return pd.DataFrame(columns=EVENT_COLUMNS)
+
+    cal = get_calendar(data, asset_key)
+    px = ohlc_arrays(data)
+    o, h, l, c = px['open'], px['high'], px['low'], px['close']
+
+    starts, ends, seg = segment_bounds(cal['is_month_start'].to_numpy())
+
+    if week_order == 'appearance':
+        week_rank = cal['month_week'].to_numpy()
+    else:
+        # Plain week numbers, as the scripts sort them: a trailing ISO week 1
+        # in late December ranks before the December weeks
+        week_rank = _dense_week_rank(cal['iso_week'].to_numpy().astype(np.int32), seg)
+
+    w2_end = masked_last(week_rank == 2, starts)
+    has_w2 = w2_end >= 0
+    pos = np.arange(len(c))
+    row_w2_end = w2_end[seg]
+
+    if week_order == 'appearance':
+        in_range = pos <= row_w2_end
+    else:
+        in_range = week_rank <= 2
+    post = pos > np.where(row_w2_end >= 0, row_w2_end, len(c))
+
+    range_high = masked_max(h, in_range, starts)
+    range_low = masked_min(l, in_range, starts)
+    rest_high = masked_max(h, post, starts)
+    rest_low = masked_min(l, post, starts)
+    has_post = np.logical_or.reduceat(post, starts)
+
+    rng = range_high - range_low
+    keep = has_w2 & (rng != 0)
+
+    w2_idx = np.where(has_w2, w2_end, 0)
+    w2_close = c[w2_idx]
+    m_open = o[starts]
+    m_close = c[ends - 1]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        w2_pos = (w2_close - range_low) / rng
+        bull = w2_close > range_low + rng * 0.5
+        up = rest_high / w2_close - 1
+        down = rest_low / w2_close - 1
+
+    mfe = np.where(has_post, np.where(bull, up, -down), np.nan)
+    mae = np.where(has_post, np.where(bull, down, -up), np.nan)
+
+    events = pd.DataFrame({
+        'asset': asset_key,
+        'year': cal['year'].to_numpy()[starts].astype(int),
+        'month': cal['month'].to_numpy()[starts].astype(int),
+        'w2_end': data.index[w2_idx],
+        'month_end': data.index[ends - 1],
+        'range_high': range_high,
+        'range_low': range_low,
+        'w2_close': w2_close,
+        'w2_pos': w2_pos,
+        'signal': np.where(bull, 'BULL', 'BEAR'),
+        'tier': position_tier(w2_pos),
+        'new_high': has_post & (rest_high > range_high),
+        'new_low': has_post & (rest_low < range_low),
+        'green_month': m_close > m_open,
+        'month_o2c': m_close / m_open - 1,
+        'rest_ret': m_close / w2_close - 1,
+        'mfe': mfe,
+        'mae': mae,
+        'n_days': ends - starts,
+    })
+    return events[keep].reset_index(drop=True)
+
+
+def build_w2_events_multi(
+    datasets: Dict[str, pd.DataFrame],
+    week_order: str = 'appearance'
+) -> pd.DataFrame:
+    """
+    Build the W2 event table for several assets at once.
+
+    Args:
+        datasets: Dictionary of asset_key to daily OHLC DataFrame
+            (e.g. the result of DataLoader.download_many)
+        week_order: See build_w2_events
+
+    Returns:
+        Concatenated event table; assets that fail are logged and skipped
+    """
+    tables = []
+    for asset_key, data in datasets.items():
+        try:
+            tables.append(build_w2_events(data, asset_key, week_order=week_order))
+        except Exception as e:
+            logger.warning(f"W2 events failed for {asset_key}: {e}")
+    if not tables:
+        return pd.DataFrame(columns=EVENT_COLUMNS)
+    return pd.concat(tables, ignore_index=True)
+
+
+def summarize_w2(events: pd.DataFrame, by_asset: bool = False) -> pd.DataFrame:
+    """
+    Per (month, signal) outcome probabilities of a W2 event table.
+
+    Args:
+        events: Output of build_w2_events / build_w2_events_multi
+        by_asset: Also group by asset
+
+    Returns:
+        DataFrame with n and prob_green/prob_red/prob_high/prob_low in percent
+    """
+    keys = (['asset'] if by_asset else []) + ['month', 'signal']
+    grouped = events.groupby(keys, sort=True)
+    summary = grouped.agg(
+        n=('green_month', 'size'),
+        green=('green_month', 'sum'),
+        high=('new_high', 'sum'),
+        low=('new_low', 'sum'),
+    )
+    summary['prob_green'] = summary['green'] / summary['n'] * 100
+    summary['prob_red'] = (summary['n'] - summary['green']) / summary['n'] * 100
+    summary['prob_high'] = summary['high'] / summary['n'] * 100
+    summary['prob_low'] = summary['low'] / summary['n'] * 100
+    return summary[['n', 'prob_green', 'prob_red', 'prob_high', 'prob_low']].reset_index()
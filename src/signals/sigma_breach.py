@@ -0,0 +1,184 @@
+"""
+Sigma Breach Index
+Per-bar daily O2C z-scores, breach levels and forward returns, computed
+once per (asset, data version) and shared by the sigma studies.
+
+Sigma is the full-sample standard deviation of the daily O2C return
+(pandas ddof=1) and thresholds are mean +/- k*sigma, as in the research
+scripts (analyze_daily_sigma_persistence, analyze_2sigma_by_weekday,
+analyze_daily_2s_to_weekly_close, audit_daily_alpha_tstats, ...). A study is
+then a filter on the index (breach_events) or on its weekly roll-up
+(weekly_breaches) instead of a fresh pass over the raw bars.
+"""
+
+from typing import Dict, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.calendar_index import get_calendar, data_version
+from .base import ohlc_arrays, ohlc_fingerprint, segment_bounds
+
+_CACHE: Dict[Tuple[str, str, str, int], pd.DataFrame] = {}
+# Oldest entries are evicted beyond this many cached indexes
+_CACHE_SIZE = 32
+
+# Signed breach levels, checked from the most extreme inwards
+BREACH_LEVELS = (2.0, 1.5, 1.0)
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def build_breach_index(data: pd.DataFrame, horizons: int = 5) -> pd.DataFrame:
+    """
+    Build the sigma breach index of one asset.
+
+    Args:
+        data: Daily OHLC DataFrame (lowercase or capitalized columns)
+        horizons: Number of forward days (D+1..D+N) to attach
+
+    Returns:
+        DataFrame aligned with data.index with columns:
+        o2c, z, level (signed: -2, -1.5, -1, 0, 1, 1.5, 2), weekday,
+        weekday_name, week_id, tdow, is_week_end, o2c_d1..o2c_dN (O2C of the
+        following bars), c2c_d1..c2c_dN (close-to-close from this close),
+        rest_of_week (week close / this close - 1), week_o2c, week_days.
+        attrs carry 'mean' and 'std' of the O2C sample.
+    """
+    cal = get_calendar(data)
+    px = ohlc_arrays(data)
+    o, c = px['open'], px['close']
+    n = len(c)
+
+    o2c = (c - o) / o
+    o2c_series = pd.Series(o2c)
+    mean, std = o2c_series.mean(), o2c_series.std()
+    z = (o2c - mean) / std
+
+    level = np.zeros(n)
+    for k in BREACH_LEVELS[::-1]:
+        level = np.where(o2c > mean + k * std, k, level)
+        level = np.where(o2c < mean - k * std, -k, level)
+
+    starts, ends, week_id = segment_bounds(cal['is_week_start'].to_numpy())
+    week_open = o[starts][week_id]
+    week_close = c[ends - 1][week_id]
+    weekday = cal['weekday'].to_numpy()
+
+    index = pd.DataFrame({
+        'o2c': o2c,
+        'z': z,
+        'level': level,
+        'weekday': weekday,
+        'weekday_name': np.array(WEEKDAY_NAMES)[weekday],
+        'week_id': week_id,
+        'tdow': cal['tdow'].to_numpy(),
+        'is_week_end': cal['is_week_end'].to_numpy(),
+    }, index=data.index)
+
+    for k in range(1, horizons + 1):
+        fwd_o2c = np.full(n, np.nan)
+        fwd_c2c = np.full(n, np.nan)
+        if k < n:
+            fwd_o2c[:-k] = o2c[k:]
+            fwd_c2c[:-k] = c[k:] / c[:-k] - 1
+        index[f'o2c_d{k}'] = fwd_o2c
+        index[f'c2c_d{k}'] = fwd_c2c
+
+    index['rest_of_week'] = week_close / c - 1
+    index['week_o2c'] = (week_close - week_open) / week_open
+    index['week_days'] = (ends - starts)[week_id]
+    index.attrs = {'mean': mean, 'std': std}
+    return index
+
+
+def get_breach_index(data: pd.DataFrame, asset_key: Optional[str] = None, horizons: int = 5) -> pd.DataFrame:
+    """
+    Cached breach index, keyed by (asset, index and OHLC fingerprints, horizons).
+
+    Args:
+        data: Daily OHLC DataFrame
+        asset_key: Asset identifier (default: data.attrs['asset_key'])
+        horizons: Number of forward days
+
+    Returns:
+        Breach index DataFrame (see build_breach_index); treat as read-only
+    """
+    asset_key = asset_key or data.attrs.get('asset_key', '')
+    key = (asset_key, data_version(data.index), ohlc_fingerprint(data), horizons)
+    index = _CACHE.get(key)
+    if index is None:
+        index = build_breach_index(data, horizons)
+        while len(_CACHE) >= _CACHE_SIZE:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = index
+    return index
+
+
+def breach_events(
+    index: pd.DataFrame,
+    k: float = 1.0,
+    side: str = 'lower',
+    weekday: Optional[str] = None,
+    center: bool = True
+) -> pd.DataFrame:
+    """
+    Bars whose O2C breaches mean +/- k*sigma.
+
+    Args:
+        index: Breach index
+        k: Sigma multiple (any value, not only the stored levels)
+        side: 'upper', 'lower' or 'both'
+        weekday: Restrict to a weekday name (e.g. 'Tuesday')
+        center: Use mean +/- k*sigma (True) or +/- k*sigma around zero (False)
+
+    Returns:
+        Filtered rows of the index
+    """
+    mean = index.attrs['mean'] if center else 0.0
+    std = index.attrs['std']
+    o2c = index['o2c']
+    if side == 'upper':
+        mask = o2c > mean + k * std
+    elif side == 'lower':
+        mask = o2c < mean - k * std
+    elif side == 'both':
+        mask = (o2c > mean + k * std) | (o2c < mean - k * std)
+    else:
+        raise ValueError(f"Unknown side: {side}. Available: ['upper', 'lower', 'both']")
+    if weekday is not None:
+        mask &= index['weekday_name'] == weekday
+    return index[mask]
+
+
+def weekly_breaches(index: pd.DataFrame, k: float = 1.0, center: bool = True, min_days: int = 2) -> pd.DataFrame:
+    """
+    Weekly roll-up of the breach index.
+
+    Args:
+        index: Breach index
+        k: Sigma multiple of the daily threshold
+        center: Thresholds around the mean (True) or around zero (False)
+        min_days: Minimum trading days per week
+
+    Returns:
+        DataFrame per week with week_o2c, week_days, upper_breach and
+        lower_breach (any day in the week beyond the threshold)
+    """
+    mean = index.attrs['mean'] if center else 0.0
+    std = index.attrs['std']
+    o2c = index['o2c'].to_numpy()
+    starts = np.flatnonzero(index['tdow'].to_numpy() == 1)
+    weeks = pd.DataFrame({
+        'week_start': index.index[starts],
+        'week_o2c': index['week_o2c'].to_numpy()[starts],
+        'week_days': index['week_days'].to_numpy()[starts],
+        'upper_breach': np.logical_or.reduceat(o2c > mean + k * std, starts),
+        'lower_breach': np.logical_or.reduceat(o2c < mean - k * std, starts),
+    })
+    return weeks[weeks['week_days'] >= min_days].reset_index(drop=True)
+
+
+def clear_breach_cache() -> None:
+    """Drop every cached breach index."""
+    _CACHE.clear()
@@ -0,0 +1,228 @@
+"""
+Weekly Fractal Signal Engine
+Vectorized per-week event table of the D2 / D3 fractal signals.
+
+For every ISO week:
+
+- D2 signal: position of the D2 close inside the D1-D2 range, BULL above the
+  midpoint, tiers bull_75 / bull_50 / bear_50 / bear_25; outcome is a new
+  high / new low beyond the range from D3 onwards
+- D3 signal: the same on the D1-D3 range, D3 close and D4 onwards
+- D3 breakout: D3 trading above the D1-D2 high / below the D1-D2 low, and the
+  D4/D5 extension beyond the D3 extreme
+- Week outcome: green week (last close > first open) and weekly return
+
+All weeks of an asset are computed in one pass over contiguous week
+segments, reproducing the per-week loops of analyze_weekly_fractal.py,
+analyze_weekly_continuation.py and the analyze_d3_* scripts.
+WEEKLY_SEASONAL / WEEKLY_SEASONAL_D3 are regenerated with build_weekly_seasonal.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.calendar_index import get_calendar
+from .base import ohlc_arrays, segment_bounds, masked_max, masked_min, position_tier
+
+logger = logging.getLogger(__name__)
+
+WEEKLY_EVENT_COLUMNS = [
+    'asset', 'iso_year', 'iso_week', 'week_start', 'week_end', 'n_days',
+    'd2_month', 'd12_high', 'd12_low', 'd2_close', 'd2_pos', 'd2_signal', 'd2_tier',
+    'd2_new_high', 'd2_new_low',
+    'd3_month', 'd13_high', 'd13_low', 'd3_high', 'd3_low', 'd3_close', 'd3_pos',
+    'd3_signal', 'd3_tier', 'd3_new_high', 'd3_new_low',
+    'd3_broke_high', 'd3_broke_low', 'd45_above_d3', 'd45_below_d3',
+    'week_open', 'week_close', 'green_week', 'week_ret',
+]
+
+# Cumulative WEEKLY_SEASONAL tiers (bull_50 includes bull_75), as (pos, bull) rules
+SEASONAL_TIERS = {
+    'bull_50': lambda pos, bull: bull,
+    'bear_50': lambda pos, bull: ~bull,
+    'bull_75': lambda pos, bull: pos > 0.75,
+    'bear_25': lambda pos, bull: pos < 0.25,
+}
+
+
+def build_weekly_events(data: pd.DataFrame, asset_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    Build the weekly fractal event table of one asset.
+
+    Args:
+        data: Daily OHLC DataFrame (lowercase or capitalized columns)
+        asset_key: Asset identifier (default: data.attrs['asset_key'])
+
+    Returns:
+        DataFrame with WEEKLY_EVENT_COLUMNS, one row per ISO week with at
+        least two trading days. D2 / D3 columns are NaN (signals None, flags
+        False) when the week is too short for them; weeks with a zero D1-D2
+        range are dropped, as in the scripts.
+    """
+    asset_key = asset_key or data.attrs.get('asset_key', '')
+    if data.empty:
+        return pd.DataFrame(columns=WEEKLY_EVENT_COLUMNS)
+
+    cal = get_calendar(data, asset_key)
+    px = ohlc_arrays(data)
+    o, h, l, c = px['open'], px['high'], px['low'], px['close']
+    n_rows = len(c)
+
+    starts, ends, _ = segment_bounds(cal['is_week_start'].to_numpy())
+    n_days = ends - starts
+    tdow = cal['tdow'].to_numpy()
+    month = cal['month'].to_numpy().astype(int)
+
+    # Day k of each week (clipped to a valid row; masked by n_days below)
+    d1 = starts
+    d2 = np.minimum(starts + 1, n_rows - 1)
+    d3 = np.minimum(starts + 2, n_rows - 1)
+    has_d2 = n_days >= 2
+    has_d3 = n_days >= 3
+    has_d4 = n_days >= 4
+
+    # --- D2 signal ---
+    d12_high = np.maximum(h[d1], h[d2])
+    d12_low = np.minimum(l[d1], l[d2])
+    rng2 = d12_high - d12_low
+    after_d2 = tdow > 2
+    rest2_high = masked_max(h, after_d2, starts)
+    rest2_low = masked_min(l, after_d2, starts)
+
+    # --- D3 signal ---
+    d13_high = np.maximum(d12_high, h[d3])
+    d13_low = np.minimum(d12_low, l[d3])
+    rng3 = d13_high - d13_low
+    after_d3 = tdow > 3
+    rest3_high = masked_max(h, after_d3, starts)
+    rest3_low = masked_min(l, after_d3, starts)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        d2_pos = (c[d2] - d12_low) / rng2
+        d3_pos = np.where(has_d3 & (rng3 != 0), (c[d3] - d13_low) / rng3, np.nan)
+    d2_bull = c[d2] > d12_low + rng2 * 0.5
+    d3_bull = c[d3] > d13_low + rng3 * 0.5
+
+    week_open = o[starts]
+    week_close = c[ends - 1]
+
+    events = pd.DataFrame({
+        'asset': asset_key,
+        'iso_year': cal['iso_year'].to_numpy()[starts].astype(int),
+        'iso_week': cal['iso_week'].to_numpy()[starts].astype(int),
+        'week_start': data.index[starts],
+        'week_end': data.index[ends - 1],
+        'n_days': n_days,
+        'd2_month': month[d2],
+        'd12_high': d12_high,
+        'd12_low': d12_low,
+        'd2_close': c[d2],
+        'd2_pos': d2_pos,
+        'd2_signal': np.where(d2_bull, 'BULL', 'BEAR'),
+        'd2_tier': position_tier(d2_pos),
+        'd2_new_high': has_d3 & (rest2_high > d12_high),
+        'd2_new_low': has_d3 & (rest2_low < d12_low),
+        'd3_month': np.where(has_d3, month[d3], 0),
+        'd13_high': np.where(has_d3, d13_high, np.nan),
+        'd13_low': np.where(has_d3, d13_low, np.nan),
+        'd3_high': np.where(has_d3, h[d3], np.nan),
+        'd3_low': np.where(has_d3, l[d3], np.nan),
+        'd3_close': np.where(has_d3, c[d3], np.nan),
+        'd3_pos': d3_pos,
+        'd3_signal': np.where(has_d3, np.where(d3_bull, 'BULL', 'BEAR'), None),
+        'd3_tier': np.where(has_d3, position_tier(d3_pos), None),
+        'd3_new_high': has_d4 & (rest3_high > d13_high),
+        'd3_new_low': has_d4 & (rest3_low < d13_low),
+        'd3_broke_high': has_d3 & (h[d3] > d12_high),
+        'd3_broke_low': has_d3 & (l[d3] < d12_low),
+        'd45_above_d3': has_d4 & (rest3_high > h[d3]),
+        'd45_below_d3': has_d4 & (rest3_low < l[d3]),
+        'week_open': week_open,
+        'week_close': week_close,
+        'green_week': week_close > week_open,
+        'week_ret': week_close / week_open - 1,
+    })
+    return events[has_d2 & (rng2 != 0)].reset_index(drop=True)
+
+
+def build_weekly_events_multi(datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Build the weekly fractal event table for several assets at once.
+
+    Args:
+        datasets: Dictionary of asset_key to daily OHLC DataFrame
+
+    Returns:
+        Concatenated event table; assets that fail are logged and skipped
+    """
+    tables = []
+    for asset_key, data in datasets.items():
+        try:
+            tables.append(build_weekly_events(data, asset_key))
+        except Exception as e:
+            logger.warning(f"Weekly events failed for {asset_key}: {e}")
+    if not tables:
+        return pd.DataFrame(columns=WEEKLY_EVENT_COLUMNS)
+    return pd.concat(tables, ignore_index=True)
+
+
+def weekly_seasonal_table(events: pd.DataFrame, stage: str = 'd2') -> Dict[int, Dict[str, Dict[str, float]]]:
+    """
+    Per-month tier probabilities in the WEEKLY_SEASONAL layout.
+
+    Args:
+        events: Weekly event table of ONE asset
+        stage: 'd2' (WEEKLY_SEASONAL) or 'd3' (WEEKLY_SEASONAL_D3)
+
+    Returns:
+        {month: {tier: {'prob_high', 'prob_green'} or {'prob_low', 'prob_red'}}}
+        in percent, rounded to one decimal. Only weeks with at least one day
+        after the signal day are counted; the month is the signal day's month.
+    """
+    if stage not in ('d2', 'd3'):
+        raise ValueError(f"Unknown stage: {stage}. Available: ['d2', 'd3']")
+
+    min_days = 3 if stage == 'd2' else 4
+    ev = events[events['n_days'] >= min_days]
+    pos = ev[f'{stage}_pos'].to_numpy()
+    bull = (ev[f'{stage}_signal'] == 'BULL').to_numpy()
+    month = ev[f'{stage}_month'].to_numpy()
+    new_high = ev[f'{stage}_new_high'].to_numpy()
+    new_low = ev[f'{stage}_new_low'].to_numpy()
+    green = ev['green_week'].to_numpy()
+
+    table = {}
+    for m in range(1, 13):
+        in_month = month == m
+        row = {}
+        for tier, rule in SEASONAL_TIERS.items():
+            sel = in_month & rule(pos, bull)
+            if not sel.any():
+                continue
+            if tier.startswith('bull'):
+                row[tier] = {'prob_high': round(float(new_high[sel].mean()) * 100, 1),
+                             'prob_green': round(float(green[sel].mean()) * 100, 1)}
+            else:
+                row[tier] = {'prob_low': round(float(new_low[sel].mean()) * 100, 1),
+                             'prob_red': round(float((~green[sel]).mean()) * 100, 1)}
+        if row:
+            table[m] = row
+    return table
+
+
+def build_weekly_seasonal(datasets: Dict[str, pd.DataFrame], stage: str = 'd2') -> Dict[str, Dict]:
+    """
+    Regenerate WEEKLY_SEASONAL (stage='d2') or WEEKLY_SEASONAL_D3 (stage='d3').
+
+    Args:
+        datasets: Dictionary of asset_key to daily OHLC DataFrame
+        stage: 'd2' or 'd3'
+
+    Returns:
+        {asset_key: {month: {tier: {...}}}}
+    """
+    events = build_weekly_events_multi(datasets)
+    return {asset: weekly_seasonal_table(ev, stage) for asset, ev in events.groupby('asset', sort=False)}
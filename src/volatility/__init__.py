@@ -3,5 +3,8 @@ Volatility Module
 """
 
 from .volatility_calculator import VolatilityCalculator, calculate_volatility
+from .streaming import StreamingVolatility, RollingMoments
+from .surface import VolatilitySurface, volatility_surfaces
 
-__all__ = ['VolatilityCalculator', 'calculate_volatility']
+__all__ = ['VolatilityCalculator', 'calculate_volatility', 'StreamingVolatility', 'RollingMoments',
+           'VolatilitySurface', 'volatility_surfaces']
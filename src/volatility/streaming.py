@@ -0,0 +1,325 @@
+"""
+Streaming Volatility Module
+Constant-time bar-by-bar updates of the VolatilityCalculator estimators.
+
+Every estimator of VolatilityCalculator is a rolling mean or variance of a
+per-bar term (log return, Parkinson and Garman-Klass terms, overnight and
+open-close log returns, Rogers-Satchell term) or an EWMA of the squared log
+return. StreamingVolatility keeps the last `window` terms in ring buffers
+with their running sums and the EWMA variance, so a new bar updates every
+estimator in O(1) instead of re-running rolling() over the whole history.
+
+The state is a small JSON-serializable dict (to_dict / from_dict), so a live
+monitor can persist it and resume without replaying history. Results match
+VolatilityCalculator (rolling windows with min_periods=window, sample
+variance, EWMA with adjust=False) to floating-point rounding.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional, Iterable
+
+import numpy as np
+import pandas as pd
+
+TERMS = ['log_ret', 'parkinson', 'garman_klass', 'overnight', 'open_close', 'rogers_satchell']
+
+PARKINSON_FACTOR = 1 / (4 * np.log(2))
+GARMAN_KLASS_FACTOR = 2 * np.log(2) - 1
+
+
+def bar_terms(open_, high, low, close, prev_close):
+    """
+    Per-bar estimator terms (scalars or aligned arrays).
+
+    Args:
+        open_, high, low, close: Bar prices (NaN when unavailable)
+        prev_close: Close of the previous bar (NaN for the first bar)
+
+    Returns:
+        Dictionary of term name (see TERMS) to value
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        log_hl = np.log(high / low)
+        log_co = np.log(close / open_)
+        return {
+            'log_ret': np.log(close / prev_close),
+            'parkinson': PARKINSON_FACTOR * log_hl ** 2,
+            'garman_klass': 0.5 * log_hl ** 2 - GARMAN_KLASS_FACTOR * log_co ** 2,
+            'overnight': np.log(open_ / prev_close),
+            'open_close': log_co,
+            'rogers_satchell': (np.log(high / open_) * np.log(high / close)
+                                + np.log(low / open_) * np.log(low / close)),
+        }
+
+
+class RollingMoments:
+    """
+    Sum, sum of squares and NaN count of the last `window` values.
+
+    Matches pandas rolling(window) with the default min_periods=window: the
+    mean / variance is NaN until the window is full and while it holds a NaN.
+    The sums are recomputed from the buffer every `window` pushes (amortized
+    O(1)) so add/subtract rounding errors cannot accumulate.
+    """
+
+    def __init__(self, window: int, values: Iterable[float] = ()):
+        """
+        Initialize RollingMoments.
+
+        Args:
+            window: Window length
+            values: Initial values (oldest first; only the last `window` are kept)
+        """
+        self.window = window
+        self.buffer = deque(maxlen=window)
+        for x in values:
+            self.buffer.append(float(x))
+        self._refresh()
+
+    def _refresh(self):
+        """Recompute the running sums from the buffer."""
+        clean = [x for x in self.buffer if not math.isnan(x)]
+        self.s1 = math.fsum(clean)
+        self.s2 = math.fsum(x * x for x in clean)
+        self.n_nan = len(self.buffer) - len(clean)
+        self._pushes = 0
+
+    def push(self, x: float):
+        """Append a value, evicting the oldest one when the window is full."""
+        x = float(x)
+        if len(self.buffer) == self.window:
+            self._remove(self.buffer[0])
+        self.buffer.append(x)
+        self._add(x)
+        self._pushes += 1
+        if self._pushes >= self.window:
+            self._refresh()
+
+    def _add(self, x: float):
+        if math.isnan(x):
+            self.n_nan += 1
+        else:
+            self.s1 += x
+            self.s2 += x * x
+
+    def _remove(self, x: float):
+        if math.isnan(x):
+            self.n_nan -= 1
+        else:
+            self.s1 -= x
+            self.s2 -= x * x
+
+    def _sums(self, extra: Optional[float]):
+        """(count, s1, s2, n_nan), optionally with one more value appended."""
+        count, s1, s2, n_nan = len(self.buffer), self.s1, self.s2, self.n_nan
+        if extra is None:
+            return count, s1, s2, n_nan
+        for x, sign in ((extra, 1), (self.buffer[0] if count == self.window else None, -1)):
+            if x is None:
+                continue
+            if math.isnan(x):
+                n_nan += sign
+            else:
+                s1 += sign * x
+                s2 += sign * x * x
+        return min(count + 1, self.window), s1, s2, n_nan
+
+    def mean(self, extra: Optional[float] = None) -> float:
+        """Window mean (NaN until the window is full and NaN-free)."""
+        count, s1, _, n_nan = self._sums(extra)
+        if count < self.window or n_nan:
+            return np.nan
+        return s1 / count
+
+    def var(self, extra: Optional[float] = None) -> float:
+        """Window sample variance (ddof=1)."""
+        count, s1, s2, n_nan = self._sums(extra)
+        if count < self.window or n_nan or count < 2:
+            return np.nan
+        return max(s2 - s1 * s1 / count, 0.0) / (count - 1)
+
+
+class StreamingVolatility:
+    """
+    Stateful, O(1)-per-bar version of the VolatilityCalculator estimators.
+
+    Feed closed bars with update(); use preview() for the still-forming bar
+    (e.g. on every intraday tick) without changing the state.
+    """
+
+    def __init__(
+        self,
+        window: int = 21,
+        lambda_: float = 0.94,
+        annualize: bool = True,
+        periods_per_year: float = 252
+    ):
+        """
+        Initialize StreamingVolatility.
+
+        Args:
+            window: Rolling window of the historical and range-based estimators
+            lambda_: EWMA decay factor (RiskMetrics 0.94)
+            annualize: Whether to annualize
+            periods_per_year: Bars per year (252 daily; adjust for intraday bars)
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.lambda_ = lambda_
+        self.annualize = annualize
+        self.periods_per_year = periods_per_year
+        self.prev_close = np.nan
+        self.ewma_var = np.nan
+        self.n_bars = 0
+        self.moments: Dict[str, RollingMoments] = {name: RollingMoments(window) for name in TERMS}
+
+    def _ewma_next(self, log_ret: float) -> float:
+        """EWMA variance after one more log return (pandas adjust=False)."""
+        if math.isnan(log_ret):
+            return self.ewma_var
+        if math.isnan(self.ewma_var):
+            return log_ret * log_ret
+        return self.lambda_ * self.ewma_var + (1 - self.lambda_) * log_ret * log_ret
+
+    def _terms(self, close, open_, high, low) -> Dict[str, float]:
+        nan = np.nan
+        terms = bar_terms(
+            nan if open_ is None else float(open_),
+            nan if high is None else float(high),
+            nan if low is None else float(low),
+            float(close),
+            self.prev_close,
+        )
+        return {name: float(value) for name, value in terms.items()}
+
+    def _estimates(self, terms: Optional[Dict[str, float]], ewma_var: float) -> Dict[str, float]:
+        """Current estimates, optionally as if one more bar with `terms` were pushed."""
+        def extra(name):
+            return None if terms is None else terms[name]
+
+        m = self.moments
+        w = self.window
+        k = 0.34 / (1.34 + (w + 1) / (w - 1))
+        yang_zhang_var = (m['overnight'].var(extra('overnight'))
+                          + k * m['open_close'].var(extra('open_close'))
+                          + (1 - k) * m['rogers_satchell'].mean(extra('rogers_satchell')))
+        with np.errstate(invalid='ignore'):
+            result = {
+                'historical': np.sqrt(m['log_ret'].var(extra('log_ret'))),
+                'ewma': np.sqrt(ewma_var),
+                'parkinson': np.sqrt(m['parkinson'].mean(extra('parkinson'))),
+                'garman_klass': np.sqrt(m['garman_klass'].mean(extra('garman_klass'))),
+                'yang_zhang': np.sqrt(yang_zhang_var),
+            }
+        scale = np.sqrt(self.periods_per_year) if self.annualize else 1.0
+        return {name: float(value * scale) for name, value in result.items()}
+
+    def update(self, close: float, open_: float = None, high: float = None, low: float = None) -> Dict[str, float]:
+        """
+        Add one closed bar.
+
+        Args:
+            close: Bar close
+            open_, high, low: Bar open / high / low (range estimators are NaN
+                while the window holds bars without them)
+
+        Returns:
+            Dictionary with historical, ewma, parkinson, garman_klass, yang_zhang
+        """
+        terms = self._terms(close, open_, high, low)
+        for name, value in terms.items():
+            self.moments[name].push(value)
+        self.ewma_var = self._ewma_next(terms['log_ret'])
+        self.prev_close = float(close)
+        self.n_bars += 1
+        return self.current()
+
+    def preview(self, close: float, open_: float = None, high: float = None, low: float = None) -> Dict[str, float]:
+        """
+        Estimates including a provisional (still-forming) bar, without updating the state.
+
+        Args:
+            close, open_, high, low: Prices of the forming bar so far
+
+        Returns:
+            Dictionary with the same keys as update()
+        """
+        terms = self._terms(close, open_, high, low)
+        return self._estimates(terms, self._ewma_next(terms['log_ret']))
+
+    def current(self) -> Dict[str, float]:
+        """Estimates after the last closed bar."""
+        return self._estimates(None, self.ewma_var)
+
+    @classmethod
+    def from_history(
+        cls,
+        data: pd.DataFrame,
+        window: int = 21,
+        lambda_: float = 0.94,
+        annualize: bool = True,
+        periods_per_year: float = 252
+    ) -> 'StreamingVolatility':
+        """
+        Warm up the state from a price history in one vectorized pass.
+
+        Args:
+            data: DataFrame with 'close' and optionally 'open', 'high', 'low'
+            window, lambda_, annualize, periods_per_year: See __init__
+
+        Returns:
+            StreamingVolatility positioned after the last bar of data
+        """
+        stream = cls(window, lambda_, annualize, periods_per_year)
+        if data.empty:
+            return stream
+
+        def column(name):
+            if name in data.columns:
+                return data[name].to_numpy(dtype=np.float64)
+            return np.full(len(data), np.nan)
+
+        close = column('close')
+        prev_close = np.concatenate([[np.nan], close[:-1]])
+        terms = bar_terms(column('open'), column('high'), column('low'), close, prev_close)
+        for name, values in terms.items():
+            stream.moments[name] = RollingMoments(window, values[-window:])
+
+        log_ret = pd.Series(terms['log_ret'])
+        ewma = log_ret.pow(2).ewm(alpha=1 - lambda_, adjust=False).mean()
+        stream.ewma_var = float(ewma.iloc[-1])
+        stream.prev_close = float(close[-1])
+        stream.n_bars = len(data)
+        return stream
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable state (NaN stored as None)."""
+        def clean(x):
+            return None if math.isnan(x) else x
+
+        return {
+            'window': self.window,
+            'lambda_': self.lambda_,
+            'annualize': self.annualize,
+            'periods_per_year': self.periods_per_year,
+            'prev_close': clean(self.prev_close),
+            'ewma_var': clean(self.ewma_var),
+            'n_bars': self.n_bars,
+            'buffers': {name: [clean(x) for x in m.buffer] for name, m in self.moments.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'StreamingVolatility':
+        """Rebuild a StreamingVolatility from to_dict() output."""
+        def restore(x):
+            return np.nan if x is None else float(x)
+
+        stream = cls(state['window'], state['lambda_'], state['annualize'], state['periods_per_year'])
+        stream.prev_close = restore(state['prev_close'])
+        stream.ewma_var = restore(state['ewma_var'])
+        stream.n_bars = state['n_bars']
+        for name, values in state['buffers'].items():
+            stream.moments[name] = RollingMoments(stream.window, [restore(x) for x in values])
+        return stream
@@ -0,0 +1,184 @@
+"""
+Volatility Surface Module
+Windows x estimators x dates volatility in one pass over shared cumulative sums.
+
+Every rolling estimator of VolatilityCalculator is a window mean or sample
+variance of a per-bar term (see streaming.bar_terms). With the cumulative
+sums of each term and its square, the sum over any window ending at t is one
+subtraction, so all windows of all estimators come from the same few
+cumsum arrays instead of one rolling() pass per (estimator, window):
+
+    S_w[t] = C[t + 1] - C[t + 1 - w]        C = [0, cumsum(x)]
+
+Terms are centered on their mean before summing, which keeps the variance
+(sum x^2 - (sum x)^2 / w) free of cancellation. A window is NaN until it is
+full and while it holds a NaN term, as with rolling(window).
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .streaming import bar_terms
+
+DEFAULT_WINDOWS = (5, 10, 21, 42, 63, 126, 252)
+
+# Columns each estimator needs
+ESTIMATOR_COLUMNS = {
+    'historical': ['close'],
+    'parkinson': ['high', 'low'],
+    'garman_klass': ['open', 'high', 'low', 'close'],
+    'yang_zhang': ['open', 'high', 'low', 'close'],
+}
+
+
+def rolling_moments(x: np.ndarray, windows: np.ndarray):
+    """
+    Window mean and sample variance of x for several windows at once.
+
+    Args:
+        x: 1-D array (NaN allowed)
+        windows: 1-D int array of window lengths
+
+    Returns:
+        (mean, var): arrays of shape (len(windows), len(x))
+    """
+    n = len(x)
+    valid = ~np.isnan(x)
+    center = x[valid].mean() if valid.any() else 0.0
+    x0 = np.where(valid, x - center, 0.0)
+
+    c1 = np.concatenate([[0.0], np.cumsum(x0)])
+    c2 = np.concatenate([[0.0], np.cumsum(x0 * x0)])
+    c_nan = np.concatenate([[0], np.cumsum(~valid)])
+
+    ends = np.arange(1, n + 1)
+    starts = ends[None, :] - windows[:, None]
+    full = starts >= 0
+    starts = np.maximum(starts, 0)
+    full &= (c_nan[ends][None, :] - c_nan[starts]) == 0
+
+    w = windows[:, None].astype(np.float64)
+    s1 = c1[ends][None, :] - c1[starts]
+    s2 = c2[ends][None, :] - c2[starts]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(full, s1 / w + center, np.nan)
+        var = np.where(full & (w > 1), np.maximum(s2 - s1 * s1 / w, 0.0) / (w - 1), np.nan)
+    return mean, var
+
+
+class VolatilitySurface:
+    """
+    Rolling volatility of several estimators over several windows.
+
+    values has shape (windows, estimators, dates); estimators whose columns
+    are missing from the data are left out.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        estimators: Optional[List[str]] = None,
+        annualize: bool = True,
+        periods_per_year: float = 252
+    ):
+        """
+        Initialize VolatilitySurface.
+
+        Args:
+            data: DataFrame with 'close' and optionally 'open', 'high', 'low'
+            windows: Rolling window lengths (>= 2)
+            estimators: Subset of ESTIMATOR_COLUMNS (default: all computable)
+            annualize: Whether to annualize
+            periods_per_year: Trading periods per year
+        """
+        if estimators is None:
+            estimators = [e for e, cols in ESTIMATOR_COLUMNS.items()
+                          if all(c in data.columns for c in cols)]
+        for e in estimators:
+            if e not in ESTIMATOR_COLUMNS:
+                raise ValueError(f"Unknown estimator: {e}. Available: {list(ESTIMATOR_COLUMNS)}")
+            missing = [c for c in ESTIMATOR_COLUMNS[e] if c not in data.columns]
+            if missing:
+                raise ValueError(f"{e} requires columns {missing}")
+        if min(windows) < 2:
+            raise ValueError("windows must be at least 2")
+
+        self.index = data.index
+        self.windows = [int(w) for w in windows]
+        self.estimators = list(estimators)
+
+        def column(name):
+            if name in data.columns:
+                return data[name].to_numpy(dtype=np.float64)
+            return np.full(len(data), np.nan)
+
+        close = column('close')
+        prev_close = np.concatenate([[np.nan], close[:-1]])
+        terms = bar_terms(column('open'), column('high'), column('low'), close, prev_close)
+        w = np.asarray(self.windows)
+
+        layers = []
+        with np.errstate(invalid='ignore'):
+            for e in self.estimators:
+                if e == 'historical':
+                    var = rolling_moments(terms['log_ret'], w)[1]
+                elif e == 'parkinson':
+                    var = rolling_moments(terms['parkinson'], w)[0]
+                elif e == 'garman_klass':
+                    var = rolling_moments(terms['garman_klass'], w)[0]
+                else:
+                    k = (0.34 / (1.34 + (w + 1) / (w - 1)))[:, None]
+                    var = (rolling_moments(terms['overnight'], w)[1]
+                           + k * rolling_moments(terms['open_close'], w)[1]
+                           + (1 - k) * rolling_moments(terms['rogers_satchell'], w)[0])
+                layers.append(np.sqrt(var))
+
+        scale = np.sqrt(periods_per_year) if annualize else 1.0
+        self.values = (np.stack(layers, axis=1) * scale if layers
+                       else np.empty((len(self.windows), 0, len(data))))
+
+    def get(self, estimator: str, window: int) -> pd.Series:
+        """Volatility series of one (estimator, window)."""
+        values = self.values[self.windows.index(window), self.estimators.index(estimator)]
+        return pd.Series(values, index=self.index, name=f'{estimator}_vol_{window}d')
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dates x (estimator, window) DataFrame."""
+        columns = pd.MultiIndex.from_product([self.estimators, self.windows], names=['estimator', 'window'])
+        flat = self.values.transpose(2, 1, 0).reshape(len(self.index), -1)
+        return pd.DataFrame(flat, index=self.index, columns=columns)
+
+    def latest(self) -> pd.DataFrame:
+        """Windows x estimators DataFrame of the last date."""
+        return pd.DataFrame(self.values[:, :, -1], index=pd.Index(self.windows, name='window'),
+                            columns=self.estimators)
+
+
+def volatility_surfaces(
+    datasets: Dict[str, pd.DataFrame],
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    estimators: Optional[List[str]] = None,
+    annualize: bool = True,
+    periods_per_year: float = 252
+) -> Dict[str, VolatilitySurface]:
+    """
+    Volatility surfaces of several assets.
+
+    Args:
+        datasets: Dictionary of asset_key to price DataFrame
+        windows: Rolling window lengths
+        estimators: Estimators (default: all computable per asset)
+        annualize: Whether to annualize
+        periods_per_year: Trading periods per year
+
+    Returns:
+        Dictionary of asset_key to VolatilitySurface (empty data skipped)
+    """
+    return {
+        asset: VolatilitySurface(data, windows, estimators, annualize, periods_per_year)
+        for asset, data in datasets.items()
+        if data is not None and not data.empty
+    }
@@ -11,6 +11,8 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.timeframes import get_timeframe
+from .streaming import StreamingVolatility
+from .surface import VolatilitySurface
 
 
 class VolatilityCalculator:
@@ -268,6 +270,10 @@ class VolatilityCalculator:
         """
         Compute all volatility estimators.
         
+        Windows of 2+ bars come from one VolatilitySurface pass. Smaller
+        windows use the per-estimator methods: historical is NaN (no sample
+        std) and Yang-Zhang is NaN (undefined k weight).
+        
         Args:
             window: Rolling window size
             annualize: Whether to annualize
@@ -278,27 +284,33 @@ class VolatilityCalculator:
         """
         result = pd.DataFrame(index=self.data.index)
         
-        # Historical
-        result['historical'] = self.historical_volatility(window, annualize, periods_per_year)
-        
         # EWMA
-        result['ewma'] = self.ewma_volatility(annualize=annualize, periods_per_year=periods_per_year)
+        ewma = self.ewma_volatility(annualize=annualize, periods_per_year=periods_per_year)
+        
+        if window < 2:
+            # Below the surface's minimum window: per-estimator rolling() path
+            result['historical'] = self.historical_volatility(window, annualize, periods_per_year)
+            result['ewma'] = ewma
+            for estimator in ['parkinson', 'garman_klass', 'yang_zhang']:
+                try:
+                    result[estimator] = getattr(self, f'{estimator}_volatility')(window, annualize, periods_per_year)
+                except ValueError:
+                    pass
+                except ZeroDivisionError:
+                    # Yang-Zhang's k weight is undefined for a 1-bar window
+                    result[estimator] = np.nan
+            return result
+        
+        # Rolling estimators (range-based ones only if data available) share one surface pass
+        surface = VolatilitySurface(self.data, [window], annualize=annualize, periods_per_year=periods_per_year)
         
-        # Range-based estimators (if data available)
-        try:
-            result['parkinson'] = self.parkinson_volatility(window, annualize, periods_per_year)
-        except ValueError:
-            pass
-        
-        try:
-            result['garman_klass'] = self.garman_klass_volatility(window, annualize, periods_per_year)
-        except ValueError:
-            pass
+        # Historical
+        result['historical'] = surface.get('historical', window)
+        result['ewma'] = ewma
         
-        try:
-            result['yang_zhang'] = self.yang_zhang_volatility(window, annualize, periods_per_year)
-        except ValueError:
-            pass
+        for estimator in ['parkinson', 'garman_klass', 'yang_zhang']:
+            if estimator in surface.estimators:
+                result[estimator] = surface.get(estimator, window)
         
         return result
     
@@ -324,10 +336,16 @@ class VolatilityCalculator:
         # Full sample
         result['full_sample'] = log_returns.std() * np.sqrt(periods_per_year)
         
-        # Rolling windows
+        # Rolling windows (last value of every window from one surface pass;
+        # a 1-bar window has no sample std)
+        usable = [w for w in windows if 2 <= w <= len(log_returns)]
+        latest = (VolatilitySurface(self.data, usable, ['historical'], periods_per_year=periods_per_year).latest()
+                  if usable else None)
         for w in windows:
-            if len(log_returns) >= w:
-                result[f'{w}d'] = log_returns.tail(w).std() * np.sqrt(periods_per_year)
+            if w in usable:
+                result[f'{w}d'] = latest.loc[w, 'historical']
+            elif len(log_returns) >= w:
+                result[f'{w}d'] = np.nan
         
         # Current EWMA
         ewma = self.ewma_volatility(annualize=True, periods_per_year=periods_per_year)
@@ -335,6 +353,27 @@ class VolatilityCalculator:
         
         return result
 
+    def streaming(
+        self,
+        window: int = 21,
+        lambda_: float = 0.94,
+        annualize: bool = True,
+        periods_per_year: float = 252
+    ) -> StreamingVolatility:
+        """
+        Streaming state positioned after the last bar, for O(1) updates.
+
+        Args:
+            window: Rolling window size
+            lambda_: EWMA decay factor
+            annualize: Whether to annualize
+            periods_per_year: Trading periods per year
+
+        Returns:
+            StreamingVolatility warmed up on this data
+        """
+        return StreamingVolatility.from_history(self.data, window, lambda_, annualize, periods_per_year)
+
 
 def calculate_volatility(
     data: pd.DataFrame,
@@ -0,0 +1,47 @@
+"""
+Grouped Statistics Test
+sufficient_stats / grouped_stats on event tables with missing cell keys.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.providers import FixtureProvider
+from src.inference import grouped_stats, sufficient_stats
+from src.signals import build_weekly_events
+
+
+def test_nan_key_rows_are_dropped():
+    events = pd.DataFrame({
+        'month': [1, 1, 2, 2, 1, 2, 1, 2],
+        'tier': ['bull', None, 'bear', 'bear', 'bull', np.nan, 'bull', 'bear'],
+        'ret': [0.01, 0.50, -0.02, 0.03, 0.02, 0.70, -0.01, 0.01],
+    })
+    suff = sufficient_stats(events, ['month', 'tier'], 'ret')
+
+    reference = events.dropna(subset=['tier']).groupby(['month', 'tier'])['ret']
+    assert list(suff.index.droplevel('metric')) == list(reference.size().index)
+    np.testing.assert_array_equal(suff['n'].to_numpy(), reference.size().to_numpy())
+    np.testing.assert_allclose(suff['sum'].to_numpy(), reference.sum().to_numpy())
+
+    table = grouped_stats(events, ['month', 'tier'], 'ret')
+    bull = events.loc[(events['month'] == 1) & (events['tier'] == 'bull'), 'ret']
+    row = table.loc[(1, 'bull')]
+    np.testing.assert_allclose(row['t_stat'], stats.ttest_1samp(bull, 0.0).statistic)
+
+
+def test_weekly_events_with_holiday_weeks():
+    df = FixtureProvider(as_of='2026-01-05T11:00').history('NQ=F', period='5y')
+    # Two-day weeks (no D3, d3_tier None), as around holidays
+    df = df[~((df.index.dayofweek >= 2) & (df.index.day <= 7))]
+    events = build_weekly_events(df, 'NQ')
+    assert events['d3_tier'].isna().any()
+
+    table = grouped_stats(events, ['d3_month', 'd3_tier'], 'week_ret')
+    assert table['n'].sum() == events['d3_tier'].notna().sum()
@@ -0,0 +1,44 @@
+"""
+Permutation / Bootstrap Test
+permutation_test and grouped_bootstrap on event tables with missing cell keys.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.inference import permutation_test, grouped_bootstrap
+
+
+def _events():
+    return pd.DataFrame({
+        'm': [1, 1, 2, 2, None, 1] * 5,
+        'asset': ['NQ', 'ES', 'NQ', None, 'ES', 'NQ'] * 5,
+        'x': [1, 0, 1, 1, 0, 1] * 5,
+    })
+
+
+def test_permutation_nan_cell_key():
+    events = _events()
+    result = permutation_test(events, ['m'], 'x', strata=None, n_perm=200, seed=7)
+    expected = permutation_test(events.dropna(subset=['m']), ['m'], 'x', strata=None, n_perm=200, seed=7)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result['n'].sum() == events['m'].notna().sum()
+
+
+def test_permutation_nan_stratum_key():
+    events = _events()
+    result = permutation_test(events, ['m'], 'x', strata='asset', n_perm=200, seed=7)
+    expected = permutation_test(events.dropna(subset=['m', 'asset']), ['m'], 'x',
+                                strata='asset', n_perm=200, seed=7)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_bootstrap_nan_cell_key():
+    events = _events()
+    result = grouped_bootstrap(events, ['m'], 'x', n_boot=200, seed=7)
+    expected = grouped_bootstrap(events.dropna(subset=['m']), ['m'], 'x', n_boot=200, seed=7)
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,311 @@
+"""
+Signal Engine Parity Test
+layers_from_arrays (and SignalEngine) against the pre-engine calc_layers.
+
+_baseline_calc_layers is the calc_layers of api/index.py before the
+incremental engine, kept verbatim except that the clock (datetime.utcnow())
+is an argument. Both are run on every trailing 60-bar window of the
+synthetic fixture history (tz-aware America/New_York index, as served to the
+API) at a clock in each fractal mode.
+
+The engine intentionally differs on two calendar bugs of the baseline, and
+only there:
+  - the current week is filtered with the calendar year instead of the ISO
+    year, so Dec 29-31 / Jan 1-3 days whose ISO week belongs to the other
+    year find no week bars;
+  - the previous week is found with last_date - 7 days on a tz-aware index,
+    which lands on the wrong day (and ISO week) when a DST change falls in
+    between, and again uses the calendar year.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.calendar_index import get_calendar
+from src.data.providers import FixtureProvider
+from src.engine.alpha_constants import (
+    W2_MONTHLY, WEEKLY_SEASONAL, WEEKLY_ALPHA_MATRIX, WEEKLY_SEASONAL_D3,
+    WEEKLY_BIAS_TRIGGERS, MONTHLY_BIAS, SIGMA_UPPER, SIGMA_LOWER,
+    DAILY_ALPHA_TRIGGERS, DAY_NAMES,
+)
+from src.engine.signal_engine import SignalEngine, layers_from_arrays, get_grade
+from src.signals.base import ohlc_arrays
+
+ASSET_TICKERS = {'NQ': 'NQ=F', 'ES': 'ES=F', 'YM': 'YM=F', 'GC': 'GC=F'}
+AS_OF = '2026-01-05T11:00'
+WINDOW = 60
+N_WINDOWS = 520
+
+# Monday (no fractal), Tuesday after 23:00 UTC (D2) and Thursday (D3)
+CLOCKS = [
+    datetime(2026, 1, 5, 15, tzinfo=timezone.utc),
+    datetime(2026, 1, 6, 23, 30, tzinfo=timezone.utc),
+    datetime(2026, 1, 8, 15, tzinfo=timezone.utc),
+]
+
+
+def _baseline_calc_layers(asset, df, now_utc):
+    last_date = df.index[-1]
+    day = last_date.day
+    month = last_date.month
+    year = last_date.year
+    cal = get_calendar(df, asset)
+
+    # 0. Monthly Bias (Seasonal)
+    month_df = df[((cal['month'] == month) & (cal['year'] == year)).to_numpy()]
+    m_signals = []
+    m_bias = None
+
+    hit_rate = MONTHLY_BIAS.get(asset, {}).get(month, None)
+    if hit_rate is not None and hit_rate != 50.0:
+        is_bullish = hit_rate > 50
+        direction_prob = round(hit_rate, 1) if is_bullish else round(100 - hit_rate, 1)
+        m_bias = "ALCISTA" if is_bullish else "BAJISTA"
+        m_signals.append({
+            'target': 'SESGO ALCISTA' if is_bullish else 'SESGO BAJISTA',
+            'prob': direction_prob,
+            'status': 'ACTIVO',
+            'grade': get_grade(direction_prob),
+            'color': 'green' if is_bullish else 'red'
+        })
+
+    # 1. Monthly W2
+    if day >= 13:
+        w1w2 = month_df[month_df.index.day <= 13]
+        if not w1w2.empty:
+            hi, lo = float(w1w2['High'].max()), float(w1w2['Low'].min())
+            w2c = float(w1w2['Close'].iloc[-1])
+            pos = (w2c - lo) / (hi - lo) if (hi - lo) != 0 else 0.5
+            is_bear = pos < 0.5
+            m_bias = "BAJISTA" if is_bear else "ALCISTA"
+
+            curr_lo, curr_hi = float(month_df['Low'].min()), float(month_df['High'].max())
+            probs = W2_MONTHLY.get(asset, {}).get(month, None)
+            if probs:
+                p_set = probs.get('bear') if is_bear else probs.get('bull')
+                if p_set and is_bear:
+                    m_signals.append({'target': 'CIERRE BAJISTA', 'prob': p_set['prob_red'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_red']), 'color': 'red'})
+                    s = 'COMPLETADO' if curr_lo < (lo * 0.9995) else 'PENDIENTE'
+                    m_signals.append({'target': 'NUEVO BAJO', 'prob': p_set['prob_low'], 'status': s, 'grade': get_grade(p_set['prob_low']), 'color': 'red' if s=='PENDIENTE' else 'green'})
+                elif p_set and not is_bear:
+                    m_signals.append({'target': 'CIERRE ALCISTA', 'prob': p_set['prob_green'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_green']), 'color': 'green'})
+                    s = 'COMPLETADO' if curr_hi > (hi * 1.0005) else 'PENDIENTE'
+                    m_signals.append({'target': 'NUEVO ALTO', 'prob': p_set['prob_high'], 'status': s, 'grade': get_grade(p_set['prob_high']), 'color': 'green'})
+
+    # 2. Weekly (D2 / D3 Fractal)
+    current_week = last_date.isocalendar()[1]
+    week_df = df[((cal['iso_week'] == current_week) & (cal['iso_year'] == year)).to_numpy()]
+    w_signals = []
+    w_bias = None
+
+    if len(week_df) >= 2 and week_df.iloc[0].name.weekday() == 0 and week_df.iloc[1].name.weekday() == 1:
+        show_d2, show_d3 = False, False
+        if now_utc.weekday() > 2:
+            show_d3 = True
+        elif now_utc.weekday() == 2:
+            if now_utc.hour > 21 or (now_utc.hour == 21 and now_utc.minute >= 30):
+                show_d3 = True
+            else:
+                show_d2 = True
+        elif now_utc.weekday() == 1:
+            if now_utc.hour >= 23:
+                show_d2 = True
+
+        if show_d2 or show_d3:
+            if show_d3 and len(week_df) >= 3:
+                prefix_target = ""
+                dataset = WEEKLY_SEASONAL_D3.get(asset, {}).get(month, None)
+                d_end = 3
+            else:
+                prefix_target = ""
+                dataset = WEEKLY_SEASONAL.get(asset, {}).get(month, None)
+                d_end = 2
+
+            base_df = week_df.iloc[:d_end]
+            hi = float(base_df['High'].max())
+            lo = float(base_df['Low'].min())
+            close_val = float(base_df.iloc[-1]['Close'])
+
+            pos = (close_val - lo) / (hi - lo) if (hi - lo) != 0 else 0.5
+            is_bull = pos > 0.5
+            w_bias = "ALCISTA" if is_bull else "BAJISTA"
+
+            if pos > 0.75:
+                tier_key = 'bull_75'
+                target_close = prefix_target + 'CIERRE ALCISTA → ALTA CONVICCIÓN'
+            elif pos > 0.50:
+                tier_key = 'bull_50'
+                target_close = prefix_target + 'CIERRE ALCISTA'
+            elif pos < 0.25:
+                tier_key = 'bear_25'
+                target_close = prefix_target + 'CIERRE BAJISTA → ALTA CONVICCIÓN'
+            else:
+                tier_key = 'bear_50'
+                target_close = prefix_target + 'CIERRE BAJISTA'
+
+            curr_lo, curr_hi = float(week_df['Low'].min()), float(week_df['High'].max())
+
+            if dataset:
+                p_set = dataset.get(tier_key)
+                if p_set:
+                    if is_bull:
+                        w_signals.append({'target': target_close, 'prob': p_set['prob_green'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_green']), 'color': 'green'})
+                        s = 'COMPLETADO' if curr_hi > (hi * 1.0005) else 'PENDIENTE'
+                        w_signals.append({'target': 'NUEVO ALTO', 'prob': p_set['prob_high'], 'status': s, 'grade': get_grade(p_set['prob_high']), 'color': 'green' if s=='PENDIENTE' else 'green'})
+                    else:
+                        w_signals.append({'target': target_close, 'prob': p_set['prob_red'], 'status': 'ACTIVO', 'grade': get_grade(p_set['prob_red']), 'color': 'red'})
+                        s = 'COMPLETADO' if curr_lo < (lo * 0.9995) else 'PENDIENTE'
+                        w_signals.append({'target': 'NUEVO BAJO', 'prob': p_set['prob_low'], 'status': s, 'grade': get_grade(p_set['prob_low']), 'color': 'red' if s=='PENDIENTE' else 'green'})
+
+    # 3. Weekly Alpha Matrix (Mean Reversion)
+    previous_week = (last_date - pd.Timedelta(days=7)).isocalendar()[1]
+    prev_week_df = df[((cal['iso_week'] == previous_week) & (cal['iso_year'] == (last_date - pd.Timedelta(days=7)).year)).to_numpy()]
+
+    alpha_signals = []
+    if not prev_week_df.empty:
+        pw_open = float(prev_week_df['Open'].iloc[0])
+        pw_close = float(prev_week_df['Close'].iloc[-1])
+        pw_ret = (pw_close - pw_open) / pw_open
+
+        a_matrix = WEEKLY_ALPHA_MATRIX.get(asset)
+        if a_matrix and pw_ret <= a_matrix['mean_reversion']['threshold']:
+            r = a_matrix['mean_reversion']
+            alpha_signals.append({'target': r['target'], 'prob': r['prob'], 'status': 'ACTIVO', 'grade': r['grade'], 'color': 'green'})
+
+    # 3b. Weekly Bias & Inertia
+    s_upper = SIGMA_UPPER.get(asset, 0.013)
+    s_lower = SIGMA_LOWER.get(asset, -0.013)
+    bias_candidates = []
+
+    for idx in range(len(week_df)):
+        bar = week_df.iloc[idx]
+        bar_o, bar_c = float(bar['Open']), float(bar['Close'])
+        bar_o2c = (bar_c - bar_o) / bar_o if bar_o != 0 else 0
+        bar_weekday = bar.name.weekday()
+        bar_day_name = DAY_NAMES[bar_weekday] if bar_weekday < 7 else '?'
+
+        if bar_o2c > s_upper:
+            trigger = WEEKLY_BIAS_TRIGGERS.get((asset, bar_weekday, 'drive'))
+            if trigger:
+                bias_candidates.append({**trigger, 'day_name': bar_day_name, 'o2c': bar_o2c})
+        elif bar_o2c < s_lower:
+            trigger = WEEKLY_BIAS_TRIGGERS.get((asset, bar_weekday, 'panic'))
+            if trigger:
+                bias_candidates.append({**trigger, 'day_name': bar_day_name, 'o2c': bar_o2c})
+
+    bias_signals = []
+    if bias_candidates:
+        best = max(bias_candidates, key=lambda x: x['prob'])
+        is_bull = best['direction'] == 'BULL'
+        bias_signals.append({
+            'target': f'SESGO {"ALCISTA" if is_bull else "BAJISTA"}',
+            'prob': best['prob'],
+            'status': 'ACTIVO',
+            'grade': best['grade'],
+            'color': 'green' if is_bull else 'red',
+            'val': f'{best["day_name"]} {best["o2c"]*100:+.2f}% → AVG {best["avg_ret"]} Sem.'
+        })
+        if w_bias is None:
+            w_bias = "ALCISTA" if is_bull else "BAJISTA"
+
+    # 4. Daily Layer — D+1 Alpha
+    d_signals = []
+    if len(df) >= 2:
+        prev_bar = df.iloc[-2]
+        prev_o = float(prev_bar['Open'])
+        prev_c = float(prev_bar['Close'])
+        prev_o2c = (prev_c - prev_o) / prev_o if prev_o != 0 else 0
+        prev_weekday = prev_bar.name.weekday()
+        prev_day_name = DAY_NAMES[prev_weekday] if prev_weekday < 7 else '?'
+
+        s_upper_d = SIGMA_UPPER.get(asset, 0.013)
+        s_lower_d = SIGMA_LOWER.get(asset, -0.013)
+
+        if prev_o2c > s_upper_d:
+            d1_trigger = DAILY_ALPHA_TRIGGERS.get((asset, prev_weekday, 'drive'))
+            if d1_trigger:
+                d_signals.append({
+                    'target': d1_trigger['signal'],
+                    'prob': d1_trigger['prob'],
+                    'status': 'ACTIVO',
+                    'grade': d1_trigger['grade'],
+                    'color': 'red' if 'REVERSION' in d1_trigger['signal'] else 'green',
+                    'val': f'{prev_day_name} {prev_o2c*100:+.2f}% (DRIVE) → AVG D+1 {d1_trigger["avg_ret_d1"]}'
+                })
+        elif prev_o2c < s_lower_d:
+            d1_trigger = DAILY_ALPHA_TRIGGERS.get((asset, prev_weekday, 'panic'))
+            if d1_trigger:
+                d_signals.append({
+                    'target': d1_trigger['signal'],
+                    'prob': d1_trigger['prob'],
+                    'status': 'ACTIVO',
+                    'grade': d1_trigger['grade'],
+                    'color': 'green' if 'REBOUND' in d1_trigger['signal'] else 'red',
+                    'val': f'{prev_day_name} {prev_o2c*100:+.2f}% (PANIC) → AVG D+1 {d1_trigger["avg_ret_d1"]}'
+                })
+
+    return {
+        'monthly': {'bias': m_bias, 'signals': m_signals},
+        'weekly': {'bias': w_bias, 'signals': w_signals + alpha_signals + bias_signals},
+        'daily': {'signals': d_signals}
+    }
+
+
+def _known_divergence(last_date: pd.Timestamp) -> bool:
+    """True on the ISO-week / DST dates where the baseline looks up the wrong week."""
+    prev = (last_date.date() - timedelta(days=7)).isocalendar()
+    shifted = last_date - pd.Timedelta(days=7)
+    return (last_date.isocalendar()[0] != last_date.year
+            or tuple(shifted.isocalendar()[:2]) != (prev[0], prev[1])
+            or shifted.year != prev[0])
+
+
+@pytest.fixture(scope='module')
+def histories():
+    provider = FixtureProvider(as_of=AS_OF)
+    frames = {asset: provider.history(ticker, period='3y') for asset, ticker in ASSET_TICKERS.items()}
+    for asset, df in frames.items():
+        df.attrs['asset_key'] = asset
+    return frames
+
+
+@pytest.mark.parametrize('asset', list(ASSET_TICKERS))
+def test_kernel_matches_baseline(histories, asset):
+    df = histories[asset]
+    px = ohlc_arrays(df)
+    compared, diverged = 0, []
+
+    for end in range(len(df) - N_WINDOWS, len(df) + 1):
+        window = df.iloc[end - WINDOW:end]
+        last_date = window.index[-1]
+        for clock in CLOCKS:
+            expected = _baseline_calc_layers(asset, window, clock.replace(tzinfo=None))
+            got = layers_from_arrays(asset, window.index, px['open'][end - WINDOW:end], px['high'][end - WINDOW:end],
+                                     px['low'][end - WINDOW:end], px['close'][end - WINDOW:end], now_utc=clock)
+            if _known_divergence(last_date):
+                diverged.append(got != expected)
+                continue
+            compared += 1
+            assert got == expected, f"{asset} {last_date.date()} @ {clock}: {got} != {expected}"
+
+    assert compared > 0.9 * N_WINDOWS * len(CLOCKS)
+    # The exclusions must be exercised, otherwise they are hiding nothing
+    assert diverged
+
+
+def test_engine_sync_matches_baseline(histories):
+    engine = SignalEngine()
+    df = histories['NQ']
+    clock = CLOCKS[-1]
+    for end in range(len(df) - 120, len(df) + 1):
+        window = df.iloc[end - WINDOW:end]
+        if _known_divergence(window.index[-1]):
+            continue
+        engine.sync('NQ', window)
+        assert engine.layers('NQ', clock) == _baseline_calc_layers('NQ', window, clock.replace(tzinfo=None))